@@ -1,5 +1,37 @@
-from django.contrib import admin
-from apps.events.models import Event, EventRegistration
+from django.contrib import admin, messages
+from apps.events.deletion import delete_events
+from apps.events.models import CreatorStats, Event, EventRegistration, EventStats
+
+
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    """Event admin whose deletions go through the chunked bulk path."""
+
+    actions = ["bulk_delete"]
+
+    @admin.action(
+        description="Delete selected events and registrations in chunks",
+        permissions=["delete"],
+    )
+    def bulk_delete(self, request, queryset) -> None:
+        """Delete events without collecting their registrations for review."""
+        result = delete_events(queryset)
+        self.message_user(
+            request,
+            f"Deleted {result.events} events and "
+            f"{result.registrations} registrations.",
+            messages.SUCCESS,
+        )
+
+    def delete_model(self, request, obj: Event) -> None:
+        """Delete one event through the chunked bulk path."""
+        delete_events(Event.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset) -> None:
+        """Delete events through the chunked bulk path."""
+        delete_events(queryset)
+
 
-admin.site.register(Event)
 admin.site.register(EventRegistration)
+admin.site.register(EventStats)
+admin.site.register(CreatorStats)
@@ -0,0 +1,184 @@
+import hashlib
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+# Seconds a cached payload is kept; stale entries are never served because
+# every key embeds the current version tokens
+CACHE_TIMEOUT: int = getattr(settings, "EVENTS_CACHE_TIMEOUT", 300)
+KEY_PREFIX = "events"
+COLLECTION_VERSION_KEY = f"{KEY_PREFIX}:version:collection"
+
+
+def event_version_key(event_id: Any) -> str:
+    """Return the cache key holding the version token of one event."""
+    return f"{KEY_PREFIX}:version:event:{event_id}"
+
+
+def _new_token() -> str:
+    """Return a fresh, unique version token."""
+    return uuid.uuid4().hex
+
+
+class CacheMetrics:
+    """Thread-safe per-process hit and miss counters per cached endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0}
+        )
+
+    def record(self, name: str, hit: bool) -> None:
+        """
+        Count one cache lookup.
+        Args:
+            name: Name of the cached endpoint.
+            hit: True if the payload was served from the cache.
+        """
+        with self._lock:
+            self._counts[name]["hits" if hit else "misses"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return a copy of the counters.
+        Returns:
+            Dict[str, Dict[str, int]]: Hits and misses keyed by endpoint name.
+        """
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counts.clear()
+
+
+metrics = CacheMetrics()
+
+
+def get_versions(keys: List[str]) -> List[str]:
+    """
+    Return the version tokens stored under keys, creating missing ones.
+    Args:
+        keys: Version keys to read.
+    Returns:
+        List[str]: Tokens in the order of keys.
+    """
+    versions = cache.get_many(keys)
+    missing = {key: _new_token() for key in keys if key not in versions}
+    for key, token in missing.items():
+        # add() keeps a token written concurrently by another process
+        if not cache.add(key, token, timeout=None):
+            token = cache.get(key) or token
+        versions[key] = token
+    return [versions[key] for key in keys]
+
+
+def invalidate_events(event_ids: Iterable[Any] = ()) -> None:
+    """
+    Bump the versions of some events and of the event collection.
+    Versions are bumped right away and again when the current transaction
+    commits, so a payload cached from data read in between is never reused.
+    Args:
+        event_ids: Primary keys of changed events, empty for collection only.
+    """
+    keys = [event_version_key(event_id) for event_id in event_ids]
+    keys.append(COLLECTION_VERSION_KEY)
+
+    def bump() -> None:
+        cache.set_many({key: _new_token() for key in keys}, timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def cached_payload(
+    name: str, version_keys: List[str], variant: str, build: Callable[[], Any]
+) -> Any:
+    """
+    Return a payload from the cache or build and store it.
+    Args:
+        name: Endpoint name, used in the key and the metrics.
+        version_keys: Version keys the payload depends on.
+        variant: Anything else the payload depends on, such as the URL.
+        build: Callable producing the payload; None results are not cached.
+    Returns:
+        Any: Cached or freshly built payload.
+    """
+    versions = get_versions(version_keys)
+    # Payloads that depend on the date (status, upcoming filters) expire daily
+    digest = hashlib.md5(
+        "|".join([*versions, timezone.now().date().isoformat(), variant]).encode()
+    ).hexdigest()
+    key = f"{KEY_PREFIX}:payload:{name}:{digest}"
+
+    payload = cache.get(key)
+    if payload is not None:
+        metrics.record(name, hit=True)
+        return payload
+
+    metrics.record(name, hit=False)
+    payload = build()
+    if payload is not None:
+        cache.set(key, payload, timeout=CACHE_TIMEOUT)
+    return payload
+
+
+def apply_registration_state(items: List[Dict[str, Any]], user) -> None:
+    """
+    Fill per-user registration flags into shared event payloads.
+    Uses the same rules as EventQuerySet.with_registration_state, with one
+    query for the user's active registrations among the listed events.
+    Args:
+        items: Serialized events with 'id', 'status' and 'date' keys.
+        user: The user viewing the events.
+    """
+    from .models import EventRegistration
+
+    registered: Dict[int, str] = {}
+    if user.is_authenticated and items:
+        registered = dict(
+            EventRegistration.objects.filter(
+                user=user,
+                status__in=EventRegistration.ACTIVE_STATUSES,
+                event_id__in=[item["id"] for item in items],
+            ).values_list("event_id", "status")
+        )
+
+    can_register_any = user.is_authenticated and user.can_register_for_events()
+    today = timezone.now().date().isoformat()
+    for item in items:
+        is_registered = item["id"] in registered
+        item["is_registered"] = is_registered
+        item["is_waitlisted"] = registered.get(item["id"]) == "waitlisted"
+        item["can_register"] = (
+            can_register_any
+            and item["status"] == "published"
+            and item["date"] >= today
+            and not is_registered
+        )
+
+
+def get_cached_event(event_id: int) -> Optional[Any]:
+    """
+    Return an event instance from the cache or the database.
+    Args:
+        event_id: Primary key of the event.
+    Returns:
+        Optional[Event]: The event, or None if it does not exist.
+    """
+    from .models import Event
+
+    return cached_payload(
+        "event_details",
+        [event_version_key(event_id)],
+        str(event_id),
+        lambda: Event.objects.with_effective_status().filter(pk=event_id).first(),
+    )
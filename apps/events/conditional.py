@@ -0,0 +1,196 @@
+import hashlib
+from calendar import timegm
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_versions
+from .pagination import InvalidCursor, get_keyset_ordering, paginate_keyset
+
+
+@dataclass
+class Validators:
+    """Strong ETag and Last-Modified timestamp of one representation."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @property
+    def timestamp(self) -> Optional[int]:
+        """Return Last-Modified as seconds since the epoch."""
+        if self.last_modified is None:
+            return None
+        return timegm(self.last_modified.utctimetuple())
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        """
+        Set the ETag and Last-Modified headers on a response.
+        Args:
+            response: Response to annotate.
+        Returns:
+            HttpResponseBase: The same response.
+        """
+        response["ETag"] = self.etag
+        if self.timestamp is not None:
+            response["Last-Modified"] = http_date(self.timestamp)
+        return response
+
+
+def _latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """Return the most recent of some optional timestamps."""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def probe(queryset: QuerySet, related: Optional[str] = None) -> dict:
+    """
+    Read MAX(updated_at) and COUNT(*) of a queryset in one aggregate query.
+    Args:
+        queryset: Rows the representation is built from.
+        related: Optional relation whose updated_at is also part of the rows.
+    Returns:
+        dict: 'last', 'count' and, with related, 'related_last'.
+    """
+    aggregates: dict[str, Any] = {"last": Max("updated_at"), "count": Count("pk")}
+    if related:
+        aggregates["related_last"] = Max(f"{related}__updated_at")
+    return queryset.order_by().aggregate(**aggregates)
+
+
+def probe_page(
+    queryset: QuerySet,
+    cursor: Optional[str],
+    page_size: int,
+    related: Optional[str] = None,
+) -> dict:
+    """
+    Read the keys and MAX(updated_at) of one keyset page of a queryset.
+    The page is located like paginate_keyset does, reading only the key,
+    ordering and updated_at columns, so a conditional list request costs one
+    bounded index range scan instead of an aggregate over every filtered row.
+    Changes that leave updated_at untouched are covered by version tokens.
+    Args:
+        queryset: Ordered rows the list is built from.
+        cursor: Cursor of the requested page, None for the first page.
+        page_size: Rows per page.
+        related: Optional relation whose updated_at is also part of the rows.
+    Returns:
+        dict: 'keys', 'next', 'last' and, with related, 'related_last';
+        empty if the cursor is invalid.
+    """
+    ordering = get_keyset_ordering(queryset)
+    columns = {"updated_at", *(name.lstrip("-") for name in ordering)}
+    if related:
+        columns.add(f"{related}__updated_at")
+    try:
+        page = paginate_keyset(queryset.values(*sorted(columns)), cursor, page_size)
+    except InvalidCursor:
+        return {}
+    stats: dict[str, Any] = {
+        "keys": [row["id"] for row in page.items],
+        "next": page.has_next,
+        "last": _latest(*(row["updated_at"] for row in page.items)),
+    }
+    if related:
+        stats["related_last"] = _latest(
+            *(row[f"{related}__updated_at"] for row in page.items)
+        )
+    return stats
+
+
+def user_registration_probe(user) -> dict:
+    """
+    Probe the registrations of a visitor, which drive their per-user flags.
+    Args:
+        user: The requesting user.
+    Returns:
+        dict: 'last' and 'count' of the user's registrations, empty otherwise.
+    """
+    from .models import EventRegistration
+
+    if not user.is_authenticated or not user.can_register_for_events():
+        return {}
+    return probe(EventRegistration.objects.filter(user=user))
+
+
+def build_validators(
+    request: HttpRequest,
+    stats: dict,
+    *parts: Any,
+    version_keys: Optional[list] = None,
+) -> Validators:
+    """
+    Combine probe results into validators of the response to request.
+    The ETag covers the URL, the viewing user, today's date, the probes and
+    the cache version tokens, which also move on counter updates that leave
+    updated_at untouched.
+    Args:
+        request: The request being answered.
+        stats: Result of probe for the rows of the response.
+        *parts: Anything else the representation depends on.
+        version_keys: Cache version keys of the represented events.
+    Returns:
+        Validators: Strong ETag and Last-Modified.
+    """
+    versions = get_versions(version_keys) if version_keys else []
+    payload = "|".join(
+        str(part)
+        for part in (
+            request.get_full_path(),
+            getattr(request.user, "pk", None),
+            timezone.now().date().isoformat(),
+            sorted(stats.items()),
+            *versions,
+            *parts,
+        )
+    )
+    return Validators(
+        etag=quote_etag(hashlib.md5(payload.encode()).hexdigest()),
+        last_modified=_latest(stats.get("last"), stats.get("related_last")),
+    )
+
+
+def precondition_response(
+    request: HttpRequest, validators: Validators
+) -> Optional[HttpResponseBase]:
+    """
+    Evaluate conditional request headers against validators.
+    Args:
+        request: The request being answered.
+        validators: Validators of the current representation.
+    Returns:
+        Optional[HttpResponseBase]: 304 or 412 response, None to proceed.
+    """
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=validators.timestamp
+    )
+    if response is None:
+        return None
+    return validators.apply(response)
+
+
+def conditional_response(
+    request: HttpRequest, validators: Validators, respond
+) -> HttpResponseBase:
+    """
+    Answer a conditional request without building the body when possible.
+    Args:
+        request: The request being answered.
+        validators: Validators of the current representation.
+        respond: Callable building the full response.
+    Returns:
+        HttpResponseBase: 304/412 response, or the full response with validators.
+    """
+    not_modified = precondition_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+    response = respond()
+    if 200 <= response.status_code < 300:
+        validators.apply(response)
+    return response
@@ -0,0 +1,241 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, F, Model, QuerySet
+
+from apps.users.models import CustomUser
+from .cache import invalidate_events
+from .models import Event, EventRegistration, EventStats
+from .search import remove_from_search_index
+from .stats import record_registration_changes, remove_events
+
+# Registrations deleted per DELETE statement and transaction
+DELETE_BATCH_SIZE = 5000
+# Events or users deleted per transaction, once their registrations are gone
+OWNER_BATCH_SIZE = 500
+
+
+@dataclass
+class DeletionResult:
+    """Numbers of rows removed by a bulk deletion."""
+
+    users: int = 0
+    events: int = 0
+    registrations: int = 0
+
+
+def _noop(message: str) -> None:
+    """Discard progress messages."""
+
+
+def _id_chunks(queryset: QuerySet, size: int):
+    """Yield lists of primary keys of queryset, re-querying after each chunk."""
+    last_id = 0
+    while True:
+        ids = list(
+            queryset.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:size]
+        )
+        if not ids:
+            return
+        yield ids
+        if len(ids) < size:
+            return
+        last_id = ids[-1]
+
+
+def delete_registrations(
+    queryset: QuerySet,
+    batch_size: int = DELETE_BATCH_SIZE,
+    send_signals: bool = False,
+    promote: bool = False,
+    counters: bool = True,
+    log: Callable[[str], None] = _noop,
+) -> int:
+    """
+    Delete registrations in primary key ranges, one transaction per chunk.
+    Each chunk is a single DELETE bounded by the highest id of the chunk,
+    so no ids are loaded into Python. Registration counters and the stats
+    rollups are updated in the same transaction, keeping them correct if
+    the deletion stops half way.
+    Args:
+        queryset: Registrations to delete.
+        batch_size: Registrations deleted per statement.
+        send_signals: Delete through the collector, sending pre/post_delete.
+        promote: Fill seats freed in events that stay with their waitlists.
+        counters: Update Event.registration_count; pointless for events
+            deleted next.
+        log: Progress output.
+    Returns:
+        int: Number of deleted registrations.
+    """
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            bound = (
+                queryset.order_by("pk")
+                .values_list("pk", flat=True)[batch_size - 1 : batch_size]
+                .first()
+            )
+            chunk = queryset if bound is None else queryset.filter(pk__lte=bound)
+            counts = (
+                chunk.order_by()
+                .values("event_id", "event__created_by_id", "status")
+                .annotate(rows=Count("pk"))
+            )
+            released: Dict[tuple, Dict[str, int]] = defaultdict(dict)
+            for row in counts:
+                key = (row["event_id"], row["event__created_by_id"])
+                released[key][row["status"]] = -row["rows"]
+            if not released:
+                return deleted
+
+            if send_signals:
+                chunk.delete()
+            else:
+                chunk._raw_delete(chunk.db)  # type: ignore[attr-defined]
+
+            for (event_id, creator_id), deltas in released.items():
+                record_registration_changes(event_id, creator_id, deltas)
+                if counters and deltas.get("registered"):
+                    Event.objects.filter(pk=event_id).update(
+                        registration_count=F("registration_count")
+                        + deltas["registered"]
+                    )
+            event_ids = [event_id for event_id, _ in released]
+            if promote:
+                for event in Event.objects.filter(
+                    pk__in=event_ids, capacity__isnull=False
+                ):
+                    event.promote_waitlist()
+
+        invalidate_events(event_ids)
+        deleted += sum(-n for deltas in released.values() for n in deltas.values())
+        log(f"Deleted {deleted} registrations")
+        if bound is None:
+            return deleted
+
+
+def delete_events(
+    queryset: QuerySet,
+    batch_size: int = DELETE_BATCH_SIZE,
+    send_signals: bool = False,
+    log: Callable[[str], None] = _noop,
+) -> DeletionResult:
+    """
+    Delete events with all of their registrations in bounded transactions.
+    Registrations go first in chunked DELETEs; then each chunk of events is
+    removed from the stats rollups and the search index and deleted with
+    its stats row. Memory stays flat however many registrations there are.
+    Args:
+        queryset: Events to delete.
+        batch_size: Registrations deleted per statement.
+        send_signals: Delete through the collector, sending pre/post_delete.
+        log: Progress output.
+    Returns:
+        DeletionResult: Numbers of deleted events and registrations.
+    """
+    result = DeletionResult()
+    for event_ids in _id_chunks(queryset, OWNER_BATCH_SIZE):
+        result.registrations += delete_registrations(
+            EventRegistration.objects.filter(event_id__in=event_ids),
+            batch_size,
+            send_signals,
+            counters=False,
+            log=log,
+        )
+        with transaction.atomic():
+            events = Event.objects.filter(pk__in=event_ids)
+            if send_signals:
+                # EventQuerySet.delete also updates the rollups and the index
+                result.events += events.delete()[1].get(Event._meta.label, 0)
+            else:
+                remove_events(events)
+                # Registrations made since their chunk was deleted
+                registrations = EventRegistration.objects.filter(event_id__in=event_ids)
+                registrations._raw_delete(events.db)  # type: ignore[attr-defined]
+                stats = EventStats.objects.filter(event_id__in=event_ids)
+                stats._raw_delete(events.db)  # type: ignore[attr-defined]
+                result.events += events._raw_delete(events.db)
+                remove_from_search_index(*event_ids)
+        invalidate_events(event_ids)
+        log(f"Deleted {result.events} events")
+    return result
+
+
+def delete_users(
+    queryset: QuerySet,
+    batch_size: int = DELETE_BATCH_SIZE,
+    send_signals: bool = False,
+    log: Callable[[str], None] = _noop,
+) -> DeletionResult:
+    """
+    Delete users with their events and registrations in bounded transactions.
+    The large cascades, created events and registrations, are removed by
+    delete_events and delete_registrations first. Seats the users held are
+    handed to the waitlists of the events that stay. The users themselves
+    are then deleted through the collector, which only has small relations
+    such as the stats rollup row left to cascade to.
+    Args:
+        queryset: Users to delete.
+        batch_size: Registrations deleted per statement.
+        send_signals: Send pre/post_delete for events and registrations.
+        log: Progress output.
+    Returns:
+        DeletionResult: Numbers of deleted users, events and registrations.
+    """
+    result = DeletionResult()
+    for user_ids in _id_chunks(queryset, OWNER_BATCH_SIZE):
+        deleted = delete_events(
+            Event.objects.filter(created_by_id__in=user_ids),
+            batch_size,
+            send_signals,
+            log,
+        )
+        result.events += deleted.events
+        result.registrations += deleted.registrations
+        result.registrations += delete_registrations(
+            EventRegistration.objects.filter(user_id__in=user_ids),
+            batch_size,
+            send_signals,
+            promote=True,
+            log=log,
+        )
+        with transaction.atomic():
+            result.users += (
+                CustomUser.objects.filter(pk__in=user_ids)
+                .delete()[1]
+                .get(CustomUser._meta.label, 0)
+            )
+        log(f"Deleted {result.users} users")
+    return result
+
+
+def delete_in_bulk(
+    model: type[Model],
+    ids: Optional[List[int]] = None,
+    queryset: Optional[QuerySet] = None,
+    **kwargs,
+) -> DeletionResult:
+    """
+    Delete events or users by primary key or queryset through the bulk path.
+    Args:
+        model: Event or CustomUser.
+        ids: Primary keys to delete.
+        queryset: Rows to delete, instead of ids.
+        **kwargs: Passed to delete_events or delete_users.
+    Returns:
+        DeletionResult: Numbers of deleted rows.
+    Raises:
+        ValueError: If model is neither Event nor CustomUser.
+    """
+    if queryset is None:
+        queryset = model._default_manager.filter(pk__in=ids or [])
+    if model is Event:
+        return delete_events(queryset, **kwargs)
+    if model is CustomUser:
+        return delete_users(queryset, **kwargs)
+    raise ValueError(f"Bulk deletion is not supported for {model.__name__}.")
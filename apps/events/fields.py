@@ -0,0 +1,82 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models.expressions import Combinable
+from django.utils.functional import cached_property
+
+if TYPE_CHECKING:
+    # Set as a name or code, read as a name
+    _StatusFieldBase = models.PositiveSmallIntegerField[Union[str, int, Combinable], str]
+else:
+    _StatusFieldBase = models.PositiveSmallIntegerField
+
+
+class StatusField(_StatusFieldBase):
+    """
+    Status stored as a small integer code and handled as its name.
+    Python code, lookups, forms, serializers and templates keep using the
+    status names; only the column holds the 2-byte codes. Codes are part of
+    the schema: never renumber them, only add new ones.
+    """
+
+    def __init__(self, *args, codes: Optional[Dict[str, int]] = None, **kwargs) -> None:
+        self.codes: Dict[str, int] = dict(codes or {})
+        self.names: Dict[int, str] = {code: name for name, code in self.codes.items()}
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        """Include the codes in migrations."""
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["codes"] = self.codes
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        """Skip the integer range validators, values are names."""
+        return [*self.default_validators, *self._validators]
+
+    def get_prep_value(self, value: Any) -> Optional[int]:
+        """
+        Convert a status name to its code.
+        Args:
+            value: Status name, code or None.
+        Returns:
+            Optional[int]: Code stored in the column.
+        Raises:
+            ValueError: If value is not a known status.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return self.codes[value]
+            except KeyError:
+                raise ValueError(f"Unknown {self.name} {value!r}.") from None
+        return super().get_prep_value(value)
+
+    def from_db_value(
+        self, value: Optional[int], expression, connection
+    ) -> Optional[Union[str, int]]:
+        """Convert a stored code to its status name, unknown codes are kept."""
+        if value is None:
+            return None
+        name = self.names.get(value)
+        return value if name is None else name
+
+    def to_python(self, value: Any) -> Optional[str]:
+        """
+        Return the status name of a name or code.
+        Raises:
+            ValidationError: If value is not a known status.
+        """
+        if value is None or value in self.codes:
+            return value
+        try:
+            return self.names[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
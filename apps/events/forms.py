@@ -24,6 +24,8 @@ class EventForm(forms.ModelForm):
             "location",
             "date",
             "start_time",
+            "duration",
+            "capacity",
         )
 
         widgets: dict[str, forms.Widget] = {
@@ -38,6 +40,12 @@ class EventForm(forms.ModelForm):
             ),
             "date": forms.DateInput(attrs={"placeholder": "YYYY-MM-DD"}),
             "start_time": forms.TimeInput(attrs={"placeholder": "HH:MM"}),
+            "duration": forms.TextInput(
+                attrs={"placeholder": "HH:MM:SS, leave empty if open-ended"}
+            ),
+            "capacity": forms.NumberInput(
+                attrs={"placeholder": "Leave empty for unlimited seats", "min": 1}
+            ),
         }
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
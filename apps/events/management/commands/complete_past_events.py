@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.services import COMPLETE_BATCH_SIZE, complete_past_events
+
+
+class Command(BaseCommand):
+    """
+    Mark published events dated before today as completed.
+
+    Reads through Event.objects.with_status are right without it; run it
+    daily, e.g. from cron shortly after midnight, so the stored status,
+    the stats rollup and the cached payloads catch up in bulk.
+    """
+
+    help = "Move past published events to completed in chunked bulk updates"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=COMPLETE_BATCH_SIZE,
+            help=f"Events per UPDATE (default: {COMPLETE_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Complete past events chunk by chunk and report how many."""
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        total = complete_past_events(
+            batch_size=options["batch_size"],
+            progress=lambda done: self.stdout.write(f"Completed {done} events"),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Completed {total} past events."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.stats import rebuild_creator_stats
+
+
+class Command(BaseCommand):
+    """
+    Recompute the event and creator stats rollup tables.
+
+    Model saves and the registration service keep the rollups current; run
+    this after bulk writes that bypass them, such as queryset updates, raw
+    SQL imports or cascading user deletes.
+    """
+
+    help = "Recompute the per-event and per-creator stats rollups"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of events or users to recompute per batch (default: 1000)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Recompute every rollup row in primary key chunks."""
+        total = rebuild_creator_stats(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats of {total} creators."))
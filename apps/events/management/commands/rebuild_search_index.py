@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the full-text search index of all events.
+
+    Event.save keeps the index current; run this after bulk writes that
+    bypass it, such as queryset updates or raw SQL imports.
+    """
+
+    help = "Rebuild the full-text search index of all events"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of events to re-index per batch (default: 1000)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Re-index every event in primary key chunks."""
+        total = rebuild_search_index(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Re-indexed {total} events."))
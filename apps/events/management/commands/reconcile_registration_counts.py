@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.events.cache import invalidate_events
+from apps.events.models import Event, EventRegistration
+
+
+class Command(BaseCommand):
+    """
+    Recompute Event.registration_count from active registrations.
+
+    Events are processed in primary key chunks so large tables never
+    hold long locks or load every event into memory at once.
+    """
+
+    help = "Fix drift between Event.registration_count and active registrations"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of events to reconcile per batch (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted events without updating them",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Walk events by primary key and correct any drifted counters."""
+        chunk_size: int = options["chunk_size"]
+        dry_run: bool = options["dry_run"]
+
+        last_pk = 0
+        checked = 0
+        fixed = 0
+        while True:
+            stored = dict(
+                Event.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "registration_count")[:chunk_size]
+            )
+            if not stored:
+                break
+
+            actual = dict(
+                EventRegistration.objects.filter(
+                    event_id__in=stored.keys(), status="registered"
+                )
+                .order_by()
+                .values("event_id")
+                .annotate(total=Count("pk"))
+                .values_list("event_id", "total")
+            )
+            drifted = [
+                pk for pk, count in stored.items() if actual.get(pk, 0) != count
+            ]
+
+            if drifted and not dry_run:
+                # Recount inside the UPDATE so concurrent registrations are not lost
+                Event.objects.filter(pk__in=drifted).update(
+                    registration_count=Coalesce(
+                        Subquery(self._active_count(), output_field=IntegerField()),
+                        0,
+                    )
+                )
+                invalidate_events(drifted)
+
+            checked += len(stored)
+            fixed += len(drifted)
+            last_pk = max(stored)
+            self.stdout.write(f"Checked {checked} events, {fixed} drifted")
+
+        action = "Found" if dry_run else "Fixed"
+        self.stdout.write(
+            self.style.SUCCESS(f"{action} {fixed} drifted counters in {checked} events")
+        )
+
+    def _active_count(self):
+        """Return a correlated subquery counting an event's active registrations."""
+        return (
+            EventRegistration.objects.filter(event=OuterRef("pk"), status="registered")
+            .order_by()
+            .values("event")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
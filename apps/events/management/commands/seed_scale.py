@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.seeding import seed_scale
+
+
+class Command(BaseCommand):
+    """
+    Generate users, events and registrations in bulk for scale testing.
+
+    Events spread over past and future dates with realistic status mixes,
+    and registrations follow a power-law event popularity. The same seed
+    always generates the same data relative to today.
+    """
+
+    help = "Bulk generate a large, deterministic dataset for scale testing"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument("--creators", type=int, default=100, help="Default: 100")
+        parser.add_argument("--visitors", type=int, default=50000, help="Default: 50000")
+        parser.add_argument("--events", type=int, default=5000, help="Default: 5000")
+        parser.add_argument(
+            "--registrations", type=int, default=1000000, help="Default: 1000000"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+        parser.add_argument(
+            "--exponent",
+            type=float,
+            default=1.1,
+            help="Power-law exponent of event popularity, 0 for uniform (default: 1.1)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Rows per INSERT or COPY (default: 10000)",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="seed",
+            help="Prefix of generated usernames and emails (default: seed)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Generate the dataset and report the numbers of rows written."""
+        try:
+            result = seed_scale(
+                creators=options["creators"],
+                visitors=options["visitors"],
+                events=options["events"],
+                registrations=options["registrations"],
+                seed=options["seed"],
+                exponent=options["exponent"],
+                batch_size=options["batch_size"],
+                prefix=options["prefix"],
+                log=self.stdout.write,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {result.creators} creators, {result.visitors} visitors, "
+                f"{result.events} events and {result.registrations} registrations."
+            )
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-17 07:14
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_registration_count(apps, schema_editor):
+    """Populate the counter from existing active registrations."""
+    Event = apps.get_model("events", "Event")
+    EventRegistration = apps.get_model("events", "EventRegistration")
+    active = (
+        EventRegistration.objects.filter(event=OuterRef("pk"), status="registered")
+        .order_by()
+        .values("event")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Event.objects.update(
+        registration_count=Coalesce(
+            Subquery(active, output_field=IntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_alter_event_created_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='registration_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Denormalized number of active registrations'),
+        ),
+        migrations.RunPython(
+            backfill_registration_count, migrations.RunPython.noop
+        ),
+    ]
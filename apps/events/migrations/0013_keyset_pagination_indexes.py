@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-17 07:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0012_event_registration_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='events_even_date_5e8e1c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date', 'start_time', 'id'], name='events_even_date_6988a6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['user', '-registered_at', 'id'], name='events_even_user_id_becd9b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', '-registered_at', 'id'], name='events_even_event_i_c6baca_idx'),
+        ),
+    ]
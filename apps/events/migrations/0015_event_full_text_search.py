@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-17 07:36
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.events.search import FTS_TABLE, SEARCH_CONFIG, SEARCH_FIELDS
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor specific full-text index and fill it from events."""
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        vector = " || ".join(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({name}, '')), '{weight}')"
+            for name, weight in SEARCH_FIELDS
+        )
+        schema_editor.execute(f"UPDATE events_event SET search_vector = {vector}")
+        schema_editor.execute(
+            "CREATE INDEX events_event_search_vector_gin "
+            "ON events_event USING gin (search_vector)"
+        )
+    elif connection.vendor == "sqlite":
+        columns = ", ".join(name for name, _ in SEARCH_FIELDS)
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"{columns}, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+            f"SELECT id, {columns} FROM events_event"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the vendor specific full-text index."""
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS events_event_search_vector_gin")
+    elif connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0014_event_capacity_waitlist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
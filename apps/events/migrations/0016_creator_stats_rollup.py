@@ -0,0 +1,72 @@
+# Generated by Django 5.2.1 on 2026-10-17 07:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _count_if(column, status):
+    """Return an SQL expression counting rows with one status."""
+    return f"COALESCE(SUM(CASE WHEN {column} = '{status}' THEN 1 ELSE 0 END), 0)"
+
+
+def backfill_stats(apps, schema_editor):
+    """Fill both rollup tables from existing events and registrations."""
+    registrations = ", ".join(
+        _count_if("r.status", status) for status in ("registered", "waitlisted", "cancelled")
+    )
+    schema_editor.execute(
+        "INSERT INTO events_eventstats (event_id, active_registrations, "
+        "waitlisted_registrations, cancelled_registrations) "
+        f"SELECT e.id, {registrations} "
+        "FROM events_event e LEFT JOIN events_eventregistration r ON r.event_id = e.id "
+        "GROUP BY e.id"
+    )
+    events = ", ".join(
+        _count_if("e.status", status) for status in ("published", "completed", "cancelled")
+    )
+    schema_editor.execute(
+        "INSERT INTO events_creatorstats (creator_id, active_events, completed_events, "
+        "cancelled_events, active_registrations, waitlisted_registrations, "
+        "cancelled_registrations) "
+        f"SELECT e.created_by_id, {events}, SUM(s.active_registrations), "
+        "SUM(s.waitlisted_registrations), SUM(s.cancelled_registrations) "
+        "FROM events_event e JOIN events_eventstats s ON s.event_id = e.id "
+        "WHERE e.created_by_id IS NOT NULL GROUP BY e.created_by_id"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_event_full_text_search'),
+        ('users', '0010_outboxemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorStats',
+            fields=[
+                ('creator', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='event_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('active_events', models.IntegerField(default=0)),
+                ('completed_events', models.IntegerField(default=0)),
+                ('cancelled_events', models.IntegerField(default=0)),
+                ('active_registrations', models.IntegerField(default=0)),
+                ('waitlisted_registrations', models.IntegerField(default=0)),
+                ('cancelled_registrations', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'creator stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='EventStats',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='events.event')),
+                ('active_registrations', models.IntegerField(default=0)),
+                ('waitlisted_registrations', models.IntegerField(default=0)),
+                ('cancelled_registrations', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
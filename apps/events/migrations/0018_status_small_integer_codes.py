@@ -0,0 +1,134 @@
+# Generated by Django 5.2.1 on 2026-10-17 08:40
+
+import apps.events.fields
+from django.db import migrations, models
+from django.db.models import Case, Max, Min, Q, Value, When
+from django.utils import timezone
+
+# Rows converted per UPDATE and transaction
+BATCH_SIZE = 10000
+
+EVENT_CODES = {"published": 1, "completed": 2, "cancelled": 3}
+REGISTRATION_CODES = {"registered": 1, "waitlisted": 2, "cancelled": 3}
+
+
+def _copy(model, source, target, mapping):
+    """
+    Translate source into target in primary key ranges, one commit each.
+    Range chunks walk the primary key index, so every UPDATE touches at most
+    BATCH_SIZE rows and holds its locks only briefly. The old code keeps
+    writing source meanwhile: the final pass translates again every row
+    saved since the copy started, whether it was inserted after its range
+    or had its status changed after its range was copied.
+    """
+    started = timezone.now()
+    translated = Case(
+        *[When(**{source: key}, then=Value(value)) for key, value in mapping.items()]
+    )
+    bounds = model.objects.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is not None:
+        for start in range(bounds["low"], bounds["high"] + 1, BATCH_SIZE):
+            model.objects.filter(pk__gte=start, pk__lt=start + BATCH_SIZE).update(
+                **{target: translated}
+            )
+    model.objects.filter(
+        Q(**{f"{target}__isnull": True}) | Q(updated_at__gte=started)
+    ).update(**{target: translated})
+
+
+def encode(apps, schema_editor):
+    """Fill the code columns from the status names."""
+    _copy(apps.get_model("events", "Event"), "status", "status_code", EVENT_CODES)
+    _copy(
+        apps.get_model("events", "EventRegistration"),
+        "status",
+        "status_code",
+        REGISTRATION_CODES,
+    )
+
+
+def decode(apps, schema_editor):
+    """Fill the name columns back from the status codes."""
+    for model_name, codes in (
+        ("Event", EVENT_CODES),
+        ("EventRegistration", REGISTRATION_CODES),
+    ):
+        names = {code: name for name, code in codes.items()}
+        model = apps.get_model("events", model_name)
+        _copy(model, "status_code", "status", names)
+
+
+class Migration(migrations.Migration):
+
+    # Every chunk of the backfill commits on its own
+    atomic = False
+
+    dependencies = [
+        ('events', '0017_event_status_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='eventregistration',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.RunPython(encode, decode, elidable=True),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='events_even_status_d859e9_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='eventregistration',
+            name='events_even_user_id_642524_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='eventregistration',
+            name='events_even_event_i_cdd3f8_idx',
+        ),
+        migrations.RemoveField(
+            model_name='event',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='eventregistration',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='event',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='eventregistration',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='status',
+            field=apps.events.fields.StatusField(choices=[('published', 'Published'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], codes={'cancelled': 3, 'completed': 2, 'published': 1}, default='published'),
+        ),
+        migrations.AlterField(
+            model_name='eventregistration',
+            name='status',
+            field=apps.events.fields.StatusField(choices=[('registered', 'Registered'), ('waitlisted', 'Waitlisted'), ('cancelled', 'Cancelled')], codes={'cancelled': 3, 'registered': 1, 'waitlisted': 2}, default='registered'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['status', 'date'], name='events_even_status_d859e9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['user', 'status'], name='events_even_user_id_642524_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'status'], name='events_even_event_i_cdd3f8_idx'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.1 on 2026-10-17 08:45
+
+from datetime import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+# Events backfilled per SELECT, bulk UPDATE and commit
+BATCH_SIZE = 5000
+
+
+def backfill_starts_at(apps, schema_editor):
+    """
+    Fill starts_at from date and start_time in primary key ranges.
+    Same rule as Event.set_schedule: the wall clock time of the default time
+    zone. Ranges commit one by one while the old code can still move an
+    event, so before starts_at becomes NOT NULL the start of every event
+    inserted or rescheduled since the backfill began is computed again.
+    """
+    Event = apps.get_model("events", "Event")
+    started = timezone.now()
+
+    def fill(queryset):
+        events = list(queryset.only("pk", "date", "start_time"))
+        for event in events:
+            moment = datetime.combine(event.date, event.start_time)
+            event.starts_at = timezone.make_aware(moment) if settings.USE_TZ else moment
+        Event.objects.bulk_update(events, ["starts_at"])
+
+    bounds = Event.objects.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is not None:
+        for start in range(bounds["low"], bounds["high"] + 1, BATCH_SIZE):
+            fill(Event.objects.filter(pk__gte=start, pk__lt=start + BATCH_SIZE))
+    fill(Event.objects.filter(Q(starts_at__isnull=True) | Q(updated_at__gte=started)))
+
+
+class Migration(migrations.Migration):
+
+    # Every chunk of the backfill commits on its own
+    atomic = False
+
+    dependencies = [
+        ('events', '0018_status_small_integer_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='starts_at',
+            field=models.DateTimeField(null=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='duration',
+            field=models.DurationField(blank=True, help_text='Length of the event, empty if open-ended', null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='ends_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_starts_at, migrations.RunPython.noop, elidable=True),
+        migrations.AlterField(
+            model_name='event',
+            name='starts_at',
+            field=models.DateTimeField(blank=True, editable=False),
+        ),
+        migrations.AlterModelOptions(
+            name='event',
+            options={'ordering': ['starts_at']},
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='events_even_date_6988a6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='events_even_status_d859e9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['starts_at', 'id'], name='events_even_starts__91f224_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['status', 'starts_at'], name='events_even_status_5c3d55_idx'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.request import Request
+
+from .conditional import probe, probe_page
+from .pagination import KeysetPagination, get_keyset_ordering
+from .renderers import (
+    FastJSONRenderer,
+    StreamingContentNegotiation,
+    StreamingJSONRenderer,
+)
+from .serializers import values_serializer
+
+
+class ValuesListMixin:
+    """
+    Serve list endpoints from .values() rows with the fast JSON renderer.
+    Clients that send 'Accept: application/json; stream=true' receive the
+    whole list as one streamed JSON array instead of keyset pages.
+    """
+
+    # The streaming renderer goes first: it only matches an explicit opt-in
+    renderer_classes = [StreamingJSONRenderer, FastJSONRenderer, BrowsableAPIRenderer]
+    content_negotiation_class = StreamingContentNegotiation
+
+    # Provided by the GenericAPIView the mixin is combined with
+    request: Request
+    paginator: KeysetPagination
+
+    def values_response(self, queryset, serializer_class=None):
+        """
+        Return queryset serialized from .values() rows.
+        The output matches serializer_class byte for byte, but related
+        columns are joined into the query and rows skip the serializer fields.
+        Args:
+            queryset: Ordered queryset to list.
+            serializer_class: Serializer to reproduce (default: the view's).
+        Returns:
+            One keyset page, or a StreamingHttpResponse of every row.
+        """
+        serializer = values_serializer(serializer_class or self.get_serializer_class())
+        renderer = self.request.accepted_renderer
+        if isinstance(renderer, StreamingJSONRenderer):
+            return renderer.stream_response(queryset, serializer)
+
+        # Keyset cursors are built from the ordering columns of each row
+        ordering = [name.lstrip("-") for name in get_keyset_ordering(queryset)]
+        columns = list(dict.fromkeys([*serializer.lookups, *ordering]))
+        page = self.paginate_queryset(queryset.values(*columns))
+        return self.get_paginated_response(serializer.to_representation(page))
+
+    def list(self, request, *args, **kwargs):
+        """List objects from .values() rows."""
+        return self.values_response(self.filter_queryset(self.get_queryset()))
+
+    def list_probe(self, queryset, related=None) -> dict:
+        """
+        Probe the rows a list response to the current request is built from.
+        Streamed responses carry every row, paginated ones only one page.
+        Args:
+            queryset: Ordered queryset to list.
+            related: Optional relation whose updated_at is part of the rows.
+        Returns:
+            dict: Result of probe or probe_page.
+        """
+        if isinstance(self.request.accepted_renderer, StreamingJSONRenderer):
+            return probe(queryset, related)
+        return probe_page(
+            queryset,
+            self.request.query_params.get(self.paginator.cursor_query_param),
+            self.paginator.get_page_size(self.request),
+            related,
+        )
@@ -1,16 +1,229 @@
-from typing import Tuple
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Tuple
+from django.conf import settings
 from django.core.exceptions import ValidationError, PermissionDenied
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinLengthValidator
-from django.db import models
-from django.db.models import QuerySet
+from django.db import models, transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
 from django.utils import timezone
 
 # Assuming CustomUser is imported from apps.users.models
 # If not available, use AbstractUser as fallback
 from apps.users.models import CustomUser
+from .cache import invalidate_events
+from .fields import StatusField
+from .search import (
+    SEARCH_FIELDS,
+    add_to_search_index,
+    remove_from_search_index,
+    update_search_index,
+)
+from .stats import (
+    add_events,
+    record_event_changes,
+    record_registration_changes,
+    remove_events,
+    transition,
+)
+from .tracking import DirtyFieldsMixin
+
+
+def local_datetime(day: date, at: time) -> datetime:
+    """
+    Combine a date and a wall clock time of the default time zone.
+    Args:
+        day: Calendar date.
+        at: Time of day.
+    Returns:
+        datetime: Aware datetime when USE_TZ is on, naive otherwise.
+    """
+    moment = datetime.combine(day, at)
+    return timezone.make_aware(moment) if settings.USE_TZ else moment
+
+
+def start_of_today() -> datetime:
+    """
+    Return the first moment of today as a starts_at bound.
+    starts_at >= start_of_today() holds exactly for events dated today or
+    later, so date based rules keep their meaning on the starts_at index.
+    Returns:
+        datetime: Midnight of today.
+    """
+    return local_datetime(timezone.now().date(), time.min)
 
 
-class EventManager(models.Manager):
+class EventQuerySet(models.QuerySet):
+    """Chainable query methods for the Event model."""
+
+    def with_registration_state(self, user) -> "EventQuerySet":
+        """
+        Annotate events with the registration state of one user in a single query.
+        Adds 'is_registered' (user has an active registration, seated or
+        waitlisted), 'is_waitlisted' (that registration is on the waitlist)
+        and 'user_can_register' (same rules as Event.can_register) so lists can
+        render registration buttons without a query per event. Event.can_register
+        reuses 'is_registered' when called for the same user.
+        Args:
+            user: The user viewing the events, may be anonymous.
+        Returns:
+            EventQuerySet: Annotated events.
+        """
+        if not user.is_authenticated:
+            return self.annotate(
+                is_registered=Value(False, output_field=BooleanField()),
+                is_waitlisted=Value(False, output_field=BooleanField()),
+                user_can_register=Value(False, output_field=BooleanField()),
+            )
+
+        queryset = self.annotate(
+            registration_state_user_id=Value(user.pk),
+            is_registered=Exists(
+                EventRegistration.objects.filter(
+                    event=OuterRef("pk"),
+                    user=user,
+                    status__in=EventRegistration.ACTIVE_STATUSES,
+                )
+            ),
+            is_waitlisted=Exists(
+                EventRegistration.objects.filter(
+                    event=OuterRef("pk"), user=user, status="waitlisted"
+                )
+            ),
+        )
+        if not user.can_register_for_events():
+            return queryset.annotate(
+                user_can_register=Value(False, output_field=BooleanField())
+            )
+
+        return queryset.annotate(
+            user_can_register=Case(
+                When(
+                    Q(status="published", starts_at__gte=start_of_today())
+                    & Q(is_registered=False),
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def with_effective_status(self) -> "EventQuerySet":
+        """
+        Annotate events with the status their date implies as of today.
+        Published events dated before today read as 'completed' even before
+        the complete_past_events sweeper has written that to the row.
+        Returns:
+            EventQuerySet: Events with an 'effective_status' annotation.
+        """
+        status = self.model._meta.get_field("status")
+        return self.annotate(
+            effective_status=Case(
+                When(
+                    status="published",
+                    starts_at__lt=start_of_today(),
+                    then=Value("completed", output_field=status),
+                ),
+                default=F("status"),
+                output_field=status,
+            )
+        )
+
+    def with_status(self, status: str) -> "EventQuerySet":
+        """
+        Filter events by effective status, see with_effective_status.
+        The condition is spelled out on the stored columns rather than the
+        annotation, so it can use the (status, starts_at) index.
+        Args:
+            status: Effective status to keep.
+        Returns:
+            EventQuerySet: Events whose effective status is status.
+        """
+        if status not in self.model.STATUS_CODES:
+            return self.none()
+        today = start_of_today()
+        if status == "published":
+            return self.filter(status="published", starts_at__gte=today)
+        if status == "completed":
+            return self.filter(
+                Q(status="completed") | Q(status="published", starts_at__lt=today)
+            )
+        return self.filter(status=status)
+
+    def starting_from(self, moment: Optional[datetime] = None) -> "EventQuerySet":
+        """
+        Return events starting at or after moment, soonest first.
+        Sliced, e.g. Event.objects.published().starting_from()[:10], this is
+        one range scan of the (status, starts_at) or (starts_at, id) index.
+        Args:
+            moment: Lower bound of starts_at (default: now).
+        Returns:
+            EventQuerySet: Events ordered by start.
+        """
+        return self.filter(starts_at__gte=moment or timezone.now()).order_by(
+            "starts_at", "id"
+        )
+
+    def ongoing(self, moment: Optional[datetime] = None) -> "EventQuerySet":
+        """
+        Return events with a duration that are running at moment.
+        Args:
+            moment: Point in time (default: now).
+        Returns:
+            EventQuerySet: Events started at or before moment and not yet ended.
+        """
+        moment = moment or timezone.now()
+        return self.filter(starts_at__lte=moment, ends_at__gt=moment)
+
+    def on_date(self, day: date) -> "EventQuerySet":
+        """
+        Return events dated day, as a starts_at range.
+        Args:
+            day: Calendar date.
+        Returns:
+            EventQuerySet: Events starting on day.
+        """
+        return self.filter(
+            starts_at__gte=local_datetime(day, time.min),
+            starts_at__lt=local_datetime(day + timedelta(days=1), time.min),
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Insert events in bulk, count them in the stats rollup, index them
+        for search and invalidate cached event lists."""
+        objs = list(objs)
+        for event in objs:
+            event.set_schedule()
+        with transaction.atomic():
+            created = super().bulk_create(objs, *args, **kwargs)
+            add_events(created)
+            add_to_search_index([event.pk for event in created if event.pk is not None])
+        invalidate_events()
+        return created
+
+    def delete(self):
+        """Delete events in bulk, subtract them from the stats rollup and the
+        search index and invalidate their cached payloads."""
+        event_ids = list(self.values_list("pk", flat=True))
+        with transaction.atomic():
+            remove_events(self.model.objects.filter(pk__in=event_ids))
+            result = super().delete()
+            remove_from_search_index(*event_ids)
+        invalidate_events(event_ids)
+        return result
+
+
+class EventManager(models.Manager.from_queryset(EventQuerySet)):  # type: ignore[misc]
     """Custom manager for an Event model with type-safe query methods."""
 
     def past(self) -> QuerySet["Event"]:
@@ -19,15 +232,15 @@ class EventManager(models.Manager):
         Returns:
             QuerySet: Events with dates before today.
         """
-        return self.filter(date__lt=timezone.now().date())
+        return self.filter(starts_at__lt=start_of_today())
 
     def published(self) -> QuerySet["Event"]:
         """
         Return only published events (upcoming).
         Returns:
-            QuerySet: Events with 'published' status.
+            QuerySet: Events with 'published' status dated today or later.
         """
-        return self.filter(status="published")
+        return self.with_status("published")
 
     def filter_by_creator(self, user) -> QuerySet["Event"]:
         """
@@ -40,7 +253,7 @@ class EventManager(models.Manager):
         return self.filter(created_by=user)
 
 
-class Event(models.Model):
+class Event(DirtyFieldsMixin, models.Model):
     """
     Model representing an event with comprehensive validation and status management.
 
@@ -53,6 +266,8 @@ class Event(models.Model):
         ("completed", "Completed"),
         ("cancelled", "Cancelled"),
     )
+    # Stored codes of the statuses, see StatusField
+    STATUS_CODES: dict[str, int] = {"published": 1, "completed": 2, "cancelled": 3}
 
     title: models.CharField = models.CharField(
         max_length=100,
@@ -85,11 +300,26 @@ class Event(models.Model):
         blank=False,
         null=False,
     )
-    status: models.CharField = models.CharField(
-        max_length=10,
+    # date and start_time as one timestamp, set by set_schedule on save
+    starts_at: models.DateTimeField = models.DateTimeField(blank=True, editable=False)
+    duration: models.DurationField = models.DurationField(
+        null=True,
+        blank=True,
+        help_text="Length of the event, empty if open-ended",
+    )
+    ends_at: models.DateTimeField = models.DateTimeField(
+        null=True, blank=True, editable=False
+    )
+    capacity: models.PositiveIntegerField = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Maximum number of active registrations, empty for unlimited",
+    )
+    status: StatusField = StatusField(
         blank=False,
         null=False,
         choices=STATUS_CHOICES,
+        codes=STATUS_CODES,
         default="published",
     )
     created_by: models.ForeignKey = models.ForeignKey(
@@ -99,8 +329,18 @@ class Event(models.Model):
         blank=True,
         related_name="created_events",
     )
+    registration_count: models.PositiveIntegerField = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of active registrations",
+    )
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+    # Weighted full-text vector, PostgreSQL only (SQLite uses an FTS5 table)
+    search_vector: SearchVectorField = SearchVectorField(null=True, editable=False)
+
+    # Columns only ever changed with update() expressions, never by save()
+    COUNTER_FIELDS: tuple[str, ...] = ("registration_count", "search_vector")
 
     objects = EventManager()
 
@@ -108,14 +348,16 @@ class Event(models.Model):
         """
         Meta configuration for an Event model.
 
-        Orders events by date and start time.
-        Adds indexes for faster filtering by date, status, and creator.
+        Orders events by start.
+        Adds indexes for faster filtering by start, status, and creator.
+        The (starts_at, id) index also serves keyset pagination and the
+        (status, starts_at) index status filters, upcoming lists and the sweeper.
         """
 
-        ordering = ["date", "start_time"]
+        ordering = ["starts_at"]
         indexes = [
-            models.Index(fields=["date"]),
-            models.Index(fields=["status"]),
+            models.Index(fields=["starts_at", "id"]),
+            models.Index(fields=["status", "starts_at"]),
             models.Index(fields=["created_by"]),
         ]
 
@@ -175,12 +417,22 @@ class Event(models.Model):
         """
         Override save method to enforce logic and handle event status updates.
         Performs full validation before saving and handles status change cascades.
+        Saves with no changed fields are skipped entirely.
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
+        if kwargs.get("update_fields") is None and not self.is_dirty():
+            return
+
         # Validate before saving
         self.full_clean()
+        self.set_schedule()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"date", "start_time", "duration"} & set(
+            update_fields
+        ):
+            kwargs["update_fields"] = [*update_fields, "starts_at", "ends_at"]
 
         # If event is not cancelled, update status according to date
         if self.status != "cancelled":
@@ -189,16 +441,43 @@ class Event(models.Model):
             elif self.is_upcoming:
                 self.status = "published"
 
-        # Get previous status for comparison
-        previous_status = None
-        if self.pk:
-            previous_status = Event.objects.get(pk=self.pk).status
+        # Get previous status for comparison from the load-time snapshot
+        previous_status = self.get_previous_value("status")
+        dirty_fields = self.get_dirty_fields()
+        capacity_changed = "capacity" in dirty_fields
+        reindex = not self.has_snapshot or any(
+            name in dirty_fields for name, _ in SEARCH_FIELDS
+        )
+        adding = self._state.adding
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                add_events([self])
+            elif self.has_snapshot:
+                record_event_changes(
+                    self.created_by_id, transition(previous_status, self.status)
+                )
 
-        super().save(*args, **kwargs)
+        if reindex:
+            update_search_index(self)
+        invalidate_events([self.pk])
 
         # Handle cascading status changes
         if previous_status != "cancelled" and self.status == "cancelled":
             self._cancel_all_registrations()
+        elif capacity_changed:
+            self.promote_waitlist()
+
+    def set_schedule(self) -> None:
+        """Derive starts_at and ends_at from date, start_time and duration."""
+        if self.date is None or self.start_time is None:
+            return
+        # bulk_create skips full_clean, so values may not be converted yet
+        day = self._meta.get_field("date").to_python(self.date)
+        start = self._meta.get_field("start_time").to_python(self.start_time)
+        self.starts_at = local_datetime(day, start)
+        self.ends_at = self.starts_at + self.duration if self.duration else None
 
     def cancel_event(self, user) -> None:
         """
@@ -210,25 +489,102 @@ class Event(models.Model):
             PermissionError: If user is not the event creator.
             ValueError: If event cannot be cancelled.
         """
+        # Imported here, services depends on this module
+        from .services import cancel_event
 
-        if self.created_by != user:
-            raise PermissionError("Only the event creator can cancel this event.")
-        if self.status == "cancelled":
-            raise ValueError("Event is already cancelled.")
-        if self.status != "published":
-            raise ValueError("Only published events can be cancelled.")
+        cancel_event(self, user)
 
-        self.status = "cancelled"
-        self.save()
+    def delete(self, *args, **kwargs):
+        """
+        Delete the event and its full-text index entry.
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        event_id = self.pk
+        with transaction.atomic():
+            remove_events(Event.objects.filter(pk=event_id))
+            result = super().delete(*args, **kwargs)
+            remove_from_search_index(event_id)
+        invalidate_events([event_id])
+        return result
 
     def _cancel_all_registrations(self) -> None:
         """
-        Cancel all active registrations for cancelled event.
+        Cancel all active and waitlisted registrations for cancelled event.
         Private method to handle registration cancellation when an event is cancelled.
         """
+        now = timezone.now()
         active_regs = self.registrations.filter(status="registered")  # type: ignore
-        print(f"Cancelling {active_regs.count()} registrations for event {self.id}")  # type: ignore
-        active_regs.update(status="cancelled", updated_at=timezone.now())
+        with transaction.atomic():
+            cancelled = active_regs.update(status="cancelled", updated_at=now)
+            self.adjust_registration_count(-cancelled)
+            dropped = self.registrations.filter(status="waitlisted").update(  # type: ignore
+                status="cancelled", updated_at=now
+            )
+            record_registration_changes(
+                self.pk,
+                self.created_by_id,
+                {
+                    "registered": -cancelled,
+                    "waitlisted": -dropped,
+                    "cancelled": cancelled + dropped,
+                },
+            )
+        invalidate_events([self.pk])
+
+    def promote_waitlist(self) -> int:
+        """
+        Move waitlisted registrations into free seats in FIFO order.
+        The event row is locked while seats are counted, so concurrent
+        promotions and registrations can never exceed the capacity.
+        Returns:
+            int: Number of promoted registrations.
+        """
+        if self.status != "published" or not self.is_upcoming:
+            return 0
+
+        with transaction.atomic():
+            capacity, taken = (
+                Event.objects.select_for_update()
+                .values_list("capacity", "registration_count")
+                .get(pk=self.pk)
+            )
+            waitlist = (
+                self.registrations.filter(status="waitlisted")  # type: ignore
+                .order_by("updated_at", "id")
+                .values_list("id", flat=True)
+            )
+            if capacity is not None:
+                if capacity <= taken:
+                    return 0
+                waitlist = waitlist[: capacity - taken]
+
+            promoted = EventRegistration.objects.filter(id__in=list(waitlist)).update(
+                status="registered", updated_at=timezone.now()
+            )
+            self.registration_count = taken
+            self.adjust_registration_count(promoted)
+            record_registration_changes(
+                self.pk,
+                self.created_by_id,
+                transition("waitlisted", "registered", promoted),
+            )
+        return promoted
+
+    def adjust_registration_count(self, delta: int) -> None:
+        """
+        Atomically shift the active registration counter by delta.
+        Args:
+            delta: Number of registrations added (positive) or removed (negative).
+        """
+        if not delta:
+            return
+        Event.objects.filter(pk=self.pk).update(
+            registration_count=F("registration_count") + delta
+        )
+        self.registration_count = max(0, self.registration_count + delta)
+        invalidate_events([self.pk])
 
     def can_register(self, user) -> Tuple[bool, str]:
         """
@@ -251,8 +607,15 @@ class Event(models.Model):
         if self.status != "published":
             return False, "Event is not available for registration."
 
-        # Check existing registration
-        if self.registrations.filter(user=user, status="registered").exists():  # type: ignore
+        # Check existing registration, reusing with_registration_state if annotated
+        is_registered = None
+        if getattr(self, "registration_state_user_id", None) == user.pk:
+            is_registered = self.is_registered  # type: ignore
+        if is_registered is None:
+            is_registered = self.registrations.filter(  # type: ignore
+                user=user, status__in=EventRegistration.ACTIVE_STATUSES
+            ).exists()
+        if is_registered:
             return False, "Already registered for this event."
 
         return True, "Can register."
@@ -276,13 +639,28 @@ class Event(models.Model):
         return self.date < timezone.now().date()
 
     @property
-    def registration_count(self) -> int:
+    def current_status(self) -> str:
+        """
+        Status the event has as of today, see EventQuerySet.with_effective_status.
+        Returns:
+            str: The 'effective_status' annotation if present, else the stored
+            status with published past events read as 'completed'.
+        """
+        annotated = getattr(self, "effective_status", None)
+        if annotated is not None:
+            return annotated
+        if self.status == "published" and self.is_past:
+            return "completed"
+        return self.status
+
+    @property
+    def is_full(self) -> bool:
         """
-        Return number of current active registrations.
+        Check if all seats are taken.
         Returns:
-            int: Count of active registrations for this event.
+            bool: True if the event has a capacity and no free seats.
         """
-        return self.registrations.filter(status="registered").count()  # type: ignore
+        return self.capacity is not None and self.registration_count >= self.capacity
 
     @property
     def can_be_cancelled(self) -> bool:
@@ -303,7 +681,7 @@ class Event(models.Model):
         return self.status == "cancelled"
 
 
-class EventRegistration(models.Model):
+class EventRegistration(DirtyFieldsMixin, models.Model):
     """
     Model representing user registration for an event.
 
@@ -313,8 +691,13 @@ class EventRegistration(models.Model):
 
     STATUS_CHOICES: tuple[tuple[str, str], ...] = (
         ("registered", "Registered"),
+        ("waitlisted", "Waitlisted"),
         ("cancelled", "Cancelled"),
     )
+    # Stored codes of the statuses, see StatusField
+    STATUS_CODES: dict[str, int] = {"registered": 1, "waitlisted": 2, "cancelled": 3}
+    # Statuses that hold a place, seated or on the waitlist
+    ACTIVE_STATUSES: tuple[str, ...] = ("registered", "waitlisted")
 
     user: models.ForeignKey = models.ForeignKey(
         CustomUser,
@@ -326,9 +709,9 @@ class EventRegistration(models.Model):
         on_delete=models.CASCADE,
         related_name="registrations",  # MyPy can't see that
     )
-    status: models.CharField = models.CharField(
-        max_length=10,
+    status: StatusField = StatusField(
         choices=STATUS_CHOICES,
+        codes=STATUS_CODES,
         default="registered",
     )
     registered_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
@@ -339,7 +722,8 @@ class EventRegistration(models.Model):
         Meta configuration for EventRegistration model.
 
         Adds constraints for each user can only register once per event.
-        Adds indexes for faster filtering by user-status and event-status.
+        Adds indexes for faster filtering by user-status and event-status,
+        and for keyset pagination of user and event registration lists.
         """
 
         constraints = [
@@ -351,6 +735,8 @@ class EventRegistration(models.Model):
         indexes = [
             models.Index(fields=["user", "status"]),
             models.Index(fields=["event", "status"]),
+            models.Index(fields=["user", "-registered_at", "id"]),
+            models.Index(fields=["event", "-registered_at", "id"]),
         ]
         ordering = ["-registered_at"]
 
@@ -372,41 +758,96 @@ class EventRegistration(models.Model):
         """
         super().clean()
 
+        previous_status = self.get_previous_value("status")
+
         # Validate new registrations or status changes to registered
-        if self.pk is None or self.status == "registered":
+        if self.pk is None or (
+            self.status == "registered" and previous_status != "registered"
+        ):
             can_register, reason = self.event.can_register(self.user)
             if not can_register:
                 raise ValidationError(reason)
+            if self.status == "registered" and self.event.is_full:
+                raise ValidationError("Event is full.")
 
         # Validate cancellation
-        if self.status == "cancelled" and self.pk:
-            try:
-                original = EventRegistration.objects.get(pk=self.pk)
-                if original.status != "registered":
-                    raise ValidationError("Can only cancel active registrations.")
-                if not original.can_cancel():
-                    raise ValidationError("Cannot cancel this registration.")
-            except EventRegistration.DoesNotExist:
-                pass
+        if self.status == "cancelled" and previous_status is not None:
+            if previous_status not in ("registered", "waitlisted"):
+                raise ValidationError("Can only cancel active registrations.")
+            if self.event.status != "published" or not self.event.is_upcoming:
+                raise ValidationError("Cannot cancel this registration.")
 
     def save(self, *args, **kwargs) -> None:
         """
         Ensure validation is always performed before saving.
+        Keeps the event's active registration counter in sync.
+        Saves with no changed fields are skipped entirely.
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
+        if kwargs.get("update_fields") is None and not self.is_dirty():
+            return
+
         self.full_clean()
-        super().save(*args, **kwargs)
+        previous_status = self.get_previous_value("status")
+
+        delta = self._registration_delta(previous_status, self.status)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.event.adjust_registration_count(delta)
+            record_registration_changes(
+                self.event_id,
+                self.event.created_by_id,
+                transition(previous_status, self.status),
+            )
+            # A freed seat goes to the head of the waitlist
+            if delta < 0 and self.event.capacity is not None:
+                self.event.promote_waitlist()
+        invalidate_events([self.event_id])
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the registration and release its slot in the event counter.
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            record_registration_changes(
+                self.event_id,
+                self.event.created_by_id,
+                transition(self.status, None),
+            )
+            if self.status == "registered":
+                self.event.adjust_registration_count(-1)
+                if self.event.capacity is not None:
+                    self.event.promote_waitlist()
+        return result
+
+    @staticmethod
+    def _registration_delta(previous_status, status) -> int:
+        """
+        Return how a status transition changes the active registration count.
+        Args:
+            previous_status: Stored status before saving, None for new rows.
+            status: Status being saved.
+        Returns:
+            int: +1, -1 or 0.
+        """
+        was_active = previous_status == "registered"
+        is_active = status == "registered"
+        return int(is_active) - int(was_active)
 
     def can_cancel(self):
         """
         Check if registration can be cancelled.
         Returns:
-            bool: True if registration is active and event allows cancellation.
+            bool: True if registration is active or waitlisted and event allows cancellation.
         """
         return (
-            self.status == "registered"
+            self.status in ("registered", "waitlisted")
             and self.event.status == "published"
             and self.event.is_upcoming
         )
@@ -422,3 +863,112 @@ class EventRegistration(models.Model):
 
         self.status = "cancelled"
         self.save()
+
+
+class EventStats(models.Model):
+    """
+    Rollup of registration counts per status for one event.
+
+    Maintained incrementally with F() updates on every registration
+    transition; rebuild_creator_stats recomputes it from the source rows.
+    """
+
+    event: models.OneToOneField = models.OneToOneField(
+        Event,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    # Plain integers: drift must never make a write fail, rebuilds fix it
+    active_registrations: models.IntegerField = models.IntegerField(default=0)
+    waitlisted_registrations: models.IntegerField = models.IntegerField(default=0)
+    cancelled_registrations: models.IntegerField = models.IntegerField(default=0)
+
+    def __str__(self) -> str:
+        """
+        String representation of the event rollup.
+        Returns:
+            str: Event id with its active registration count.
+        """
+        return f"Event {self.event_id}: {self.active_registrations} registered"
+
+    @property
+    def total_registrations(self) -> int:
+        """
+        Count registrations in any status.
+        Returns:
+            int: Active, waitlisted and cancelled registrations.
+        """
+        return (
+            self.active_registrations
+            + self.waitlisted_registrations
+            + self.cancelled_registrations
+        )
+
+
+class CreatorStats(models.Model):
+    """
+    Rollup of event and registration counts per event creator.
+
+    Lets the creator dashboard read its totals from one row, however many
+    events the creator has.
+    """
+
+    creator: models.OneToOneField = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="event_stats",
+    )
+    active_events: models.IntegerField = models.IntegerField(default=0)
+    completed_events: models.IntegerField = models.IntegerField(default=0)
+    cancelled_events: models.IntegerField = models.IntegerField(default=0)
+    active_registrations: models.IntegerField = models.IntegerField(default=0)
+    waitlisted_registrations: models.IntegerField = models.IntegerField(default=0)
+    cancelled_registrations: models.IntegerField = models.IntegerField(default=0)
+
+    class Meta:
+        """Meta configuration for CreatorStats model."""
+
+        verbose_name_plural = "creator stats"
+
+    def __str__(self) -> str:
+        """
+        String representation of the creator rollup.
+        Returns:
+            str: Creator id with the number of events.
+        """
+        return f"Creator {self.creator_id}: {self.total_events} events"
+
+    @classmethod
+    def for_creator(cls, user) -> "CreatorStats":
+        """
+        Return the rollup of a creator, all zeros if they have no events yet.
+        Args:
+            user: The event creator.
+        Returns:
+            CreatorStats: Stored or unsaved empty rollup.
+        """
+        return cls.objects.filter(pk=user.pk).first() or cls(creator_id=user.pk)
+
+    @property
+    def total_events(self) -> int:
+        """
+        Count events in any status.
+        Returns:
+            int: Active, completed and cancelled events.
+        """
+        return self.active_events + self.completed_events + self.cancelled_events
+
+    @property
+    def total_registrations(self) -> int:
+        """
+        Count registrations for the creator's events in any status.
+        Returns:
+            int: Active, waitlisted and cancelled registrations.
+        """
+        return (
+            self.active_registrations
+            + self.waitlisted_registrations
+            + self.cancelled_registrations
+        )
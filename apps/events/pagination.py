@@ -0,0 +1,315 @@
+import json
+from dataclasses import dataclass, field
+from datetime import date, time
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# Default number of rows per page for HTML views and the API
+PAGE_SIZE = 20
+CURSOR_SALT = "apps.events.pagination.cursor"
+
+
+class InvalidCursor(Exception):
+    """Raised when a cursor cannot be decoded or does not match the ordering."""
+
+
+@dataclass
+class KeysetPage:
+    """One page of keyset paginated rows with opaque cursors to its neighbours."""
+
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    ordering: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def has_next(self) -> bool:
+        """Check if a following page exists."""
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        """Check if a preceding page exists."""
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def get_keyset_ordering(queryset: QuerySet) -> Tuple[str, ...]:
+    """
+    Return the queryset ordering with the primary key appended as tiebreaker.
+    Args:
+        queryset: Queryset to paginate.
+    Returns:
+        Tuple[str, ...]: Field paths, '-' prefixed for descending order.
+    Raises:
+        ValueError: If the ordering contains expressions instead of field names.
+    """
+    ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+    for name in ordering:
+        if not isinstance(name, str) or "?" in name:
+            raise ValueError("Keyset pagination requires ordering by field names.")
+
+    ordering = ["id" if name == "pk" else name for name in ordering]
+    ordering = ["-id" if name == "-pk" else name for name in ordering]
+    if "id" not in ordering and "-id" not in ordering:
+        ordering.append("id")
+    return tuple(ordering)
+
+
+def _resolve_field(model: type[Model], path: str):
+    """Return the model field at the end of a '__' separated path."""
+    model_field = None
+    for part in path.split("__"):
+        model_field = model._meta.get_field(part)
+        if model_field.is_relation:
+            model = model_field.related_model
+    return model_field
+
+
+def _to_python(model: type[Model], path: str, value: Any) -> Any:
+    """Convert a decoded cursor value back to the type of its column."""
+    try:
+        return _resolve_field(model, path).to_python(value)
+    except FieldDoesNotExist:
+        # Annotations such as search_rank are plain JSON numbers
+        return value
+
+
+def _row_values(obj: Any, ordering: Sequence[str]) -> List[Any]:
+    """Read the ordering values of a model instance or values() dict."""
+    values = []
+    for name in ordering:
+        path = name.lstrip("-")
+        if isinstance(obj, dict):
+            values.append(obj[path])
+            continue
+        value = obj
+        for part in path.split("__"):
+            value = getattr(value, part)
+        values.append(value)
+    return values
+
+
+class _CursorSerializer:
+    """Signing serializer keeping full microsecond precision of timestamps."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=self._encode).encode(
+            "latin-1"
+        )
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        # date also covers datetime; isoformat keeps microseconds and offsets
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        return str(value)
+
+    def loads(self, data: bytes) -> Any:
+        return signing.JSONSerializer().loads(data)
+
+
+def encode_cursor(values: Sequence[Any], reverse: bool = False) -> str:
+    """
+    Build an opaque, signed cursor from the ordering values of a row.
+    Args:
+        values: Ordering values of the boundary row.
+        reverse: True for cursors that page backwards.
+    Returns:
+        str: URL safe cursor string.
+    """
+    return signing.dumps(
+        {"v": list(values), "r": int(reverse)},
+        salt=CURSOR_SALT,
+        serializer=_CursorSerializer,
+        compress=True,
+    )
+
+
+def decode_cursor(
+    cursor: str, model: type[Model], ordering: Sequence[str]
+) -> Tuple[List[Any], bool]:
+    """
+    Decode a cursor back into typed ordering values.
+    Args:
+        cursor: Cursor produced by encode_cursor.
+        model: Model being paginated.
+        ordering: Ordering the cursor must match.
+    Returns:
+        Tuple[List[Any], bool]: Ordering values and the reverse flag.
+    Raises:
+        InvalidCursor: If the cursor is malformed, tampered or stale.
+    """
+    try:
+        payload = signing.loads(cursor, salt=CURSOR_SALT, serializer=_CursorSerializer)
+        raw_values = payload["v"]
+        reverse = bool(payload["r"])
+        if len(raw_values) != len(ordering):
+            raise InvalidCursor("Cursor does not match the ordering.")
+        values = [
+            _to_python(model, name.lstrip("-"), value)
+            for name, value in zip(ordering, raw_values)
+        ]
+    except InvalidCursor:
+        raise
+    except Exception as e:
+        raise InvalidCursor("Invalid cursor.") from e
+    return values, reverse
+
+
+def _seek_filter(ordering: Sequence[str], values: Sequence[Any], reverse: bool) -> Q:
+    """
+    Build the WHERE clause selecting rows strictly after the cursor row.
+    The leading column is also bounded on its own so the database can seek
+    straight into the index instead of scanning from the start.
+    """
+    seek = Q()
+    for index, name in enumerate(ordering):
+        path = name.lstrip("-")
+        descending = name.startswith("-") != reverse
+        condition = Q(**{f"{path}__{'lt' if descending else 'gt'}": values[index]})
+        for previous_name, previous_value in zip(ordering[:index], values[:index]):
+            condition &= Q(**{previous_name.lstrip("-"): previous_value})
+        seek |= condition
+
+    leading = ordering[0].lstrip("-")
+    leading_descending = ordering[0].startswith("-") != reverse
+    bound = Q(**{f"{leading}__{'lte' if leading_descending else 'gte'}": values[0]})
+    return bound & seek
+
+
+def _flip(name: str) -> str:
+    """Invert the direction of one ordering term."""
+    return name[1:] if name.startswith("-") else f"-{name}"
+
+
+def paginate_keyset(
+    queryset: QuerySet, cursor: Optional[str] = None, page_size: int = PAGE_SIZE
+) -> KeysetPage:
+    """
+    Return one page of a queryset using keyset (seek) pagination.
+    Pages are located with a WHERE clause on the ordering columns instead of
+    OFFSET, so deep pages cost the same as the first one and rows inserted
+    concurrently never shift or duplicate results.
+    Args:
+        queryset: Ordered queryset to paginate.
+        cursor: Cursor of the requested page, None for the first page.
+        page_size: Maximum number of rows per page.
+    Returns:
+        KeysetPage: Page rows and cursors to the neighbouring pages.
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded.
+    """
+    ordering = get_keyset_ordering(queryset)
+    reverse = False
+    if cursor:
+        values, reverse = decode_cursor(cursor, queryset.model, ordering)
+        queryset = queryset.filter(_seek_filter(ordering, values, reverse))
+
+    query_ordering = [_flip(name) for name in ordering] if reverse else list(ordering)
+    rows = list(queryset.order_by(*query_ordering)[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+
+    page = KeysetPage(items=rows, ordering=ordering)
+    if not rows:
+        return page
+
+    first_values = _row_values(rows[0], ordering)
+    last_values = _row_values(rows[-1], ordering)
+    if reverse:
+        page.next_cursor = encode_cursor(last_values)
+        if has_more:
+            page.previous_cursor = encode_cursor(first_values, reverse=True)
+    else:
+        if has_more:
+            page.next_cursor = encode_cursor(last_values)
+        if cursor:
+            page.previous_cursor = encode_cursor(first_values, reverse=True)
+    return page
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination class backed by paginate_keyset.
+    Follows the ordering applied by the view (including OrderingFilter) and
+    responds with DRF style 'next', 'previous' and 'results' keys.
+    """
+
+    page_size = PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+
+    def get_page_size(self, request) -> int:
+        """Return the requested page size clamped to max_page_size."""
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(requested, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the rows of the requested page."""
+        self.request = request
+        try:
+            self.page = paginate_keyset(
+                queryset,
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+            )
+        except InvalidCursor:
+            raise NotFound("Invalid cursor.")
+        return self.page.items
+
+    def _link(self, cursor: Optional[str]) -> Optional[str]:
+        """Build an absolute URL for a cursor."""
+        if cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        """Return the URL of the next page."""
+        return self._link(self.page.next_cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Return the URL of the previous page."""
+        return self._link(self.page.previous_cursor)
+
+    def get_paginated_response(self, data) -> Response:
+        """Wrap serialized rows with links to the neighbouring pages."""
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        """Describe the paginated response for schema generation."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,123 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator
+
+import orjson
+from django.http import StreamingHttpResponse
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .serializers import ValuesSerializer
+
+# Rows fetched from the database and encoded per streamed chunk
+STREAM_BATCH_SIZE = 2000
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson leaves to Python exactly like DRF's encoder."""
+    return JSONEncoder().default(value)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+    Output is byte-identical to JSONRenderer: dates, times and datetimes are
+    passed through to DRF's encoder so their format is unchanged, and the
+    JavaScript line separators are escaped the same way. Indented output
+    uses the stock encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Render data into JSON bytes."""
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return self.encode(data)
+
+    def encode(self, data: Any) -> bytes:
+        """
+        Encode data compactly, the way JSONRenderer does by default.
+        Args:
+            data: Serialized data to encode.
+        Returns:
+            bytes: UTF-8 encoded JSON.
+        """
+        content = orjson.dumps(
+            data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class StreamingJSONRenderer(FastJSONRenderer):
+    """
+    Opt-in renderer for list endpoints streamed as one unpaginated JSON array.
+    Selected with 'Accept: application/json; stream=true' or
+    '?format=json-stream'. Views check for it and respond with
+    stream_response; any other response is rendered as plain JSON.
+    """
+
+    media_type = "application/json; stream=true"
+    format = "json-stream"
+
+    def stream(
+        self, rows: Iterable[Dict[str, Any]], serializer: ValuesSerializer
+    ) -> Iterator[bytes]:
+        """
+        Encode .values() rows into a JSON array one batch at a time.
+        Args:
+            rows: Rows queried with values(*serializer.lookups).
+            serializer: Serializer turning rows into response items.
+        Yields:
+            bytes: Consecutive pieces of the JSON array.
+        """
+        rows = iter(rows)
+        yield b"["
+        separator = b""
+        while True:
+            batch = list(islice(rows, STREAM_BATCH_SIZE))
+            if not batch:
+                break
+            # Drop the brackets of the encoded batch to splice it into the array
+            yield separator + self.encode(serializer.to_representation(batch))[1:-1]
+            separator = b","
+        yield b"]"
+
+    def stream_response(
+        self, queryset, serializer: ValuesSerializer
+    ) -> StreamingHttpResponse:
+        """
+        Stream every row of a queryset without materializing the list.
+        Args:
+            queryset: Ordered queryset to stream.
+            serializer: Serializer turning rows into response items.
+        Returns:
+            StreamingHttpResponse: JSON array response.
+        """
+        rows = queryset.values(*serializer.lookups).iterator(
+            chunk_size=STREAM_BATCH_SIZE
+        )
+        return StreamingHttpResponse(
+            self.stream(rows, serializer), content_type=self.media_type
+        )
+
+
+class StreamingContentNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation that also selects StreamingJSONRenderer for
+    '?format=json-stream', whatever the Accept header says.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        """Return the streaming renderer for its format, else negotiate."""
+        format = format_suffix or request.query_params.get(
+            self.settings.URL_FORMAT_OVERRIDE
+        )
+        if format == StreamingJSONRenderer.format:
+            for renderer in renderers:
+                if isinstance(renderer, StreamingJSONRenderer):
+                    return renderer, renderer.media_type
+        return super().select_renderer(request, renderers, format_suffix)
@@ -0,0 +1,213 @@
+import re
+from typing import List
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, Model, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+
+# Columns covered by the full-text index with their PostgreSQL weights
+SEARCH_FIELDS: tuple[tuple[str, str], ...] = (
+    ("title", "A"),
+    ("location", "B"),
+    ("description", "C"),
+)
+SEARCH_CONFIG = "english"
+# SQLite FTS5 table mirroring SEARCH_FIELDS, keyed by event id
+FTS_TABLE = "events_event_fts"
+# bm25 column weights for the FTS5 table, matching the PostgreSQL weights
+FTS_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+def search_vector() -> SearchVector:
+    """Build the weighted search vector expression over SEARCH_FIELDS."""
+    vector = None
+    for name, weight in SEARCH_FIELDS:
+        part = SearchVector(name, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def _fts_terms(query: str) -> List[str]:
+    """Split a user query into words safe to use in an FTS5 MATCH."""
+    return re.findall(r"\w+", query)
+
+
+def update_search_index(event: Model) -> None:
+    """
+    Refresh the full-text index entry of one event.
+    Called from Event.save when a searchable column changes.
+    Args:
+        event: The saved event.
+    """
+    if connection.vendor == "postgresql":
+        type(event)._base_manager.filter(pk=event.pk).update(
+            search_vector=search_vector()
+        )
+    elif connection.vendor == "sqlite":
+        columns = ", ".join(name for name, _ in SEARCH_FIELDS)
+        placeholders = ", ".join(["%s"] * (len(SEARCH_FIELDS) + 1))
+        values = [getattr(event, name) or "" for name, _ in SEARCH_FIELDS]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [event.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, {columns}) VALUES ({placeholders})",
+                [event.pk, *values],
+            )
+
+
+def add_to_search_index(event_ids: List[int], chunk_size: int = 500) -> None:
+    """
+    Index events inserted in bulk with one statement per chunk of ids.
+    Called from EventQuerySet.bulk_create, which bypasses Event.save.
+    Args:
+        event_ids: Primary keys of the new events.
+        chunk_size: Ids per statement, below the SQLite variable limit.
+    """
+    from .models import Event
+
+    columns = ", ".join(name for name, _ in SEARCH_FIELDS)
+    for start in range(0, len(event_ids), chunk_size):
+        ids = event_ids[start : start + chunk_size]
+        if connection.vendor == "postgresql":
+            Event._base_manager.filter(id__in=ids).update(search_vector=search_vector())
+        elif connection.vendor == "sqlite":
+            placeholders = ", ".join(["%s"] * len(ids))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+                    f"SELECT id, {columns} FROM {Event._meta.db_table} "
+                    f"WHERE id IN ({placeholders})",
+                    ids,
+                )
+
+
+def remove_from_search_index(*event_ids: int) -> None:
+    """
+    Drop the full-text index entries of deleted events.
+    Args:
+        *event_ids: Primary keys of the deleted events.
+    """
+    # PostgreSQL keeps the vector on the event row itself
+    if connection.vendor == "sqlite" and event_ids:
+        placeholders = ", ".join(["%s"] * len(event_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})",
+                list(event_ids),
+            )
+
+
+def rebuild_search_index(chunk_size: int = 1000) -> int:
+    """
+    Rebuild the full-text index of every event in primary key chunks.
+    Needed after writes that bypass Event.save, such as queryset updates.
+    Args:
+        chunk_size: Number of events re-indexed per statement.
+    Returns:
+        int: Number of re-indexed events.
+    """
+    from .models import Event
+
+    columns = ", ".join(name for name, _ in SEARCH_FIELDS)
+    total = 0
+    last_id = 0
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    while True:
+        ids = list(
+            Event.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:chunk_size]
+        )
+        if not ids:
+            return total
+        if connection.vendor == "postgresql":
+            Event.objects.filter(id__in=ids).update(search_vector=search_vector())
+        elif connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+                    f"SELECT id, {columns} FROM {Event._meta.db_table} "
+                    f"WHERE id >= %s AND id <= %s",
+                    [ids[0], ids[-1]],
+                )
+        total += len(ids)
+        last_id = ids[-1]
+
+
+def search_events(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filter events matching a full-text query and annotate their relevance.
+    Uses the GIN indexed search_vector column on PostgreSQL and the FTS5
+    table on SQLite, so lookups go through an inverted index instead of a
+    LIKE scan. Other databases fall back to case-insensitive matching.
+    Args:
+        queryset: Events to search.
+        query: User supplied search text.
+    Returns:
+        QuerySet: Matching events annotated with 'search_rank' (higher is better).
+    """
+    if connection.vendor == "postgresql":
+        search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=search_query).annotate(
+            search_rank=SearchRank(F("search_vector"), search_query)
+        )
+
+    if connection.vendor == "sqlite":
+        terms = _fts_terms(query)
+        if not terms:
+            return queryset.none().annotate(
+                search_rank=Value(0.0, output_field=FloatField())
+            )
+        # Quoted terms are matched literally and combined with AND
+        match = " ".join(f'"{term}"' for term in terms)
+        event_id = (
+            f"{connection.ops.quote_name(queryset.model._meta.db_table)}."
+            f"{connection.ops.quote_name('id')}"
+        )
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {event_id}",
+                [match],
+                output_field=FloatField(),
+            )
+        )
+
+    condition = Q()
+    for name, _ in SEARCH_FIELDS:
+        condition |= Q(**{f"{name}__icontains": query})
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    DRF filter backend searching events through the full-text index.
+    Results are ordered by relevance unless the client asked for an ordering.
+    Place it after OrderingFilter so relevance takes precedence over the
+    view's default ordering.
+    """
+
+    search_param = "search"
+    ordering_param = "ordering"
+
+    def filter_queryset(self, request, queryset, view):
+        """Apply the search query, if any, and order by relevance."""
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+
+        queryset = search_events(queryset, query)
+        if request.query_params.get(self.ordering_param):
+            return queryset
+        return queryset.order_by("-search_rank", *queryset.query.order_by)
@@ -0,0 +1,280 @@
+import csv
+import random
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from io import StringIO
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.users.models import CustomUser
+from .models import Event, EventRegistration
+from .stats import rebuild_creator_stats
+
+TITLE_WORDS: tuple[str, ...] = (
+    "Jazz", "Python", "Startup", "Yoga", "Film", "Poetry", "Chess", "Wine",
+    "Design", "Robotics", "Salsa", "Photography", "Climate", "Comedy", "Data",
+)
+TITLE_KINDS: tuple[str, ...] = (
+    "Night", "Meetup", "Workshop", "Festival", "Conference", "Club", "Tour",
+)
+LOCATIONS: tuple[str, ...] = (
+    "Berlin", "Lisbon", "Warsaw", "Vienna", "Prague", "Madrid", "Oslo", "Riga",
+)
+# Share of past events and status mixes of past and future events
+PAST_EVENT_RATE = 0.3
+PAST_CANCELLED_RATE = 0.1
+FUTURE_CANCELLED_RATE = 0.05
+# Share of registrations of running events that were cancelled
+REGISTRATION_CANCELLED_RATE = 0.08
+# Registrations open up to this many days before an event
+REGISTRATION_WINDOW_DAYS = 60
+
+
+@dataclass
+class SeedResult:
+    """Numbers of rows written by seed_scale."""
+
+    creators: int
+    visitors: int
+    events: int
+    registrations: int
+
+
+def popularity(
+    events: int, registrations: int, limit: int, exponent: float, rng: random.Random
+) -> List[int]:
+    """
+    Split registrations over events following a power law.
+    Events get random popularity ranks; the event of rank r receives a share
+    proportional to 1 / r ** exponent, capped at limit.
+    Args:
+        events: Number of events.
+        registrations: Number of registrations to split.
+        limit: Most registrations one event can have (the number of visitors).
+        exponent: Power-law exponent, 0 for a uniform split.
+        rng: Seeded random generator.
+    Returns:
+        List[int]: Registrations per event.
+    """
+    ranks = list(range(1, events + 1))
+    rng.shuffle(ranks)
+    weights = [1 / rank**exponent for rank in ranks]
+    total = sum(weights)
+    counts = [min(limit, int(registrations * weight / total)) for weight in weights]
+
+    # Hand out what rounding and capping left over, most popular first
+    remaining = registrations - sum(counts)
+    by_weight = sorted(range(events), key=weights.__getitem__, reverse=True)
+    while remaining > 0:
+        progressed = False
+        for index in by_weight:
+            if remaining == 0:
+                break
+            if counts[index] < limit:
+                counts[index] += 1
+                remaining -= 1
+                progressed = True
+        if not progressed:
+            break
+    return counts
+
+
+def _batches(rows: Iterable, size: int) -> Iterator[list]:
+    """Group rows into lists of at most size."""
+    batch: list = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _create_users(prefix: str, role: str, count: int, batch_size: int) -> List[int]:
+    """Bulk insert users of one role and return their primary keys in order."""
+    users = (
+        CustomUser(
+            username=f"{prefix}_{role}_{index}",
+            email=f"{prefix}_{role}_{index}@example.com",
+            role=role,
+            is_active=True,
+            password=f"{UNUSABLE_PASSWORD_PREFIX}{prefix}",
+        )
+        for index in range(count)
+    )
+    for batch in _batches(users, batch_size):
+        CustomUser.objects.bulk_create(batch)
+    return list(
+        CustomUser.objects.filter(username__startswith=f"{prefix}_{role}_")
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def _event_schedule(rng: random.Random, now: datetime) -> Tuple[datetime, str]:
+    """Pick the start and status of one event."""
+    if rng.random() < PAST_EVENT_RATE:
+        start = now - timedelta(days=rng.randint(1, 365))
+        status = "cancelled" if rng.random() < PAST_CANCELLED_RATE else "completed"
+    else:
+        start = now + timedelta(days=rng.randint(1, 180))
+        status = "cancelled" if rng.random() < FUTURE_CANCELLED_RATE else "published"
+    start = start.replace(hour=rng.randint(9, 21), minute=rng.choice((0, 30)))
+    return start, status
+
+
+def _copy_rows(table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    """Load rows into a PostgreSQL table with COPY."""
+    buffer = StringIO()
+    csv.writer(buffer).writerows(rows)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            buffer.seek(0)
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def _insert_rows(table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    """Insert rows with one prepared multi-row statement."""
+    placeholders = ", ".join(["%s"] * len(columns))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+        )
+
+
+def seed_scale(
+    creators: int,
+    visitors: int,
+    events: int,
+    registrations: int,
+    seed: int = 0,
+    exponent: float = 1.1,
+    batch_size: int = 10000,
+    prefix: str = "seed",
+    log: Optional[Callable[[str], None]] = None,
+) -> SeedResult:
+    """
+    Generate a large, deterministic dataset of users, events and registrations.
+    Users and events are bulk created in batches. Registrations carry explicit
+    timestamps, which bulk_create would overwrite with auto_now_add, so they
+    are loaded with COPY on PostgreSQL and a batched multi-row INSERT
+    elsewhere. Counters and stats rollups are rebuilt at the end; the
+    search index is filled by Event.objects.bulk_create. The same seed always
+    produces the same rows relative to today.
+    Args:
+        creators: Number of event creators.
+        visitors: Number of visitors.
+        events: Number of events.
+        registrations: Number of registrations, at most one per visitor and event.
+        seed: Seed of the random generator.
+        exponent: Power-law exponent of event popularity.
+        batch_size: Rows per INSERT or COPY.
+        prefix: Prefix of generated usernames and emails.
+        log: Optional progress output.
+    Returns:
+        SeedResult: Numbers of rows written.
+    Raises:
+        ValueError: If users with the prefix already exist or counts are invalid.
+    """
+    log = log or (lambda message: None)
+    if events and creators < 1:
+        raise ValueError("Events need at least one creator.")
+    if registrations and (visitors < 1 or events < 1):
+        raise ValueError("Registrations need at least one visitor and one event.")
+    if CustomUser.objects.filter(username__startswith=f"{prefix}_").exists():
+        raise ValueError(f"Users prefixed '{prefix}_' exist already, pick another prefix.")
+
+    rng = random.Random(seed)
+    now = timezone.now().replace(second=0, microsecond=0)
+
+    with transaction.atomic():
+        creator_ids = _create_users(prefix, "creator", creators, batch_size)
+        visitor_ids = _create_users(prefix, "visitor", visitors, batch_size)
+    log(f"Created {len(creator_ids)} creators and {len(visitor_ids)} visitors")
+
+    schedule = [_event_schedule(rng, now) for _ in range(events)]
+
+    def event_objects() -> Iterator[Event]:
+        for index, (start, status) in enumerate(schedule):
+            location = rng.choice(LOCATIONS)
+            yield Event(
+                title=f"{rng.choice(TITLE_WORDS)} {rng.choice(TITLE_KINDS)} {index}",
+                description=f"{prefix} event {index} in {location}",
+                location=location,
+                date=start.date(),
+                start_time=time(start.hour, start.minute),
+                status=status,
+                created_by_id=rng.choice(creator_ids),
+            )
+
+    with transaction.atomic():
+        for batch in _batches(event_objects(), batch_size):
+            Event.objects.bulk_create(batch)
+    event_ids = list(
+        Event.objects.filter(description__startswith=f"{prefix} event ")
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    log(f"Created {len(event_ids)} events")
+
+    counts = popularity(events, registrations, len(visitor_ids), exponent, rng)
+    table = EventRegistration._meta.db_table
+    columns = ("user_id", "event_id", "status", "registered_at", "updated_at")
+    postgres = connection.vendor == "postgresql"
+    adapt = connection.ops.adapt_datetimefield_value
+    window = REGISTRATION_WINDOW_DAYS * 86400
+    # Rows go in raw, with the codes StatusField stores
+    codes = EventRegistration.STATUS_CODES
+
+    def registration_rows() -> Iterator[tuple]:
+        for event_id, (start, status), count in zip(event_ids, schedule, counts):
+            # Registrations close when the event starts or now, whichever is first
+            closes = min(start, now)
+            for user_index in rng.sample(range(len(visitor_ids)), count):
+                registered_at = closes - timedelta(seconds=rng.randrange(window))
+                updated_at = registered_at
+                state = "registered"
+                if status == "cancelled" or rng.random() < REGISTRATION_CANCELLED_RATE:
+                    state = "cancelled"
+                    elapsed = (closes - registered_at).total_seconds()
+                    updated_at += timedelta(seconds=rng.uniform(0, elapsed))
+                if not postgres:
+                    registered_at, updated_at = adapt(registered_at), adapt(updated_at)
+                yield (
+                    visitor_ids[user_index],
+                    event_id,
+                    codes[state],
+                    registered_at,
+                    updated_at,
+                )
+
+    written = 0
+    with transaction.atomic():
+        for batch in _batches(registration_rows(), batch_size):
+            if postgres:
+                _copy_rows(table, columns, batch)
+            else:
+                _insert_rows(table, columns, batch)
+            written += len(batch)
+            log(f"Inserted {written} registrations")
+
+    call_command("reconcile_registration_counts", stdout=StringIO())
+    rebuild_creator_stats()
+    log("Rebuilt registration counters and stats rollups")
+
+    return SeedResult(
+        creators=len(creator_ids),
+        visitors=len(visitor_ids),
+        events=len(event_ids),
+        registrations=written,
+    )
@@ -1,13 +1,40 @@
 from rest_framework import serializers
 from datetime import date as dt_date
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from .models import Event, EventRegistration
 
 
+class EffectiveStatusField(serializers.ChoiceField):
+    """
+    Event status, written to the stored column and read as the status the
+    event has today, see Event.current_status.
+    """
+
+    # Annotation read from .values() rows instead of the stored column
+    values_lookup = "effective_status"
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.setdefault("choices", Event.STATUS_CHOICES)
+        kwargs.setdefault("required", False)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance: Event) -> str:
+        """Return the effective status of instance."""
+        return instance.current_status
+
+
 class EventListSerializer(serializers.ModelSerializer):
     """Serializer for event list view with minimal fields."""
 
     created_by = serializers.ReadOnlyField(source="created_by.username")
+    status = EffectiveStatusField()
+    # Filled from EventQuerySet.with_registration_state annotations
+    is_registered = serializers.BooleanField(read_only=True, default=False)
+    is_waitlisted = serializers.BooleanField(read_only=True, default=False)
+    can_register = serializers.BooleanField(
+        source="user_can_register", read_only=True, default=False
+    )
 
     class Meta:
         model = Event
@@ -18,10 +45,17 @@ class EventListSerializer(serializers.ModelSerializer):
             "location",
             "date",
             "start_time",
+            "starts_at",
+            "duration",
+            "ends_at",
+            "capacity",
             "status",
             "created_by",
             "created_at",
             "updated_at",
+            "is_registered",
+            "is_waitlisted",
+            "can_register",
         ]
 
 
@@ -29,7 +63,16 @@ class EventSerializer(serializers.ModelSerializer):
     """Detailed serializer for event with additional fields."""
 
     created_by = serializers.ReadOnlyField(source="created_by.username")
-    registered_count = serializers.SerializerMethodField()
+    status = EffectiveStatusField()
+    registered_count = serializers.IntegerField(
+        source="registration_count", read_only=True
+    )
+    # Filled from EventQuerySet.with_registration_state annotations
+    is_registered = serializers.BooleanField(read_only=True, default=False)
+    is_waitlisted = serializers.BooleanField(read_only=True, default=False)
+    can_register = serializers.BooleanField(
+        source="user_can_register", read_only=True, default=False
+    )
 
     class Meta:
         model = Event
@@ -40,17 +83,20 @@ class EventSerializer(serializers.ModelSerializer):
             "location",
             "date",
             "start_time",
+            "starts_at",
+            "duration",
+            "ends_at",
+            "capacity",
             "status",
             "created_by",
             "created_at",
             "updated_at",
             "registered_count",
+            "is_registered",
+            "is_waitlisted",
+            "can_register",
         ]
 
-    def get_registered_count(self, obj: Event) -> int:
-        """Get count of users registered for this event."""
-        return obj.registrations.count()  # type: ignore
-
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate event data."""
         event_date = data.get("date")
@@ -78,17 +124,6 @@ class EventRegistrationSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
-    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate registration data to prevent duplicates."""
-        user = self.context["request"].user
-        event = data.get("event")
-
-        if EventRegistration.objects.filter(user=user, event=event).exists():
-            raise serializers.ValidationError(
-                "You are already registered for this event."
-            )
-        return data
-
     def create(self, validated_data: Dict[str, Any]) -> EventRegistration:
         """Create registration with current user."""
         validated_data["user"] = self.context["request"].user
@@ -105,3 +140,84 @@ class MyRegistrationsSerializer(serializers.ModelSerializer):
     class Meta:
         model = EventRegistration
         fields = ["id", "event_title", "event_date", "event_location", "registered_at"]
+
+
+class ValuesSerializer:
+    """
+    Serialize .values() rows exactly like a ModelSerializer would.
+    The field list, sources and date/time formatting are taken from the
+    serializer class once, so each row is a plain dict lookup per column
+    instead of a pass through the DRF field machinery and related instances.
+    """
+
+    __slots__ = ("names", "lookups", "converters")
+
+    # Fields whose representation differs from the value stored in the row
+    CONVERTED_FIELDS = (
+        serializers.DateTimeField,
+        serializers.DateField,
+        serializers.TimeField,
+        serializers.DurationField,
+        serializers.DecimalField,
+    )
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer]) -> None:
+        """
+        Read the readable fields of a serializer class.
+        Args:
+            serializer_class: ModelSerializer whose output is reproduced.
+        Raises:
+            ValueError: If a field has no plain attribute source.
+        """
+        self.names: List[str] = []
+        self.lookups: List[str] = []
+        self.converters: List[Optional[Callable[[Any], Any]]] = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or isinstance(
+                field, serializers.SerializerMethodField
+            ):
+                raise ValueError(f"Field '{name}' cannot be read from .values() rows.")
+            self.names.append(name)
+            self.lookups.append(
+                getattr(field, "values_lookup", None) or field.source.replace(".", "__")
+            )
+            converter = field.to_representation
+            self.converters.append(
+                converter if isinstance(field, self.CONVERTED_FIELDS) else None
+            )
+
+    def to_representation(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build the serialized list from .values() rows.
+        Args:
+            rows: Rows queried with values(*self.lookups).
+        Returns:
+            List[Dict[str, Any]]: Serialized rows in serializer field order.
+        """
+        columns = list(zip(self.names, self.lookups, self.converters))
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, converter in columns:
+                value = row[lookup]
+                if converter is not None and value is not None:
+                    value = converter(value)
+                item[name] = value
+            data.append(item)
+        return data
+
+
+@lru_cache(maxsize=None)
+def values_serializer(
+    serializer_class: type[serializers.ModelSerializer],
+) -> ValuesSerializer:
+    """
+    Return the cached ValuesSerializer of a serializer class.
+    Args:
+        serializer_class: ModelSerializer whose output is reproduced.
+    Returns:
+        ValuesSerializer: Serializer for .values() rows.
+    """
+    return ValuesSerializer(serializer_class)
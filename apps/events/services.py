@@ -0,0 +1,443 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .cache import invalidate_events
+from .models import Event, EventRegistration, start_of_today
+from .stats import record_event_changes, record_registration_changes, transition
+
+# Outcomes of register_user
+REGISTERED = "registered"
+REACTIVATED = "reactivated"
+WAITLISTED = "waitlisted"
+ALREADY_REGISTERED = "already_registered"
+NOT_ELIGIBLE = "not_eligible"
+
+# Conditional upsert: the SELECT only yields a row for a registrable event and
+# the DO UPDATE only fires for a cancelled registration, so one statement
+# creates, re-activates or does nothing. registered_at = updated_at tells a new
+# row apart from a re-activated one.
+UPSERT_SQL = """
+    INSERT INTO {registration} (user_id, event_id, status, registered_at, updated_at)
+    SELECT %s, {event}.id, %s, %s, %s
+    FROM {event}
+    WHERE {event}.id = %s AND {event}.status = %s AND {event}.starts_at >= %s
+    ON CONFLICT (user_id, event_id) DO UPDATE
+    SET status = excluded.status, updated_at = excluded.updated_at
+    WHERE {registration}.status = %s
+    RETURNING id, user_id, event_id, status, registered_at, updated_at
+"""
+
+# Chunked cancellation: each statement cancels up to a batch of one status and
+# returns the ids of the cancelled registrations and their users
+CANCEL_SQL = """
+    UPDATE {registration} SET status = %s, updated_at = %s
+    WHERE status = %s AND id IN (
+        SELECT id FROM {registration}
+        WHERE event_id = %s AND status = %s
+        ORDER BY id
+        LIMIT %s
+    )
+    RETURNING id, user_id
+"""
+# Registrations cancelled per UPDATE when an event is cancelled
+CANCEL_BATCH_SIZE = 5000
+# Events completed per UPDATE by complete_past_events
+COMPLETE_BATCH_SIZE = 1000
+
+
+@dataclass
+class RegistrationResult:
+    """Outcome of a registration attempt with a message for the user."""
+
+    outcome: str
+    message: str
+    registration: Optional[EventRegistration] = None
+
+    @property
+    def success(self) -> bool:
+        """Check if the user holds an active registration created by this call."""
+        return self.outcome in (REGISTERED, REACTIVATED)
+
+
+def _supports_returning() -> bool:
+    """
+    Check if the database runs the ON CONFLICT and RETURNING statements above.
+    PostgreSQL does, SQLite only from 3.35 while Django accepts older
+    versions; everything else takes the ORM paths.
+    Returns:
+        bool: True on PostgreSQL and on SQLite with RETURNING.
+    """
+    return (
+        connection.vendor in ("postgresql", "sqlite")
+        and connection.features.can_return_columns_from_insert
+    )
+
+
+def allocate_seat(event: Event) -> bool:
+    """
+    Take one seat of a registrable event with a single conditional UPDATE.
+    The capacity check and the increment happen in the same statement, so
+    concurrent registrants can never oversell the event.
+    Args:
+        event: The event to take a seat of.
+    Returns:
+        bool: True if a seat was taken, False if the event is full or closed.
+    """
+    seated = (
+        Event.objects.filter(
+            pk=event.pk, status="published", starts_at__gte=start_of_today()
+        )
+        .filter(Q(capacity__isnull=True) | Q(registration_count__lt=F("capacity")))
+        .update(registration_count=F("registration_count") + 1)
+    )
+    if seated:
+        invalidate_events([event.pk])
+    return bool(seated)
+
+
+def register_user(user, event: Event) -> RegistrationResult:
+    """
+    Register a user for an event, re-activating a cancelled registration.
+    On PostgreSQL and SQLite 3.35+ a conditional UPDATE first takes a seat, then one
+    conditional INSERT ... ON CONFLICT DO UPDATE guarded by the event status
+    and date writes the registration, both in one short transaction together
+    with the stats rollup. Without
+    a free seat the user joins the FIFO waitlist instead. Eligibility is only
+    looked up in detail when the upsert did not write a row.
+    Args:
+        user: The user registering.
+        event: The event to register for.
+    Returns:
+        RegistrationResult: Registered, re-activated, waitlisted, already
+        registered or not eligible.
+    """
+    if not user.is_authenticated:
+        return RegistrationResult(NOT_ELIGIBLE, "User must be logged in to register.")
+    if not user.can_register_for_events():
+        return RegistrationResult(NOT_ELIGIBLE, "Only visitors can register for events.")
+
+    if not _supports_returning():
+        return _register_with_orm(user, event)
+
+    now = timezone.now()
+    sql = UPSERT_SQL.format(
+        registration=connection.ops.quote_name(EventRegistration._meta.db_table),
+        event=connection.ops.quote_name(Event._meta.db_table),
+    )
+
+    with transaction.atomic():
+        seated = allocate_seat(event)
+        # Raw SQL bypasses StatusField, pass the stored codes
+        codes = EventRegistration.STATUS_CODES
+        params = [
+            user.pk,
+            codes["registered" if seated else "waitlisted"],
+            connection.ops.adapt_datetimefield_value(now),
+            connection.ops.adapt_datetimefield_value(now),
+            event.pk,
+            Event.STATUS_CODES["published"],
+            connection.ops.adapt_datetimefield_value(start_of_today()),
+            codes["cancelled"],
+        ]
+        rows = list(EventRegistration.objects.raw(sql, params))
+        if rows:
+            row = rows[0]
+            # A new row or a re-activated cancelled one
+            previous = None if row.registered_at == row.updated_at else "cancelled"
+            record_registration_changes(
+                event.pk, event.created_by_id, transition(previous, row.status)
+            )
+        elif seated:
+            # Nothing was written, give the seat back
+            transaction.set_rollback(True)
+
+    if not rows:
+        return _explain_rejection(user, event)
+
+    registration = rows[0]
+    registration.user = user
+    registration.event = event
+    if not seated:
+        return RegistrationResult(
+            WAITLISTED,
+            "Event is full. You have been added to the waitlist.",
+            registration,
+        )
+
+    event.registration_count += 1
+    if registration.registered_at == registration.updated_at:
+        return RegistrationResult(REGISTERED, "Successfully registered!", registration)
+    return RegistrationResult(
+        REACTIVATED, "You have re-registered for this event.", registration
+    )
+
+
+def _explain_rejection(user, event: Event) -> RegistrationResult:
+    """
+    Work out why the upsert did not register the user.
+    Args:
+        user: The user registering.
+        event: The event to register for.
+    Returns:
+        RegistrationResult: Already registered or not eligible with a reason.
+    """
+    event.refresh_from_db(fields=["status", "date", "registration_count"])
+    if EventRegistration.objects.filter(
+        user=user, event=event, status="waitlisted"
+    ).exists():
+        return RegistrationResult(
+            ALREADY_REGISTERED, "You are already on the waitlist for this event."
+        )
+
+    can_register, reason = event.can_register(user)
+    if can_register:
+        # Lost a race with a concurrent status change
+        return RegistrationResult(
+            NOT_ELIGIBLE, "Event is not available for registration."
+        )
+    if reason == "Already registered for this event.":
+        return RegistrationResult(
+            ALREADY_REGISTERED, "You are already registered for this event."
+        )
+    return RegistrationResult(NOT_ELIGIBLE, reason)
+
+
+def _register_with_orm(user, event: Event) -> RegistrationResult:
+    """
+    Register through the model layer on databases without ON CONFLICT ... RETURNING.
+    Args:
+        user: The user registering.
+        event: The event to register for.
+    Returns:
+        RegistrationResult: Outcome of the registration attempt.
+    """
+    try:
+        with transaction.atomic():
+            # Serialise registrants of this event on the event row
+            Event.objects.select_for_update().filter(pk=event.pk).first()
+            event.refresh_from_db(fields=["registration_count", "capacity"])
+            registration = (
+                EventRegistration.objects.select_for_update()
+                .filter(user=user, event=event)
+                .first()
+            )
+            if registration is not None and registration.status != "cancelled":
+                return _explain_rejection(user, event)
+
+            status = "waitlisted" if event.is_full else "registered"
+            if registration is None:
+                registration = EventRegistration.objects.create(
+                    user=user, event=event, status=status
+                )
+                outcome = REGISTERED
+            else:
+                registration.status = status
+                registration.save()
+                outcome = REACTIVATED
+    except ValidationError as e:
+        return RegistrationResult(NOT_ELIGIBLE, " ".join(e.messages))
+
+    if status == "waitlisted":
+        return RegistrationResult(
+            WAITLISTED, "Event is full. You have been added to the waitlist.", registration
+        )
+    if outcome == REGISTERED:
+        return RegistrationResult(REGISTERED, "Successfully registered!", registration)
+    return RegistrationResult(
+        REACTIVATED, "You have re-registered for this event.", registration
+    )
+
+
+@dataclass
+class CancellationResult:
+    """Numbers of registrations released by cancel_event."""
+
+    cancelled: int
+    dropped: int
+
+
+def cancel_event(
+    event: Event,
+    user,
+    notify: Optional[Callable[[Event, List[Tuple[int, int]]], None]] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    batch_size: int = CANCEL_BATCH_SIZE,
+) -> CancellationResult:
+    """
+    Cancel an event and all of its registrations in one transaction.
+    The event row is locked and updated without loading or validating the
+    model. Registrations are cancelled in chunked UPDATEs that return the
+    affected ids, so no statement holds locks on more than batch_size rows
+    and the registrations never go through Python objects. notify receives
+    each chunk of cancelled active registrations inside the transaction,
+    so notifications queued to the outbox commit with the cancellation.
+    Args:
+        event: The event to cancel.
+        user: The user cancelling, who must be the event creator.
+        notify: Called with the event and (registration id, user id) pairs.
+        progress: Called after every chunk with the registrations cancelled so far.
+        batch_size: Registrations cancelled per UPDATE.
+    Returns:
+        CancellationResult: Cancelled active and waitlisted registrations.
+    Raises:
+        PermissionError: If user is not the event creator.
+        ValueError: If the event is not published.
+    """
+    if event.created_by_id != user.pk:
+        raise PermissionError("Only the event creator can cancel this event.")
+
+    now = timezone.now()
+    with transaction.atomic():
+        # The locked row decides, the loaded instance may be stale
+        status = (
+            Event.objects.select_for_update()
+            .filter(pk=event.pk)
+            .values_list("status", flat=True)
+            .first()
+        )
+        if status == "cancelled":
+            raise ValueError("Event is already cancelled.")
+        if status != "published":
+            raise ValueError("Only published events can be cancelled.")
+
+        Event.objects.filter(pk=event.pk).update(
+            status="cancelled", registration_count=0, updated_at=now
+        )
+        record_event_changes(event.created_by_id, transition(status, "cancelled"))
+
+        done = 0
+        counts = {}
+        for previous in ("registered", "waitlisted"):
+            counts[previous] = 0
+            while True:
+                rows = _cancel_registrations(event, previous, now, batch_size)
+                if not rows:
+                    break
+                counts[previous] += len(rows)
+                done += len(rows)
+                if notify is not None and previous == "registered":
+                    notify(event, rows)
+                if progress is not None:
+                    progress(done)
+                if len(rows) < batch_size:
+                    break
+
+        record_registration_changes(
+            event.pk,
+            event.created_by_id,
+            {
+                "registered": -counts["registered"],
+                "waitlisted": -counts["waitlisted"],
+                "cancelled": done,
+            },
+        )
+
+    invalidate_events([event.pk])
+    event.status = "cancelled"
+    event.registration_count = 0
+    event.updated_at = now
+    event._take_snapshot(["status", "updated_at"])
+    return CancellationResult(
+        cancelled=counts["registered"], dropped=counts["waitlisted"]
+    )
+
+
+def _cancel_registrations(
+    event: Event, status: str, now, batch_size: int
+) -> List[Tuple[int, int]]:
+    """
+    Cancel one chunk of an event's registrations with the given status.
+    Uses UPDATE ... RETURNING on PostgreSQL and SQLite 3.35+, and a locking
+    SELECT of the chunk followed by an UPDATE elsewhere.
+    Args:
+        event: The cancelled event.
+        status: Status of the registrations to cancel.
+        now: Timestamp of the cancellation.
+        batch_size: Most registrations cancelled.
+    Returns:
+        List[Tuple[int, int]]: (registration id, user id) of every cancelled row.
+    """
+    if _supports_returning():
+        sql = CANCEL_SQL.format(
+            registration=connection.ops.quote_name(EventRegistration._meta.db_table)
+        )
+        codes = EventRegistration.STATUS_CODES
+        params = [
+            codes["cancelled"],
+            connection.ops.adapt_datetimefield_value(now),
+            codes[status],
+            event.pk,
+            codes[status],
+            batch_size,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [tuple(row) for row in cursor.fetchall()]
+
+    rows = list(
+        EventRegistration.objects.select_for_update()
+        .filter(event=event, status=status)
+        .order_by("id")
+        .values_list("id", "user_id")[:batch_size]
+    )
+    EventRegistration.objects.filter(pk__in=[pk for pk, _ in rows]).update(
+        status="cancelled", updated_at=now
+    )
+    return rows
+
+
+def complete_past_events(
+    batch_size: int = COMPLETE_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Move published events dated before today to 'completed' in chunks.
+    Each chunk is locked, updated with one UPDATE and counted in the stats
+    rollup in its own transaction, without loading or validating models.
+    Readers that must be right between sweeps use Event.objects.with_status
+    or with_effective_status instead of the stored column.
+    Args:
+        batch_size: Events completed per UPDATE.
+        progress: Called after every chunk with the events completed so far.
+    Returns:
+        int: Number of completed events.
+    """
+    now = timezone.now()
+    done = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Event.objects.select_for_update()
+                .filter(status="published", starts_at__lt=start_of_today())
+                .order_by("pk")
+                .values_list("pk", "created_by_id")[:batch_size]
+            )
+            if not rows:
+                return done
+            event_ids = [pk for pk, _ in rows]
+            Event.objects.filter(pk__in=event_ids).update(
+                status="completed", updated_at=now
+            )
+            per_creator = (
+                Event.objects.filter(pk__in=event_ids)
+                .order_by()
+                .values("created_by_id")
+                .annotate(events=Count("pk"))
+            )
+            for row in per_creator:
+                record_event_changes(
+                    row["created_by_id"],
+                    transition("published", "completed", row["events"]),
+                )
+
+        invalidate_events(event_ids)
+        done += len(rows)
+        if progress is not None:
+            progress(done)
+        if len(rows) < batch_size:
+            return done
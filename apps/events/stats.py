@@ -0,0 +1,234 @@
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+# Rollup column counting events or registrations in each status
+EVENT_COUNTERS: Dict[str, str] = {
+    "published": "active_events",
+    "completed": "completed_events",
+    "cancelled": "cancelled_events",
+}
+REGISTRATION_COUNTERS: Dict[str, str] = {
+    "registered": "active_registrations",
+    "waitlisted": "waitlisted_registrations",
+    "cancelled": "cancelled_registrations",
+}
+
+
+def transition(
+    previous: Optional[str], current: Optional[str], count: int = 1
+) -> Dict[str, int]:
+    """
+    Return per-status deltas of count rows moving from previous to current.
+    Args:
+        previous: Status before the change, None for new rows.
+        current: Status after the change, None for deleted rows.
+        count: Number of rows making the transition.
+    Returns:
+        Dict[str, int]: Delta per status, empty if nothing changed.
+    """
+    if previous == current or not count:
+        return {}
+    deltas: Dict[str, int] = {}
+    if previous is not None:
+        deltas[previous] = -count
+    if current is not None:
+        deltas[current] = count
+    return deltas
+
+
+def _increments(counters: Dict[str, str], deltas: Dict[str, int]) -> dict:
+    """Map status deltas onto F() increments of the rollup columns."""
+    return {
+        counters[status]: F(counters[status]) + delta
+        for status, delta in deltas.items()
+        if delta and status in counters
+    }
+
+
+def record_event_changes(creator_id: Optional[int], deltas: Dict[str, int]) -> None:
+    """
+    Apply event status deltas to the creator's rollup row.
+    Args:
+        creator_id: Primary key of the event creator.
+        deltas: Delta per event status, see transition.
+    """
+    from .models import CreatorStats
+
+    increments = _increments(EVENT_COUNTERS, deltas)
+    if creator_id is None or not increments:
+        return
+    CreatorStats.objects.filter(pk=creator_id).update(**increments)
+
+
+def record_registration_changes(
+    event_id: int, creator_id: Optional[int], deltas: Dict[str, int]
+) -> None:
+    """
+    Apply registration status deltas to the event and creator rollup rows.
+    Args:
+        event_id: Primary key of the event registered for.
+        creator_id: Primary key of the event creator.
+        deltas: Delta per registration status, see transition.
+    """
+    from .models import CreatorStats, EventStats
+
+    increments = _increments(REGISTRATION_COUNTERS, deltas)
+    if not increments:
+        return
+    EventStats.objects.filter(pk=event_id).update(**increments)
+    if creator_id is not None:
+        CreatorStats.objects.filter(pk=creator_id).update(**increments)
+
+
+def add_events(events: Iterable) -> None:
+    """
+    Create the rollup rows of newly inserted events and count them.
+    Args:
+        events: Saved events without registrations.
+    """
+    from .models import CreatorStats, EventStats
+
+    events = [event for event in events if event.pk is not None]
+    if not events:
+        return
+    EventStats.objects.bulk_create(
+        [EventStats(event_id=event.pk) for event in events], ignore_conflicts=True
+    )
+
+    per_creator: Dict[int, Dict[str, int]] = {}
+    for event in events:
+        if event.created_by_id is not None:
+            deltas = per_creator.setdefault(event.created_by_id, {})
+            deltas[event.status] = deltas.get(event.status, 0) + 1
+    CreatorStats.objects.bulk_create(
+        [CreatorStats(creator_id=creator_id) for creator_id in per_creator],
+        ignore_conflicts=True,
+    )
+    for creator_id, deltas in per_creator.items():
+        record_event_changes(creator_id, deltas)
+
+
+def remove_events(queryset) -> None:
+    """
+    Subtract events about to be deleted, with their registrations, from the
+    creator rollups. Event rollup rows are deleted along with the events.
+    Args:
+        queryset: Events about to be deleted.
+    """
+    from .models import CreatorStats
+
+    aggregates = {
+        f"{status}_events": Count("pk", filter=Q(status=status))
+        for status in EVENT_COUNTERS
+    }
+    for column in REGISTRATION_COUNTERS.values():
+        aggregates[column] = Sum(f"stats__{column}")
+    rows = (
+        queryset.filter(created_by__isnull=False)
+        .order_by()
+        .values("created_by")
+        .annotate(**aggregates)
+    )
+    for row in rows:
+        increments = {
+            column: F(column) - row[f"{status}_events"]
+            for status, column in EVENT_COUNTERS.items()
+            if row[f"{status}_events"]
+        }
+        increments.update(
+            {
+                column: F(column) - row[column]
+                for column in REGISTRATION_COUNTERS.values()
+                if row[column]
+            }
+        )
+        if increments:
+            CreatorStats.objects.filter(pk=row["created_by"]).update(**increments)
+
+
+def _count(queryset, outer: str, **filters):
+    """Return a correlated COUNT subquery of queryset rows matching OuterRef('pk')."""
+    subquery = (
+        queryset.filter(**{outer: OuterRef("pk")}, **filters)
+        .order_by()
+        .values(outer)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+
+def rebuild_creator_stats(chunk_size: int = 1000) -> int:
+    """
+    Recompute every event and creator rollup row from the source tables.
+    Events and then users are processed in primary key chunks. Counts are
+    computed inside each UPDATE so concurrent changes are never lost.
+    Args:
+        chunk_size: Number of events or users per batch.
+    Returns:
+        int: Number of creator rollup rows written.
+    """
+    from apps.users.models import CustomUser
+
+    from .models import CreatorStats, Event, EventRegistration, EventStats
+
+    last_pk = 0
+    while True:
+        event_ids = list(
+            Event.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not event_ids:
+            break
+        EventStats.objects.bulk_create(
+            [EventStats(event_id=pk) for pk in event_ids], ignore_conflicts=True
+        )
+        EventStats.objects.filter(pk__in=event_ids).update(
+            **{
+                column: _count(EventRegistration.objects, "event", status=status)
+                for status, column in REGISTRATION_COUNTERS.items()
+            }
+        )
+        last_pk = event_ids[-1]
+
+    last_pk = 0
+    written = 0
+    while True:
+        user_ids = list(
+            CustomUser.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not user_ids:
+            break
+        creator_ids = set(
+            Event.objects.filter(created_by__in=user_ids)
+            .order_by()
+            .values_list("created_by", flat=True)
+            .distinct()
+        )
+        # Users without events keep no rollup row
+        CreatorStats.objects.filter(pk__in=user_ids).exclude(
+            pk__in=creator_ids
+        ).delete()
+        CreatorStats.objects.bulk_create(
+            [CreatorStats(creator_id=pk) for pk in creator_ids], ignore_conflicts=True
+        )
+        counts = {
+            column: _count(Event.objects, "created_by", status=status)
+            for status, column in EVENT_COUNTERS.items()
+        }
+        counts.update(
+            {
+                column: _count(
+                    EventRegistration.objects, "event__created_by", status=status
+                )
+                for status, column in REGISTRATION_COUNTERS.items()
+            }
+        )
+        written += CreatorStats.objects.filter(pk__in=creator_ids).update(**counts)
+        last_pk = user_ids[-1]
+    return written
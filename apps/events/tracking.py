@@ -0,0 +1,150 @@
+from typing import Any, Dict, Iterable, Optional
+from django.db import models
+
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Abstract model that snapshots field values when loaded from the database.
+
+    The snapshot lets a model know its previous values without a SELECT,
+    restricts saves of existing rows to the changed columns and turns a
+    save with no changes into a no-op.
+    """
+
+    # Columns maintained only through F() updates: never tracked or saved
+    COUNTER_FIELDS: tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Build an instance from a database row and snapshot its loaded values.
+        Args:
+            db: Database alias the row was loaded from.
+            field_names: Names of the loaded fields.
+            values: Loaded values in field order.
+        Returns:
+            Model instance with a fresh snapshot.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        """
+        Reload field values and snapshot the refreshed fields.
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().refresh_from_db(*args, **kwargs)
+        self._take_snapshot(kwargs.get("fields"))
+
+    def _tracked_fields(self) -> Iterable[models.Field]:
+        """Yield concrete, non-primary key fields that are subject to tracking."""
+        for field in self._meta.concrete_fields:
+            if not field.primary_key and field.name not in self.COUNTER_FIELDS:
+                yield field
+
+    def _take_snapshot(self, field_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Remember the current values as the stored state of the row.
+        Args:
+            field_names: Limit the snapshot to these fields (default: all loaded).
+        """
+        snapshot: Dict[str, Any] = getattr(self, "_loaded_values", None) or {}
+        names = set(field_names) if field_names is not None else None
+        for field in self._tracked_fields():
+            if names is not None and field.name not in names and field.attname not in names:
+                continue
+            # Deferred fields are not loaded, so there is nothing to remember
+            if field.attname in self.__dict__:
+                snapshot[field.attname] = getattr(self, field.attname)
+        self._loaded_values = snapshot
+
+    @property
+    def has_snapshot(self) -> bool:
+        """
+        Check if the instance knows the stored state of its row.
+        Returns:
+            bool: True if the instance was loaded or saved through the ORM.
+        """
+        return not self._state.adding and getattr(self, "_loaded_values", None) is not None
+
+    def get_dirty_fields(self) -> Dict[str, Any]:
+        """
+        Return fields changed since the instance was loaded or last saved.
+        Returns:
+            Dict[str, Any]: Mapping of field name to its previously stored value.
+        """
+        if not self.has_snapshot:
+            return {}
+
+        dirty: Dict[str, Any] = {}
+        for field in self._tracked_fields():
+            if field.attname not in self.__dict__:
+                continue
+            value = getattr(self, field.attname)
+            # Newly assigned files are not committed to storage yet
+            if getattr(value, "_committed", True) is False:
+                dirty[field.name] = self._loaded_values.get(field.attname)
+            elif field.attname not in self._loaded_values:
+                dirty[field.name] = None
+            elif value != self._loaded_values[field.attname]:
+                dirty[field.name] = self._loaded_values[field.attname]
+        return dirty
+
+    def is_dirty(self) -> bool:
+        """
+        Check if the instance needs to be written to the database.
+        Returns:
+            bool: True for new rows, untracked rows or rows with changed fields.
+        """
+        return not self.has_snapshot or bool(self.get_dirty_fields())
+
+    def get_previous_value(self, field_name: str) -> Any:
+        """
+        Return the stored value of a field before local changes.
+        Falls back to a single-column query when no snapshot is available.
+        Args:
+            field_name: Name of the field to look up.
+        Returns:
+            Any: Stored value, or None for rows that are not saved yet.
+        """
+        if self._state.adding or self.pk is None:
+            return None
+
+        attname = self._meta.get_field(field_name).attname
+        if self.has_snapshot and attname in self._loaded_values:
+            return self._loaded_values[attname]
+
+        return (
+            type(self)
+            ._base_manager.filter(pk=self.pk)
+            .values_list(attname, flat=True)
+            .first()
+        )
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save only changed columns of tracked rows and skip saves with no changes.
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        if kwargs.get("update_fields") is None and self.has_snapshot:
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            # auto_now columns are set in pre_save, so they must be written too
+            auto_now = [
+                field.name
+                for field in self._tracked_fields()
+                if getattr(field, "auto_now", False)
+            ]
+            kwargs["update_fields"] = list(dict.fromkeys([*dirty, *auto_now]))
+
+        super().save(*args, **kwargs)
+        self._take_snapshot(kwargs.get("update_fields"))
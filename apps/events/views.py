@@ -1,14 +1,35 @@
 import csv
-from typing import Union, List, Optional, TYPE_CHECKING, cast
+import zlib
+from datetime import datetime
+from functools import partial
+from typing import Iterable, Iterator, Union, List, Optional, TYPE_CHECKING, cast
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q, QuerySet
-from django.http import Http404, HttpRequest, HttpResponse, HttpResponseRedirect
+from django.db.models import QuerySet
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, redirect, get_object_or_404
+from django.utils.dateparse import parse_date
 
 from .models import Event, EventRegistration
+from .cache import event_version_key, get_cached_event
+from .conditional import (
+    build_validators,
+    conditional_response,
+    probe,
+    user_registration_probe,
+)
 from .forms import EventForm
+from .pagination import InvalidCursor, KeysetPage, paginate_keyset
+from .search import search_events
+from .services import ALREADY_REGISTERED, WAITLISTED, register_user
+from .services import cancel_event as cancel_event_service
 from apps.users.views import (
     send_event_registration_email,
     send_event_cancellation_emails,
@@ -17,6 +38,26 @@ from apps.users.views import (
 if TYPE_CHECKING:
     from apps.users.models import CustomUser
 
+# Rows fetched from the database and written per chunk in CSV exports
+CSV_BATCH_SIZE = 2000
+
+
+def get_keyset_page(request: HttpRequest, queryset: QuerySet) -> KeysetPage:
+    """
+    Return the keyset page of queryset selected by the 'cursor' GET parameter.
+    Args:
+        request: The HTTP request object.
+        queryset: Ordered queryset to paginate.
+    Returns:
+        KeysetPage: Rows of the requested page with cursors to its neighbours.
+    Raises:
+        Http404: If the cursor is invalid.
+    """
+    try:
+        return paginate_keyset(queryset, cursor=request.GET.get("cursor"))
+    except InvalidCursor:
+        raise Http404("Invalid page.")
+
 
 @login_required
 def new_event(request: HttpRequest) -> HttpResponse:
@@ -66,9 +107,11 @@ def my_events(request: HttpRequest) -> HttpResponse:
     if not hasattr(user, "is_creator") or not user.is_creator:
         raise Http404("You are not allowed to view these events.")
 
-    # Get user's events
-    events: QuerySet[Event] = Event.objects.filter(created_by=request.user)
-    return render(request, "events/my_events.html", {"events": events})
+    # Get one page of user's events
+    page = get_keyset_page(request, Event.objects.filter(created_by=request.user))
+    return render(
+        request, "events/my_events.html", {"events": page.items, "page": page}
+    )
 
 
 @login_required
@@ -88,34 +131,74 @@ def event_details(
     Raises:
         Http404: If an event doesn't exist or user lacks permission to view it.
     """
-    event: Event = get_object_or_404(Event, id=event_id)
+    # Shared event data comes from the versioned cache, per-user state is queried
+    event: Optional[Event] = get_cached_event(event_id)
+    if event is None:
+        raise Http404("No Event matches the given query.")
 
     # Creators can only see their own events
     user = cast("CustomUser", request.user)
     if (
         hasattr(user, "is_creator")
         and user.is_creator
-        and event.created_by != request.user
+        and event.created_by_id != user.pk
     ):
         raise Http404("You are not allowed to view this event details.")
 
+    # Validators come from a MAX(updated_at) probe, so 304s skip rendering
+    validators = build_validators(
+        request,
+        probe(Event.objects.filter(pk=event_id)),
+        sorted(user_registration_probe(user).items()),
+        request.META.get("CSRF_COOKIE"),
+        version_keys=[event_version_key(event_id)],
+    )
+    # Pages carrying one-off flash messages are always rendered in full
+    if len(messages.get_messages(request)):
+        return _render_event_details(request, event, user)
+    return conditional_response(
+        request, validators, lambda: _render_event_details(request, event, user)
+    )
+
+
+def _render_event_details(
+    request: HttpRequest, event: Event, user: "CustomUser"
+) -> HttpResponse:
+    """
+    Render the event details page with the user's registration state.
+    Args:
+        request: The HTTP request object.
+        event: The event to display.
+        user: The viewing user.
+    Returns:
+        HttpResponse: Rendered template with event details.
+    """
+    # Only visitors can hold registrations
+    registration: Optional[EventRegistration] = None
+    if user.can_register_for_events():
+        registration = event.registrations.filter(  # type: ignore
+            user=user, status__in=EventRegistration.ACTIVE_STATUSES
+        ).first()
+    is_registered: bool = registration is not None
+
+    # Let can_register reuse the lookup above instead of querying again
+    event.registration_state_user_id = user.pk  # type: ignore[attr-defined]
+    event.is_registered = is_registered  # type: ignore[attr-defined]
+
     # Check if a visitor can register for event
     can_register: bool
     message: str
     can_register, message = event.can_register(request.user)
 
-    registration: Optional[EventRegistration] = None
-    if hasattr(event, "registrations"):
-        registration = event.registrations.filter(user=request.user, status="registered").first()  # type: ignore
-
-    is_registered = registration is not None
-
     context = {
         "event": event,
         "can_register": can_register,
         "register_message": message,
         "registration": registration,
         "is_registered": is_registered,
+        "is_waitlisted": (
+            registration is not None and registration.status == "waitlisted"
+        ),
     }
     return render(request, "events/event_details.html", context)
 
@@ -162,17 +245,85 @@ def edit_event(
     return render(request, "events/edit_event.html", context)
 
 
+class _EchoBuffer:
+    """File-like object whose write() returns the value instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _format_registered_at(value: datetime) -> str:
+    """Format a registration timestamp as 'HH:MM DD-MM-YYYY' without strftime."""
+    return (
+        f"{value.hour:02d}:{value.minute:02d} "
+        f"{value.day:02d}-{value.month:02d}-{value.year}"
+    )
+
+
+def _iter_registrations_csv(
+    registrations: QuerySet[EventRegistration], batch_size: int = CSV_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Yield CSV text for registrations in batches of rows.
+    The header is yielded before the query runs, so the first byte goes out
+    immediately. Rows are read through a chunked values_list iterator, keeping
+    memory flat regardless of the number of registrations.
+    Args:
+        registrations: Registrations to export.
+        batch_size: Number of rows fetched and emitted per chunk.
+    Yields:
+        str: CSV encoded chunks.
+    """
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(["Username", "Email", "Registered at"])
+
+    rows = registrations.values_list(
+        "user__username", "user__email", "registered_at"
+    ).iterator(chunk_size=batch_size)
+
+    batch: List[str] = []
+    for username, email, registered_at in rows:
+        batch.append(
+            writer.writerow([username, email, _format_registered_at(registered_at)])
+        )
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+def _gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """
+    Gzip-compress a stream of text chunks incrementally.
+    Args:
+        chunks: Text chunks to compress.
+    Yields:
+        bytes: Compressed data as it becomes available.
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 @login_required
 def export_registrations_csv(
     request: HttpRequest, event_id: int
-) -> Union[HttpResponseRedirect, HttpResponse]:
+) -> Union[HttpResponseRedirect, StreamingHttpResponse]:
     """
-    Export all visitor registrations data for one event in CSV format.
+    Export visitor registrations data for one event in CSV format.
+    The file is streamed in chunks, so memory stays flat for large events.
+    Query parameters:
+        status: 'registered' for active registrations only, 'all' (default) for every row.
+        gzip: '1' to download a gzip-compressed file.
     Args:
         request: The HTTP request object.
         event_id: The ID of the event to export registrations for.
     Returns:
-        HttpResponse: CSV file download response.
+        StreamingHttpResponse: CSV file download response.
     Raises:
         Http404: If event doesn't exist or user lacks permission to export.
     """
@@ -186,29 +337,22 @@ def export_registrations_csv(
     ):
         raise Http404("You are not allowed to export this event.")
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = (
-        f'attachment; filename="event_{event_id}_registrations.csv"'
-    )
-
-    writer = csv.writer(response)
-    writer.writerow(["Username", "Email", "Registered at"])
-
-    registrations: QuerySet[EventRegistration]
-    if hasattr(event, "registrations"):
-        registrations = event.registrations.select_related("user").all()  # type: ignore
-    else:
-        registrations = EventRegistration.objects.none()
-
-    for registration in registrations:
-        writer.writerow(
-            [
-                registration.user.username,
-                registration.user.email,
-                registration.registered_at.strftime("%H:%M %d-%m-%Y"),
-            ]
-        )
-
+    registrations: QuerySet[EventRegistration] = EventRegistration.objects.filter(
+        event=event
+    ).order_by("-registered_at", "id")
+    if request.GET.get("status", "all") == "registered":
+        registrations = registrations.filter(status="registered")
+
+    filename = f"event_{event_id}_registrations.csv"
+    content: Iterator = _iter_registrations_csv(registrations)
+    content_type = "text/csv"
+    if request.GET.get("gzip") == "1":
+        content = _gzip_stream(content)
+        content_type = "application/gzip"
+        filename += ".gz"
+
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
@@ -230,22 +374,13 @@ def cancel_event(
 
     if request.method == "POST":
         try:
-            # Freeze QuerySet to avoid changes after event cancellation
-            registrations: List[EventRegistration] = []
-            if hasattr(event, "registrations"):
-                registrations = list(event.registrations.filter(status="registered"))  # type: ignore
-
-            print(f"All registrations before cancelling: {registrations}")
-            print(f"Count: {len(registrations)}")
-
-            # Cancel the event
-            event.cancel_event(request.user)
-
-            # Send cancellation emails to all registered users
-            if registrations:
-                print("Sending cancellation emails...")  # Debug
-                send_event_cancellation_emails(request, event, registrations)
-
+            # Cancellation emails are queued to the outbox chunk by chunk,
+            # in the same transaction as the cancellation
+            cancel_event_service(
+                event,
+                request.user,
+                notify=partial(send_event_cancellation_emails, request),
+            )
             messages.success(request, "Event cancelled successfully.")
             return redirect("events:my_events")
         except (PermissionError, ValueError) as e:
@@ -268,24 +403,34 @@ def browse_events(request: HttpRequest) -> HttpResponse:
     search_query: str = request.GET.get("q", "")
     event_date: str = request.GET.get("date", "")
 
-    events: QuerySet[Event] = Event.objects.filter(status=status).order_by(
-        "date", "start_time"
+    events: QuerySet[Event] = (
+        Event.objects.with_status(status)
+        .with_effective_status()
+        .with_registration_state(request.user)
+        .order_by("starts_at")
     )
 
     if search_query:
-        events = events.filter(Q(title__icontains=search_query))
+        # Full-text index lookup, most relevant events first
+        events = search_events(events, search_query).order_by(
+            "-search_rank", "starts_at"
+        )
     if event_date:
-        events = events.filter(date=event_date)
+        try:
+            day = parse_date(event_date)
+        except ValueError:
+            day = None
+        events = events.on_date(day) if day else events.none()
 
-    # Annotate events with can_register
-    events_with_flags = []
-    for event in events:
-        can_register, _ = event.can_register(request.user)
-        events_with_flags.append((event, can_register))
+    page = get_keyset_page(request, events)
+
+    # Registration flags come from the with_registration_state annotation
+    events_with_flags = [(event, event.user_can_register) for event in page]
 
     context = {
         "events_with_flags": events_with_flags,
-        "events": events,
+        "events": page.items,
+        "page": page,
         "status": status,
         "search_query": search_query,
         "event_date": event_date,
@@ -309,45 +454,39 @@ def register_for_event(
     """
     event: Event = get_object_or_404(Event, id=event_id)
 
-    # Check if registration is allowed
-    can_register: bool
-    message: str
-    can_register, message = event.can_register(request.user)
-    if not can_register:
-        messages.error(request, message)
-        return redirect("events:event_details", event_id=event_id)
-
     if request.method == "POST":
-        # Check for existing registration
-        registration: Optional[EventRegistration] = EventRegistration.objects.filter(
-            user=request.user,
-            event=event,
-        ).first()
+        # Create or re-activate the registration in one conditional upsert
+        result = register_user(request.user, event)
+        if result.outcome == ALREADY_REGISTERED:
+            messages.warning(request, result.message)
+            return redirect("events:event_details", event_id=event_id)
+        if result.outcome == WAITLISTED:
+            messages.info(request, result.message)
+            return redirect("events:event_details", event_id=event_id)
+        if not result.success:
+            messages.error(request, result.message)
+            return redirect("events:event_details", event_id=event_id)
 
-        if registration:
-            if registration.status == "cancelled":
-                # Re-activate cancelled registration
-                registration.status = "registered"
-                registration.save()
-                messages.success(request, "You have re-registered for this event.")
-            else:
-                messages.warning(request, "You are already registered for this event.")
-                return redirect("events:event_details", event_id=event_id)
-        else:
-            # Create new registration
-            registration = EventRegistration.objects.create(
-                event=event, user=request.user, status="registered"
-            )
-            messages.success(request, "Successfully registered!")
+        messages.success(request, result.message)
+        # Successful outcomes always carry the registration
+        assert result.registration is not None
 
         # Send confirmation email
         try:
-            send_event_registration_email(request, registration)
+            send_event_registration_email(request, result.registration)
         except Exception as e:
             print(f"Failed to send registration email: {e}")
 
         return redirect("events:event_details", event_id=event_id)
 
+    # Check if registration is allowed
+    can_register: bool
+    message: str
+    can_register, message = event.can_register(request.user)
+    if not can_register:
+        messages.error(request, message)
+        return redirect("events:event_details", event_id=event_id)
+
     # Show confirmation page
     return render(request, "events/register_confirm.html", {"event": event})
 
@@ -363,14 +502,17 @@ def my_registrations(request: HttpRequest) -> HttpResponse:
     """
     registrations: QuerySet[EventRegistration] = (
         EventRegistration.objects.filter(
-            user=request.user, status__in=["registered", "cancelled"]
+            user=request.user, status__in=["registered", "waitlisted", "cancelled"]
         )
         .select_related("event")
-        .order_by("event__date")
+        .order_by("-registered_at", "id")
     )
+    page = get_keyset_page(request, registrations)
 
     return render(
-        request, "events/my_registrations.html", {"registrations": registrations}
+        request,
+        "events/my_registrations.html",
+        {"registrations": page.items, "page": page},
     )
 
 
@@ -393,7 +535,7 @@ def cancel_registration(
 
     if hasattr(event, "registrations"):
         registration = event.registrations.filter(  # type: ignore
-            user=request.user, status="registered"
+            user=request.user, status__in=["registered", "waitlisted"]
         ).first()
 
     if not registration:
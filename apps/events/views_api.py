@@ -2,22 +2,70 @@ from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnl
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import viewsets, status
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django_filters.rest_framework import DjangoFilterBackend
-from django.utils import timezone
-from django.db.models import Count
+from rest_framework.filters import OrderingFilter
+from django_filters.rest_framework import (
+    CharFilter,
+    DateFilter,
+    DjangoFilterBackend,
+    FilterSet,
+)
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from functools import partial
 from typing import Any
+from apps.users.views import send_event_cancellation_emails
+from .analytics import registration_series
+from .cache import (
+    COLLECTION_VERSION_KEY,
+    apply_registration_state,
+    cached_payload,
+    event_version_key,
+)
+from .conditional import (
+    build_validators,
+    conditional_response,
+    precondition_response,
+    probe,
+    user_registration_probe,
+)
+from .deletion import delete_events
+from .mixins import ValuesListMixin
+from .pagination import KeysetPagination
 from .permissions import IsCreatorOrReadOnly, IsEventCreator
-from .models import Event, EventRegistration
+from .renderers import StreamingJSONRenderer
+from .search import FullTextSearchFilter
+from .models import CreatorStats, Event, EventRegistration, start_of_today
 from .serializers import (
     EventListSerializer,
     EventSerializer,
     EventRegistrationSerializer,
     MyRegistrationsSerializer,
 )
+from .services import WAITLISTED, cancel_event, register_user
+from .stats import REGISTRATION_COUNTERS
+
+
+class EventFilter(FilterSet):
+    """Event filters; status matches the effective status, see with_status."""
+
+    date = DateFilter(method="filter_date")
+    status = CharFilter(method="filter_status")
 
+    class Meta:
+        model = Event
+        fields = ["date", "location", "status"]
 
-class EventViewSet(viewsets.ModelViewSet):
+    def filter_date(self, queryset, name, value):
+        """Keep events on the date value, as a starts_at range."""
+        return queryset.on_date(value)
+
+    def filter_status(self, queryset, name, value):
+        """Keep events whose effective status is value."""
+        return queryset.with_status(value)
+
+
+class EventViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """ViewSet for event management with additional custom actions."""
 
     queryset = Event.objects.all()
@@ -26,11 +74,12 @@ class EventViewSet(viewsets.ModelViewSet):
         IsAuthenticatedOrReadOnly,
         IsCreatorOrReadOnly,
     ]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["date", "location", "status"]
-    search_fields = ["title", "description", "location"]
-    ordering_fields = ["date", "created_at", "title"]
-    ordering = ["-created_at"]
+    # FullTextSearchFilter searches title, location and description
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
+    filterset_class = EventFilter
+    ordering_fields = ["starts_at", "date", "created_at", "title"]
+    ordering = ["starts_at"]
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -40,10 +89,134 @@ class EventViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter queryset based on action and user role."""
-        queryset = Event.objects.all()
+        # Active registration count is a maintained column on Event and the
+        # current user's registration flags are annotated in the same query,
+        # as is the status the date implies before the sweeper catches up
+        return Event.objects.with_effective_status().with_registration_state(
+            self.request.user
+        )
+
+    def cached_response(self, name: str, version_keys, build) -> Response:
+        """
+        Serve a response built by build from the versioned payload cache.
+        The payload is shared by all users; 'is_registered' and
+        'can_register' are filled in for the requesting user on every call.
+        Args:
+            name: Endpoint name for the cache key and metrics.
+            version_keys: Version keys the payload depends on.
+            build: Callable returning the uncached Response.
+        Returns:
+            Response: Cached or freshly built response.
+        """
+        if isinstance(self.request.accepted_renderer, StreamingJSONRenderer):
+            return build()
+
+        built = {}
+
+        def build_payload():
+            response = built["response"] = build()
+            if response.status_code != status.HTTP_200_OK:
+                return None
+            return response.data
+
+        data = cached_payload(
+            name, version_keys, self.request.build_absolute_uri(), build_payload
+        )
+        if data is None:
+            return built["response"]
+
+        items = data["results"] if "results" in data else [data]
+        apply_registration_state(items, self.request.user)
+        return Response(data)
+
+    def event_validators(self, stats: dict, version_key: str):
+        """
+        Build ETag and Last-Modified of an event representation.
+        Combines the probe of the events with one of the visitor's
+        registrations, which drive the per-user flags.
+        Args:
+            stats: Result of probe or list_probe for the events.
+            version_key: Cache version key covering the events.
+        Returns:
+            Validators: Validators of the representation.
+        """
+        return build_validators(
+            self.request,
+            stats,
+            sorted(user_registration_probe(self.request.user).items()),
+            self.request.accepted_renderer.media_type,
+            version_keys=[version_key],
+        )
+
+    def list(self, request, *args, **kwargs):
+        """List events from the versioned payload cache."""
+        return conditional_response(
+            request,
+            self.event_validators(
+                self.list_probe(self.filter_queryset(self.get_queryset())),
+                COLLECTION_VERSION_KEY,
+            ),
+            lambda: self.cached_response(
+                "event_list",
+                [COLLECTION_VERSION_KEY],
+                lambda: super(EventViewSet, self).list(request, *args, **kwargs),
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return one event from the versioned payload cache."""
+
+        def respond():
+            return self.cached_response(
+                "event_detail",
+                [event_version_key(kwargs["pk"])],
+                lambda: super(EventViewSet, self).retrieve(request, *args, **kwargs),
+            )
 
-        # Add registration count annotation
-        return Event.objects.annotate(registered_count=Count("registrations"))
+        validators = self.detail_validators(kwargs["pk"])
+        if validators is None:
+            return respond()
+        return conditional_response(request, validators, respond)
+
+    def detail_validators(self, pk, lock: bool = False):
+        """
+        Return validators of one event.
+        Args:
+            pk: Primary key from the URL.
+            lock: Lock the event row until the end of the transaction.
+        Returns:
+            Optional[Validators]: Validators, None if the event does not exist.
+        """
+        try:
+            events = Event.objects.filter(pk=pk)
+            if lock:
+                list(events.select_for_update().values_list("pk"))
+            validators = self.event_validators(probe(events), event_version_key(pk))
+        except (TypeError, ValueError):
+            return None
+        return validators if validators.last_modified is not None else None
+
+    def update(self, request, *args, **kwargs):
+        """Update an event, honouring If-Match and If-Unmodified-Since."""
+        if not (
+            request.META.get("HTTP_IF_MATCH")
+            or request.META.get("HTTP_IF_UNMODIFIED_SINCE")
+        ):
+            return super().update(request, *args, **kwargs)
+
+        with transaction.atomic():
+            # The row stays locked so the precondition holds until the write
+            validators = self.detail_validators(kwargs["pk"], lock=True)
+            if validators is not None:
+                failed = precondition_response(request, validators)
+                if failed is not None:
+                    return failed
+            response = super().update(request, *args, **kwargs)
+
+        validators = self.detail_validators(kwargs["pk"])
+        if validators is not None and response.status_code == status.HTTP_200_OK:
+            validators.apply(response)
+        return response
 
     def perform_create(self, serializer: EventSerializer) -> None:
         """Save event with current user as creator."""
@@ -52,6 +225,10 @@ class EventViewSet(viewsets.ModelViewSet):
             raise PermissionError("Only Event Creators can create events")
         serializer.save(created_by=self.request.user)
 
+    def perform_destroy(self, instance: Event) -> None:
+        """Delete the event and its registrations in bounded chunks."""
+        delete_events(Event.objects.filter(pk=instance.pk))
+
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def my_events(self, request):
         """Get events created by current creator."""
@@ -62,38 +239,52 @@ class EventViewSet(viewsets.ModelViewSet):
             )
 
         events = self.get_queryset().filter(created_by=request.user)
-        serializer = self.get_serializer(events, many=True)
-        return Response(serializer.data)
+        return self.values_response(self.filter_queryset(events))
 
     @action(detail=False, methods=["get"])
     def upcoming(self, request):
         """Get upcoming events."""
-        upcoming_events = self.get_queryset().filter(
-            date__gte=timezone.now().date(), status="published"
+        upcoming_events = self.filter_queryset(
+            self.get_queryset().with_status("published")
+        )
+        return conditional_response(
+            request,
+            self.event_validators(
+                self.list_probe(upcoming_events), COLLECTION_VERSION_KEY
+            ),
+            lambda: self.cached_response(
+                "event_upcoming",
+                [COLLECTION_VERSION_KEY],
+                lambda: self.values_response(upcoming_events),
+            ),
         )
-        serializer = self.get_serializer(upcoming_events, many=True)
-        return Response(serializer.data)
 
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
     def cancel(self, request, pk=None):
         """Cancel an event (creator only)."""
         event = self.get_object()
 
-        if event.created_by != request.user:
+        if event.created_by_id != request.user.pk:
             return Response(
                 {"detail": "Only the event creator can cancel this event."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        if event.status == "cancelled":
-            return Response(
-                {"detail": "Event is already cancelled."},
-                status=status.HTTP_400_BAD_REQUEST,
+        try:
+            result = cancel_event(
+                event,
+                request.user,
+                notify=partial(send_event_cancellation_emails, request),
             )
-
-        event.cancel_event(request.user)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(
-            {"detail": "Event cancelled successfully."}, status=status.HTTP_200_OK
+            {
+                "detail": "Event cancelled successfully.",
+                "cancelled_registrations": result.cancelled,
+                "dropped_waitlist": result.dropped,
+            },
+            status=status.HTTP_200_OK,
         )
 
     @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated])
@@ -107,61 +298,125 @@ class EventViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        registrations = event.registrations.all()
-        serializer = EventRegistrationSerializer(registrations, many=True)
-        return Response(serializer.data)
+        return self.values_response(
+            event.registrations.all(), EventRegistrationSerializer
+        )
+
+    @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated])
+    def analytics(self, request, pk=None):
+        """
+        Get registration and cancellation time series of an event (creator only).
+        Accepts ?interval=hour|day|week (default: day). The series is cached
+        until the event or its registrations change.
+        """
+        event = self.get_object()
+
+        if event.created_by != request.user:
+            return Response(
+                {"detail": "Only the event creator can view analytics."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        interval = request.query_params.get("interval", "day")
+        try:
+            series = cached_payload(
+                "event_analytics",
+                [event_version_key(event.pk)],
+                interval,
+                lambda: registration_series(event.registrations.all(), interval),
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"event": event.pk, **series})
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def stats(self, request):
-        """Get event statistics for current user."""
+        """
+        Get event statistics for current user.
+        Totals come from the creator's stats rollup row, so they cost one
+        query however many events the creator has. 'events' is a keyset page
+        of per-event registration breakdowns.
+        """
         if request.user.role != "creator":
             return Response(
                 {"detail": "Only Event Creators can view statistics."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        user_events = Event.objects.filter(created_by=request.user)
-        stats = {
-            "total_events": user_events.count(),
-            "active_events": user_events.filter(status="published").count(),
-            "completed_events": user_events.filter(status="completed").count(),
-            "cancelled_events": user_events.filter(status="cancelled").count(),
-            "total_registrations": EventRegistration.objects.filter(
-                event__created_by=request.user
-            ).count(),
+        rollup = CreatorStats.for_creator(request.user)
+        stats: dict[str, Any] = {
+            "total_events": rollup.total_events,
+            "active_events": rollup.active_events,
+            "completed_events": rollup.completed_events,
+            "cancelled_events": rollup.cancelled_events,
+            "total_registrations": rollup.total_registrations,
+            "active_registrations": rollup.active_registrations,
+            "waitlisted_registrations": rollup.waitlisted_registrations,
+            "cancelled_registrations": rollup.cancelled_registrations,
         }
+
+        breakdown = Event.objects.filter(created_by=request.user).values(
+            "id",
+            "title",
+            "date",
+            "start_time",
+            "starts_at",
+            "status",
+            **{
+                column: Coalesce(F(f"stats__{column}"), 0)
+                for column in REGISTRATION_COUNTERS.values()
+            },
+        )
+        page = self.paginate_queryset(breakdown)
+        stats["events"] = self.get_paginated_response(page).data
         return Response(stats)
 
 
-class EventRegistrationViewSet(viewsets.ModelViewSet):
+class EventRegistrationViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """ViewSet for managing event registrations."""
 
     serializer_class = EventRegistrationSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Return only current user's registrations."""
-        return EventRegistration.objects.filter(user=self.request.user)
-
-    def perform_create(self, serializer):
-        """Visitor registration for event."""
-        user = self.request.user
+        return EventRegistration.objects.filter(user=self.request.user).select_related(
+            "user", "event"
+        )
 
-        # Only visitors can register for events
-        if user.role != "visitor":
-            raise PermissionError("Only Visitors can register for events")
+    def registration_validators(self, queryset):
+        """Build validators from the registrations and their events."""
+        return build_validators(
+            self.request,
+            self.list_probe(queryset, related="event"),
+            self.request.accepted_renderer.media_type,
+        )
 
-        event = serializer.validated_data["event"]
+    def list(self, request, *args, **kwargs):
+        """List the user's registrations, answering 304 when unchanged."""
+        queryset = self.filter_queryset(self.get_queryset())
+        return conditional_response(
+            request,
+            self.registration_validators(queryset),
+            lambda: self.values_response(queryset),
+        )
 
-        # Check if event is active
-        if event.status != "published":
-            raise PermissionError("Cannot register for inactive events")
+    def create(self, request, *args, **kwargs):
+        """Visitor registration for event through the registration upsert."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        # Check if event date has passed
-        if event.date < timezone.now().date():
-            raise PermissionError("Cannot register for past events")
+        result = register_user(request.user, serializer.validated_data["event"])
+        if not result.success and result.outcome != WAITLISTED:
+            return Response(
+                {"detail": result.message}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        serializer.save(user=user)
+        return Response(
+            self.get_serializer(result.registration).data,
+            status=status.HTTP_201_CREATED,
+        )
 
     def destroy(self, request, *args, **kwargs):
         """Cancel registration."""
@@ -186,7 +441,12 @@ class EventRegistrationViewSet(viewsets.ModelViewSet):
     def upcoming(self, request):
         """Get user's upcoming event registrations."""
         upcoming_registrations = self.get_queryset().filter(
-            event__date__gte=timezone.now().date(), status="registered"
+            event__starts_at__gte=start_of_today(), status="registered"
+        )
+        return conditional_response(
+            request,
+            self.registration_validators(upcoming_registrations),
+            lambda: self.values_response(
+                upcoming_registrations, MyRegistrationsSerializer
+            ),
         )
-        serializer = MyRegistrationsSerializer(upcoming_registrations, many=True)
-        return Response(serializer.data)
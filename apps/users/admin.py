@@ -1,4 +1,36 @@
-from django.contrib import admin
-from apps.users.models import CustomUser
+from django.contrib import admin, messages
+from apps.events.deletion import delete_users
+from apps.users.models import CustomUser, OutboxBroadcast, OutboxEmail
 
-admin.site.register(CustomUser)
+
+@admin.register(CustomUser)
+class CustomUserAdmin(admin.ModelAdmin):
+    """User admin whose deletions go through the chunked bulk path."""
+
+    actions = ["bulk_delete"]
+
+    @admin.action(
+        description="Delete selected users, their events and registrations in chunks",
+        permissions=["delete"],
+    )
+    def bulk_delete(self, request, queryset) -> None:
+        """Delete users without collecting their cascades for review."""
+        result = delete_users(queryset)
+        self.message_user(
+            request,
+            f"Deleted {result.users} users, {result.events} events and "
+            f"{result.registrations} registrations.",
+            messages.SUCCESS,
+        )
+
+    def delete_model(self, request, obj: CustomUser) -> None:
+        """Delete one user through the chunked bulk path."""
+        delete_users(CustomUser.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset) -> None:
+        """Delete users through the chunked bulk path."""
+        delete_users(queryset)
+
+
+admin.site.register(OutboxEmail)
+admin.site.register(OutboxBroadcast)
@@ -0,0 +1,63 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.users.outbox import deliver_batch
+
+
+class Command(BaseCommand):
+    """
+    Deliver queued transactional emails from the outbox.
+
+    Messages are sent in batches over one reused mail connection per batch.
+    Failed messages are retried with exponential backoff.
+    """
+
+    help = "Drain the email outbox in batches"
+
+    def add_arguments(self, parser) -> None:
+        """Register command line options."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Messages claimed and sent per connection (default: 100)",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=getattr(settings, "EMAIL_OUTBOX_RATE", None),
+            help="Maximum messages per second (default: EMAIL_OUTBOX_RATE or unlimited)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new messages instead of exiting when drained",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls in loop mode (default: 5)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Deliver batches until the outbox is drained or forever with --loop."""
+        total_sent = 0
+        total_failed = 0
+        while True:
+            sent, failed = deliver_batch(options["batch_size"], options["rate"])
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}")
+                continue
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Outbox drained: {total_sent} sent, {total_failed} failed")
+        )
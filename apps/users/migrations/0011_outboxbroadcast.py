@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-17 08:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_outboxemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxBroadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255)),
+                ('template_name', models.CharField(help_text='Template path without extension; .txt and .html are rendered', max_length=100)),
+                ('context', models.JSONField(blank=True, default=dict, help_text='Context shared by all recipients')),
+                ('recipients', models.JSONField(default=list, help_text="Per-recipient contexts, each with a 'user_id'")),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Outbox broadcast',
+                'verbose_name_plural': 'Outbox broadcasts',
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.contrib.auth.models import (
 from django.core.validators import MinLengthValidator
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 
 
 class CustomUserManager(BaseUserManager):
@@ -200,3 +201,106 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
             bool: True if user can register for events, False otherwise
         """
         return self.is_visitor
+
+
+class OutboxEmail(models.Model):
+    """
+    Transactional email queued for asynchronous delivery.
+
+    Each row is one message to one recipient. Templates are rendered by the
+    delivery worker from the stored context, so queuing stays cheap inside
+    requests. Context keys 'user_id', 'event_id' and 'registration_id' are
+    resolved to model instances when the message is built.
+    """
+
+    STATUS_CHOICES: tuple[tuple[str, str], ...] = (
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    )
+
+    recipient: models.EmailField = models.EmailField(
+        help_text="Email address the message is delivered to",
+    )
+    subject: models.CharField = models.CharField(max_length=255)
+    template_name: models.CharField = models.CharField(
+        max_length=100,
+        help_text="Template path without extension; .txt and .html are rendered",
+    )
+    context: models.JSONField = models.JSONField(default=dict, blank=True)
+    status: models.CharField = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="pending",
+    )
+    attempts: models.PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        default=0
+    )
+    last_error: models.TextField = models.TextField(blank=True)
+    next_attempt_at: models.DateTimeField = models.DateTimeField(
+        default=timezone.now,
+        help_text="Earliest time the worker may try to deliver the message",
+    )
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    sent_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """
+        Meta configuration for the OutboxEmail model.
+        Adds an index for the worker query on pending messages that are due.
+        """
+
+        verbose_name = "Outbox email"
+        verbose_name_plural = "Outbox emails"
+        ordering = ["next_attempt_at", "id"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return string representation of the queued email.
+        Returns:
+            str: Formatted string with recipient, subject and status
+        """
+        return f"{self.recipient}: {self.subject} ({self.status})"
+
+
+class OutboxBroadcast(models.Model):
+    """
+    One message queued for many users, fanned out by the delivery worker.
+
+    Requests that notify an unbounded number of users store a single row
+    per chunk of recipients instead of one OutboxEmail per user. The worker
+    expands it into OutboxEmail rows, resolving recipient addresses there.
+    Each recipient context is merged over the shared context and must hold
+    the 'user_id' to deliver to.
+    """
+
+    subject: models.CharField = models.CharField(max_length=255)
+    template_name: models.CharField = models.CharField(
+        max_length=100,
+        help_text="Template path without extension; .txt and .html are rendered",
+    )
+    context: models.JSONField = models.JSONField(
+        default=dict, blank=True, help_text="Context shared by all recipients"
+    )
+    recipients: models.JSONField = models.JSONField(
+        default=list, help_text="Per-recipient contexts, each with a 'user_id'"
+    )
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta configuration for the OutboxBroadcast model."""
+
+        verbose_name = "Outbox broadcast"
+        verbose_name_plural = "Outbox broadcasts"
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        """
+        Return string representation of the queued broadcast.
+        Returns:
+            str: Formatted string with subject and number of recipients
+        """
+        return f"{self.subject} ({len(self.recipients)} recipients)"
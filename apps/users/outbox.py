@@ -0,0 +1,299 @@
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Model
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import CustomUser, OutboxBroadcast, OutboxEmail
+
+# Delivery attempts before a message is marked as failed
+MAX_ATTEMPTS: int = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+# First retry delay in seconds, doubled after every failed attempt
+RETRY_BASE_SECONDS: int = getattr(settings, "EMAIL_OUTBOX_RETRY_SECONDS", 60)
+# Seconds a claimed batch stays invisible to other workers, on top of the
+# time rate limited delivery of the batch takes
+CLAIM_LEASE_SECONDS: int = 300
+# Rows written per INSERT when queuing many messages
+QUEUE_BATCH_SIZE: int = 1000
+# Broadcasts expanded into messages per worker transaction
+EXPAND_BATCH_SIZE: int = 10
+
+
+def queue_email(
+    recipient: str, subject: str, template_name: str, context: Dict[str, Any]
+) -> OutboxEmail:
+    """
+    Queue a single email for delivery by the outbox worker.
+    Args:
+        recipient: Email address to deliver to.
+        subject: Message subject.
+        template_name: Template path without the .txt/.html extension.
+        context: JSON serializable template context.
+    Returns:
+        OutboxEmail: The queued message.
+    """
+    return OutboxEmail.objects.create(
+        recipient=recipient,
+        subject=subject,
+        template_name=template_name,
+        context=context,
+    )
+
+
+def queue_emails(emails: Iterable[OutboxEmail]) -> int:
+    """
+    Queue many unsaved OutboxEmail instances with batched INSERTs.
+    Args:
+        emails: Unsaved messages to queue.
+    Returns:
+        int: Number of queued messages.
+    """
+    created = OutboxEmail.objects.bulk_create(emails, batch_size=QUEUE_BATCH_SIZE)
+    return len(created)
+
+
+def queue_broadcast(
+    subject: str,
+    template_name: str,
+    context: Dict[str, Any],
+    recipients: List[Dict[str, Any]],
+) -> OutboxBroadcast:
+    """
+    Queue one message for many users, fanned out later by the outbox worker.
+    Costs one INSERT however many recipients there are, and no user lookups.
+    Args:
+        subject: Message subject.
+        template_name: Template path without the .txt/.html extension.
+        context: JSON serializable context shared by all recipients.
+        recipients: Per-recipient contexts, each with the 'user_id' to deliver to.
+    Returns:
+        OutboxBroadcast: The queued broadcast.
+    """
+    return OutboxBroadcast.objects.create(
+        subject=subject,
+        template_name=template_name,
+        context=context,
+        recipients=recipients,
+    )
+
+
+def expand_broadcasts(batch_size: int = EXPAND_BATCH_SIZE) -> int:
+    """
+    Turn queued broadcasts into one OutboxEmail per recipient.
+    Broadcasts are claimed with SKIP LOCKED and deleted in the same
+    transaction that queues their messages, so each is expanded once.
+    Recipients whose user no longer exists are skipped.
+    Args:
+        batch_size: Maximum number of broadcasts to expand.
+    Returns:
+        int: Number of queued messages.
+    """
+    queued = 0
+    with transaction.atomic():
+        broadcasts = list(
+            OutboxBroadcast.objects.select_for_update(skip_locked=True).order_by("id")[
+                :batch_size
+            ]
+        )
+        for broadcast in broadcasts:
+            emails = dict(
+                CustomUser.objects.filter(
+                    pk__in=[recipient["user_id"] for recipient in broadcast.recipients]
+                ).values_list("pk", "email")
+            )
+            queued += queue_emails(
+                OutboxEmail(
+                    recipient=emails[recipient["user_id"]],
+                    subject=broadcast.subject,
+                    template_name=broadcast.template_name,
+                    context={**broadcast.context, **recipient},
+                )
+                for recipient in broadcast.recipients
+                if recipient["user_id"] in emails
+            )
+        OutboxBroadcast.objects.filter(pk__in=[b.pk for b in broadcasts]).delete()
+    return queued
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Return the exponential backoff delay after a failed attempt.
+    Args:
+        attempts: Number of attempts made so far.
+    Returns:
+        timedelta: Delay before the next attempt.
+    """
+    return timedelta(seconds=RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+
+
+def claim_batch(
+    batch_size: int, lease_seconds: float = CLAIM_LEASE_SECONDS
+) -> List[OutboxEmail]:
+    """
+    Claim due pending messages for this worker.
+    Claimed rows are leased by moving next_attempt_at forward, so concurrent
+    workers skip them and a crashed worker's batch is retried later.
+    Args:
+        batch_size: Maximum number of messages to claim.
+        lease_seconds: Seconds the messages stay claimed.
+    Returns:
+        List[OutboxEmail]: Claimed messages.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        OutboxEmail.objects.filter(id__in=ids).update(
+            next_attempt_at=now + timedelta(seconds=lease_seconds)
+        )
+    return list(OutboxEmail.objects.filter(id__in=ids).order_by("id"))
+
+
+def _resolve_context(emails: List[OutboxEmail]) -> Dict[str, Dict[int, Any]]:
+    """
+    Load every user, event and registration referenced by a batch at once.
+    Args:
+        emails: Messages whose contexts reference model ids.
+    Returns:
+        Dict: Instances keyed by context key and primary key.
+    """
+    from apps.events.models import Event, EventRegistration
+
+    models: Dict[str, type[Model]] = {
+        "user_id": CustomUser,
+        "event_id": Event,
+        "registration_id": EventRegistration,
+    }
+    resolved: Dict[str, Dict[int, Any]] = {}
+    for key, model in models.items():
+        ids = {email.context[key] for email in emails if email.context.get(key)}
+        resolved[key] = model._default_manager.in_bulk(ids) if ids else {}
+    return resolved
+
+
+def build_message(
+    email: OutboxEmail, resolved: Dict[str, Dict[int, Any]], connection=None
+) -> EmailMultiAlternatives:
+    """
+    Render a queued email into a multipart message.
+    Args:
+        email: The queued message.
+        resolved: Instances loaded by _resolve_context.
+        connection: Mail connection the message will be sent over.
+    Returns:
+        EmailMultiAlternatives: Message with text and HTML versions.
+    """
+    context = dict(email.context)
+    for key, instances in resolved.items():
+        if key in context:
+            context[key.removesuffix("_id")] = instances.get(context[key])
+
+    text_content = render_to_string(f"{email.template_name}.txt", context)
+    html_content = render_to_string(f"{email.template_name}.html", context)
+
+    message = EmailMultiAlternatives(
+        email.subject,
+        text_content,
+        getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        [email.recipient],
+        connection=connection,
+    )
+    message.attach_alternative(html_content, "text/html")
+    return message
+
+
+def deliver_batch(
+    batch_size: int = 100, rate: Optional[float] = None
+) -> Tuple[int, int]:
+    """
+    Claim and deliver one batch of due messages over a single mail connection.
+    Queued broadcasts are expanded into messages first. Each message is
+    marked as sent as soon as it is handed to the connection, so a worker
+    stopping mid-batch only leaves unsent messages to be retried. A failing
+    message, or the whole batch if the connection cannot be opened, is
+    rescheduled with exponential backoff.
+    Args:
+        batch_size: Maximum number of messages to deliver.
+        rate: Maximum messages per second, None for no limit.
+    Returns:
+        Tuple[int, int]: Number of sent and failed messages.
+    """
+    expand_broadcasts()
+    interval = 1.0 / rate if rate else 0.0
+    # The lease must outlast the paced delivery of the whole batch
+    emails = claim_batch(batch_size, CLAIM_LEASE_SECONDS + batch_size * interval)
+    if not emails:
+        return 0, 0
+
+    resolved = _resolve_context(emails)
+    sent = 0
+    failed = 0
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        for email in emails:
+            _record_failure(email, e)
+        return 0, len(emails)
+    try:
+        for email in emails:
+            started = time.monotonic()
+            try:
+                connection.send_messages([build_message(email, resolved, connection)])
+            except Exception as e:
+                failed += 1
+                _record_failure(email, e)
+            else:
+                sent += 1
+                _record_sent(email)
+
+            # Pace delivery to honour the configured send rate
+            elapsed = time.monotonic() - started
+            if interval > elapsed:
+                time.sleep(interval - elapsed)
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def _record_sent(email: OutboxEmail) -> None:
+    """
+    Mark a delivered message as sent.
+    Args:
+        email: Message handed to the mail connection.
+    """
+    OutboxEmail.objects.filter(id=email.id).update(
+        status="sent",
+        sent_at=timezone.now(),
+        attempts=F("attempts") + 1,
+        last_error="",
+    )
+
+
+def _record_failure(email: OutboxEmail, error: Exception) -> None:
+    """
+    Reschedule a failed message or give up after MAX_ATTEMPTS.
+    Args:
+        email: Message that failed.
+        error: Exception raised while sending.
+    """
+    attempts = email.attempts + 1
+    update: Dict[str, Any] = {
+        "attempts": attempts,
+        "last_error": f"{type(error).__name__}: {error}",
+    }
+    if attempts >= MAX_ATTEMPTS:
+        update["status"] = "failed"
+    else:
+        update["next_attempt_at"] = timezone.now() + retry_delay(attempts)
+    OutboxEmail.objects.filter(id=email.id).update(**update)
@@ -1,10 +1,10 @@
-from typing import Optional, Iterable
+from typing import Optional, Iterable, Tuple
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail, send_mass_mail, EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import render, redirect
 from django.template.loader import render_to_string
@@ -14,6 +14,7 @@ from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from apps.events.models import Event, EventRegistration
 from apps.users.models import CustomUser
 from .forms import CustomUserSignupForm
+from .outbox import queue_broadcast, queue_email
 
 # Get the user model (settings.py)
 User = get_user_model()
@@ -182,91 +183,49 @@ def send_event_registration_email(
     request: HttpRequest, registration: EventRegistration
 ) -> None:
     """
-    Send confirmation email when user registers for an event.
+    Queue confirmation email when user registers for an event.
+    The message is rendered and delivered by the send_outbox_emails worker.
     Args:
         request: HTTP request object for getting current site
         registration: EventRegistration object containing user and event details
-    Raises:
-        Exception: If email sending fails
     """
     current_site = get_current_site(request)
     user: CustomUser = registration.user
     event: Event = registration.event
-    subject = f"Registration Confirmed: {event.title}"
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
-    to_email = [user.email]
 
-    # Context for template
-    context = {
-        "user": user,
-        "event": event,
-        "registration": registration,
-        "domain": current_site.domain,
-    }
-
-    # Text and HTML versions
-    text_content = render_to_string(
-        "registration/event_registration_email.txt", context
-    )
-    html_content = render_to_string(
-        "registration/event_registration_email.html", context
+    queue_email(
+        recipient=user.email,
+        subject=f"Registration Confirmed: {event.title}",
+        template_name="registration/event_registration_email",
+        context={
+            "user_id": user.pk,
+            "event_id": event.pk,
+            "registration_id": registration.pk,
+            "domain": current_site.domain,
+        },
     )
 
-    email = EmailMultiAlternatives(subject, text_content, from_email, to_email)
-    email.attach_alternative(html_content, "text/html")
-
-    # Send the email
-    try:
-        email.send()
-        print(f"Registration email sent to {user.email}")
-    except Exception as e:
-        print(f"Failed to send registration email to {user.email}: {e}")
-        raise
-
 
 def send_event_cancellation_emails(
-    request: HttpRequest, event: Event, registrations: Iterable[EventRegistration]
+    request: HttpRequest, event: Event, registrations: Iterable[Tuple[int, int]]
 ) -> None:
     """
-    Send cancellation notification emails to all registered users.
+    Queue cancellation notification emails for all registered users.
+    The recipients are stored as one outbox broadcast, which the
+    send_outbox_emails worker fans out into messages and delivers, so the
+    request neither waits on SMTP nor writes a row per recipient.
     Args:
         request: HTTP request object for getting current site
         event: Event object that was cancelled
-        registrations: Iterable of EventRegistration objects for users to notify
-    Raises:
-        Exception: If mass email sending fails
+        registrations: (registration id, user id) pairs of the users to notify
     """
     current_site = get_current_site(request)
-    from_email: Optional[str] = getattr(settings, "DEFAULT_FROM_EMAIL", None)
-
-    for registration in registrations:
-        user = registration.user
-        subject = f"Event Cancelled: {event.title}"
-        to_email = [user.email]
-
-        # Context for template
-        context = {
-            "user": user,
-            "event": event,
-            "registration": registration,
-            "domain": current_site.domain,
-        }
-
-        # Text and HTML versions
-        text_content = render_to_string(
-            "registration/event_cancellation_email.txt", context
-        )
-        html_content = render_to_string(
-            "registration/event_cancellation_email.html", context
-        )
-
-        email = EmailMultiAlternatives(subject, text_content, from_email, to_email)
-        email.attach_alternative(html_content, "text/html")
-
-        # Send the email
-        try:
-            email.send()
-            print(f"Cancellation email sent to {user.email}")
-        except Exception as e:
-            print(f"Failed to send cancellation email to {user.email}: {e}")
-            raise
+    queue_broadcast(
+        subject=f"Event Cancelled: {event.title}",
+        template_name="registration/event_cancellation_email",
+        context={"event_id": event.pk, "domain": current_site.domain},
+        recipients=[
+            {"user_id": user_id, "registration_id": registration_id}
+            for registration_id, user_id in registrations
+        ],
+    )
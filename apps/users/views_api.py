@@ -12,14 +12,18 @@ from .serializers import (
     LoginSerializer,
     MyRegistrationsSerializer,
 )
+from apps.events.deletion import delete_users
 from apps.events.models import EventRegistration
+from apps.events.mixins import ValuesListMixin
+from apps.events.pagination import KeysetPagination
 
 
-class CustomUserViewSet(viewsets.ModelViewSet):
+class CustomUserViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """ViewSet for user management."""
 
-    queryset = CustomUser.objects.all()
+    queryset = CustomUser.objects.order_by("id")
     serializer_class = UserRegistrationSerializer
+    pagination_class = KeysetPagination
 
     def get_permissions(self):
         """Return permissions based on action."""
@@ -37,6 +41,10 @@ class CustomUserViewSet(viewsets.ModelViewSet):
             return MyRegistrationsSerializer
         return UserRegistrationSerializer
 
+    def perform_destroy(self, instance: CustomUser) -> None:
+        """Delete the user with their events and registrations in chunks."""
+        delete_users(CustomUser.objects.filter(pk=instance.pk))
+
     @action(detail=False, methods=["post"], permission_classes=[AllowAny])
     def register(self, request):
         """Register a new user."""
@@ -109,5 +117,4 @@ class CustomUserViewSet(viewsets.ModelViewSet):
             )
 
         registrations = EventRegistration.objects.filter(user=request.user)
-        serializer = MyRegistrationsSerializer(registrations, many=True)
-        return Response(serializer.data)
+        return self.values_response(registrations, MyRegistrationsSerializer)
@@ -0,0 +1,16 @@
+"""
+Performance benchmarks of the hot request paths over realistic data volumes.
+
+Run from the project root, with the settings of the database to measure:
+
+    python -m benchmarks --scale 1k --scale 100k --output results.json
+    python -m benchmarks --scale 1k --baseline baseline.json --threshold 0.2
+
+Each scale builds a fresh test database (SQLite, or PostgreSQL when the
+settings point to it), so development data is never touched. The exit
+status is 1 when a result regressed against the baseline.
+
+Datasets are generated with the factories in tests/factories.py, so the
+tests package and factory_boy (from requirements_test.txt) must be
+importable wherever the benchmarks run.
+"""
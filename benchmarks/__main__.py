@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    from .datasets import SCALES
+    from .runner import DEFAULT_THRESHOLD
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark hot request paths over generated datasets.",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        choices=list(SCALES),
+        help="Dataset scale in registrations, repeatable (default: 1k)",
+    )
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs (default: 2)")
+    parser.add_argument("--repeat", type=int, default=10, help="Measured runs (default: 10)")
+    parser.add_argument(
+        "--only", action="append", help="Run only this scenario, repeatable"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with these JSON results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Tolerated median slowdown, 0.2 = 20%% (default: {DEFAULT_THRESHOLD})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Run the benchmarks, one fresh test database per scale.
+    Returns:
+        int: 1 if a result regressed against the baseline, else 0.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "event_manager.settings")
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    from .runner import compare, load, metadata, run_scale, save
+
+    args = parse_args(argv)
+    results = {"meta": metadata(args.warmup, args.repeat), "scales": {}}
+
+    setup_test_environment()
+    try:
+        for scale in args.scale or ["1k"]:
+            old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+            try:
+                results["scales"][scale] = run_scale(
+                    scale, args.warmup, args.repeat, args.only
+                )
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+    finally:
+        teardown_test_environment()
+
+    if args.output:
+        save(results, args.output)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, load(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from datetime import time, timedelta
+from io import StringIO
+from typing import Dict, List
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.events.models import Event, EventRegistration
+from apps.events.stats import rebuild_creator_stats
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+# Registrations per dataset scale
+SCALES: Dict[str, int] = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+# Rows per bulk INSERT
+BATCH_SIZE = 5000
+# Events each visitor registers for
+REGISTRATIONS_PER_VISITOR = 10
+# Registrations per event
+REGISTRATIONS_PER_EVENT = 1000
+
+
+@dataclass
+class Dataset:
+    """Handles on the rows the benchmark scenarios work with."""
+
+    scale: str
+    registrations: int
+    creator_id: int
+    event_id: int
+    visitor_id: int
+
+
+def _build(factory, count: int, **kwargs) -> List:
+    """Build unsaved model instances with a factory, for bulk_create."""
+    return [factory.build(**kwargs) for _ in range(count)]
+
+
+def build_dataset(scale: str) -> Dataset:
+    """
+    Fill the empty database with a deterministic dataset of one scale.
+    Users and events are built with the test factories and bulk inserted.
+    Registrations spread evenly over events, and each visitor registers
+    for several events. One in ten events is in the past and one in twenty
+    registrations is cancelled. Denormalized counters, the stats rollups
+    and the search index are then rebuilt by their maintenance tools.
+    Args:
+        scale: One of SCALES.
+    Returns:
+        Dataset: Primary keys used by the scenarios.
+    """
+    total = SCALES[scale]
+    visitor_count = max(1, total // REGISTRATIONS_PER_VISITOR)
+    event_count = max(REGISTRATIONS_PER_VISITOR * 2, total // REGISTRATIONS_PER_EVENT)
+    creator_count = max(1, event_count // 100)
+
+    user_model = CreatorFactory._meta.model
+    creators = user_model.objects.bulk_create(
+        _build(CreatorFactory, creator_count), batch_size=BATCH_SIZE
+    )
+    visitors = user_model.objects.bulk_create(
+        _build(VisitorFactory, visitor_count), batch_size=BATCH_SIZE
+    )
+
+    today = timezone.now().date()
+    events = []
+    for index in range(event_count):
+        past = index % 10 == 9
+        events.append(
+            EventFactory.build(
+                created_by=creators[index % creator_count],
+                date=today + timedelta(days=-7 if past else 1 + index % 60),
+                start_time=time(9 + index % 12),
+                status="completed" if past else "published",
+            )
+        )
+    events = Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+    batch: List[EventRegistration] = []
+    for index in range(total):
+        # Visitor v takes events v, v + 1, ... so pairs never repeat
+        visitor = index % visitor_count
+        event = (visitor + index // visitor_count) % event_count
+        batch.append(
+            EventRegistration(
+                user_id=visitors[visitor].pk,
+                event_id=events[event].pk,
+                status="cancelled" if index % 20 == 19 else "registered",
+            )
+        )
+        if len(batch) == BATCH_SIZE:
+            EventRegistration.objects.bulk_create(batch)
+            batch = []
+    EventRegistration.objects.bulk_create(batch)
+
+    call_command("reconcile_registration_counts", stdout=StringIO())
+    rebuild_creator_stats()
+
+    return Dataset(
+        scale=scale,
+        registrations=total,
+        creator_id=events[0].created_by_id,
+        event_id=events[0].pk,
+        # Not registered for anything, so registering always succeeds
+        visitor_id=VisitorFactory.create().pk,
+    )
@@ -0,0 +1,180 @@
+import json
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import django
+from django.db import connection
+
+from .datasets import build_dataset
+from .scenarios import Scenario, build_scenarios, run_once
+
+# Relative slowdown of the median tolerated before a result counts as regressed
+DEFAULT_THRESHOLD = 0.2
+# Absolute slowdowns below this many milliseconds are treated as noise
+NOISE_FLOOR_MS = 1.0
+
+
+class QueryCounter:
+    """Execute wrapper counting queries without recording their SQL."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Count one database call."""
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(run: Callable[[], None]) -> Dict[str, float]:
+    """
+    Time one call and count the queries it runs.
+    Args:
+        run: Callable to measure.
+    Returns:
+        Dict[str, float]: 'ms' and 'queries'.
+    """
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+    return {"ms": elapsed * 1000, "queries": counter.count}
+
+
+def benchmark(scenario: Scenario, warmup: int, repeat: int) -> Dict[str, Any]:
+    """
+    Measure a scenario after warmup runs.
+    Args:
+        scenario: The scenario to measure.
+        warmup: Unmeasured runs first.
+        repeat: Measured runs.
+    Returns:
+        Dict[str, Any]: Timing statistics in milliseconds and the query count.
+    """
+    for _ in range(warmup):
+        run_once(scenario, measure)
+    runs = [run_once(scenario, measure) for _ in range(repeat)]
+    timings = sorted(run["ms"] for run in runs)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(timings[0], 3),
+        "max_ms": round(timings[-1], 3),
+        "stdev_ms": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        "queries": max(run["queries"] for run in runs),
+        "repeat": repeat,
+    }
+
+
+def run_scale(
+    scale: str,
+    warmup: int,
+    repeat: int,
+    only: Optional[List[str]] = None,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """
+    Build the dataset of one scale in the current (empty) database and
+    benchmark every scenario against it.
+    Args:
+        scale: Dataset scale, see datasets.SCALES.
+        warmup: Unmeasured runs per scenario.
+        repeat: Measured runs per scenario.
+        only: Names of the scenarios to run, all if None.
+        log: Progress output.
+    Returns:
+        Dict[str, Any]: Dataset build time and results keyed by scenario.
+    """
+    started = time.perf_counter()
+    dataset = build_dataset(scale)
+    build_seconds = time.perf_counter() - started
+    log(f"[{scale}] dataset built in {build_seconds:.1f}s")
+
+    results = {}
+    for scenario in build_scenarios(dataset):
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = benchmark(scenario, warmup, repeat)
+        result = results[scenario.name]
+        log(
+            f"[{scale}] {scenario.name}: median {result['median_ms']:.2f} ms, "
+            f"{result['queries']} queries"
+        )
+    return {"build_seconds": round(build_seconds, 2), "results": results}
+
+
+def metadata(warmup: int, repeat: int) -> Dict[str, Any]:
+    """
+    Describe the environment results were measured in.
+    Args:
+        warmup: Unmeasured runs per scenario.
+        repeat: Measured runs per scenario.
+    Returns:
+        Dict[str, Any]: Versions, database vendor and run parameters.
+    """
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "machine": platform.machine(),
+        "warmup": warmup,
+        "repeat": repeat,
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Find results that regressed against a baseline run.
+    A scenario regresses when it runs more queries, or when its median is
+    more than threshold slower and the slowdown is above the noise floor.
+    Scenarios or scales missing from either side are skipped.
+    Args:
+        results: Output of a benchmark run.
+        baseline: Output of an earlier run to compare with.
+        threshold: Tolerated relative slowdown of the median.
+    Returns:
+        List[str]: One description per regression, empty if none.
+    """
+    regressions = []
+    for scale, current in results["scales"].items():
+        reference = baseline.get("scales", {}).get(scale)
+        if reference is None:
+            continue
+        for name, result in current["results"].items():
+            before = reference["results"].get(name)
+            if before is None:
+                continue
+            if result["queries"] > before["queries"]:
+                regressions.append(
+                    f"[{scale}] {name}: {result['queries']} queries, "
+                    f"baseline {before['queries']}"
+                )
+            slowdown = result["median_ms"] - before["median_ms"]
+            if (
+                slowdown > NOISE_FLOOR_MS
+                and result["median_ms"] > before["median_ms"] * (1 + threshold)
+            ):
+                regressions.append(
+                    f"[{scale}] {name}: median {result['median_ms']:.2f} ms, "
+                    f"baseline {before['median_ms']:.2f} ms "
+                    f"(+{slowdown / before['median_ms']:.0%})"
+                )
+    return regressions
+
+
+def load(path: Path) -> Dict[str, Any]:
+    """Read results from a JSON file."""
+    return json.loads(path.read_text())
+
+
+def save(results: Dict[str, Any], path: Path) -> None:
+    """Write results to a JSON file."""
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
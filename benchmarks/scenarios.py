@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+
+from apps.users.models import CustomUser
+
+from .datasets import Dataset
+
+
+@dataclass
+class Scenario:
+    """One measured hot path; setup runs untimed before every repetition."""
+
+    name: str
+    run: Callable[[], None]
+    setup: Optional[Callable[[], None]] = None
+    # Writes are rolled back so every repetition sees the same data
+    rollback: bool = False
+    tags: List[str] = field(default_factory=list)
+
+
+def _client(user_id: int) -> Client:
+    """Return a test client logged in as a user."""
+    client = Client()
+    client.force_login(CustomUser.objects.get(pk=user_id))
+    return client
+
+
+def _get(client: Client, url: str, **extra) -> None:
+    """Request url and read the whole body, streamed or not."""
+    response = client.get(url, **extra)
+    assert response.status_code == 200, f"GET {url} returned {response.status_code}"
+    response.getvalue()
+
+
+def _post(client: Client, url: str) -> None:
+    """Post to url, expecting the redirect of a successful form."""
+    response = client.post(url)
+    assert response.status_code == 302, f"POST {url} returned {response.status_code}"
+
+
+def build_scenarios(dataset: Dataset) -> List[Scenario]:
+    """
+    Return the benchmarked hot paths over a dataset.
+    Args:
+        dataset: The dataset built for this run.
+    Returns:
+        List[Scenario]: Scenarios in execution order.
+    """
+    visitor = _client(dataset.visitor_id)
+    creator = _client(dataset.creator_id)
+    event_id = dataset.event_id
+
+    return [
+        Scenario(
+            "browse_events",
+            lambda: _get(visitor, reverse("events:browse_events")),
+            tags=["html"],
+        ),
+        Scenario(
+            "event_list_api",
+            lambda: _get(visitor, "/api/events/"),
+            # Measure building the page, not the versioned payload cache
+            setup=cache.clear,
+            tags=["api"],
+        ),
+        Scenario(
+            "export_registrations_csv",
+            lambda: _get(creator, reverse("events:export_csv", args=[event_id])),
+            tags=["html", "stream"],
+        ),
+        Scenario(
+            "cancel_event",
+            lambda: _post(creator, reverse("events:cancel_event", args=[event_id])),
+            rollback=True,
+            tags=["html", "write"],
+        ),
+        Scenario(
+            "register_for_event",
+            lambda: _post(
+                visitor, reverse("events:register_for_event", args=[event_id])
+            ),
+            rollback=True,
+            tags=["html", "write"],
+        ),
+    ]
+
+
+def run_once(scenario: Scenario, timer: Callable[[Callable[[], None]], Dict]) -> Dict:
+    """
+    Run one repetition of a scenario, rolling back its writes if needed.
+    Args:
+        scenario: The scenario to run.
+        timer: Callable measuring scenario.run.
+    Returns:
+        Dict: Measurements returned by timer.
+    """
+    if scenario.setup is not None:
+        scenario.setup()
+    if not scenario.rollback:
+        return timer(scenario.run)
+    with transaction.atomic():
+        measured = timer(scenario.run)
+        transaction.set_rollback(True)
+    return measured
@@ -0,0 +1,354 @@
+"""
+Per-view request metrics with a Prometheus text exposition.
+
+Enable by adding 'event_manager.metrics.MetricsMiddleware' to MIDDLEWARE,
+as early as possible so its latency covers the other middleware. The
+aggregates are per process; scrape every worker or run one per host.
+"""
+
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.signals import request_started
+from django.db import connections
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+UNRESOLVED_VIEW = "<unresolved>"
+# Exposed metric name and help text per ViewMetrics counter
+COUNTERS: Dict[str, tuple[str, str]] = {
+    "requests": ("django_view_requests_total", "Requests handled"),
+    "queries": ("django_view_db_queries_total", "Database queries executed"),
+    "query_seconds": ("django_view_db_query_seconds_total", "Time in database queries"),
+    "template_seconds": ("django_view_template_seconds_total", "Time rendering templates"),
+    "response_bytes": ("django_view_response_bytes_total", "Response body bytes sent"),
+}
+
+
+class RequestStats:
+    """Database and template timings collected while one request runs."""
+
+    __slots__ = ("queries", "query_seconds", "template_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.template_seconds = 0.0
+
+
+# Stats of the request running in the current context; asgiref copies the
+# context into the threads that run sync code of an ASGI request
+_current: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def record_query(execute, sql, params, many, context):
+    """Time one database call of the running request, as an execute wrapper."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.query_seconds += perf_counter() - started
+
+
+def instrument_connections(**kwargs) -> None:
+    """
+    Install record_query on the database connections of the current thread.
+    Connected to request_started, which runs in the thread that executes the
+    request's sync code under both WSGI and ASGI. Connections are per thread,
+    so a wrapper installed from the event loop would never see the queries.
+    """
+    for connection in connections.all():
+        if record_query not in connection.execute_wrappers:
+            # Outermost, so execute_wrapper() blocks popping theirs keep it
+            connection.execute_wrappers.insert(0, record_query)
+
+
+class ViewMetrics:
+    """Running totals of one view, allocated once per view name."""
+
+    __slots__ = (
+        "requests",
+        "latency_seconds",
+        "latency_buckets",
+        "queries",
+        "query_seconds",
+        "template_seconds",
+        "response_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.latency_seconds = 0.0
+        # Non-cumulative counts; the last slot holds requests above all bounds
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.template_seconds = 0.0
+        self.response_bytes = 0
+
+
+class MetricsRegistry:
+    """Thread-safe in-process aggregator of per-view request metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views: Dict[str, ViewMetrics] = {}
+
+    def record(
+        self, view: str, latency: float, stats: RequestStats, response_bytes: int
+    ) -> None:
+        """
+        Add one finished request to the totals of its view.
+        Args:
+            view: Resolved URL name of the view.
+            latency: Seconds spent handling the request.
+            stats: Database and template timings of the request.
+            response_bytes: Size of the response body.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, latency)
+        with self._lock:
+            metrics = self._views.get(view)
+            if metrics is None:
+                metrics = self._views[view] = ViewMetrics()
+            metrics.requests += 1
+            metrics.latency_seconds += latency
+            metrics.latency_buckets[bucket] += 1
+            metrics.queries += stats.queries
+            metrics.query_seconds += stats.query_seconds
+            metrics.template_seconds += stats.template_seconds
+            metrics.response_bytes += response_bytes
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return a copy of the totals.
+        Returns:
+            Dict[str, Dict[str, Any]]: Totals keyed by view name.
+        """
+        with self._lock:
+            snapshot = {
+                view: {name: getattr(metrics, name) for name in ViewMetrics.__slots__}
+                for view, metrics in self._views.items()
+            }
+            for totals in snapshot.values():
+                totals["latency_buckets"] = list(totals["latency_buckets"])
+            return snapshot
+
+    def reset(self) -> None:
+        """Clear all totals."""
+        with self._lock:
+            self._views.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    """Format a sample value, integers without a fraction."""
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render_prometheus(
+    views: Dict[str, Dict[str, Any]],
+    cache: Optional[Dict[str, Dict[str, int]]] = None,
+) -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+    Args:
+        views: Per-view totals, see MetricsRegistry.snapshot.
+        cache: Optional hit and miss counts per cached endpoint.
+    Returns:
+        str: Exposition text.
+    """
+    lines: List[str] = []
+    for key, (metric, help_text) in COUNTERS.items():
+        lines.append(f"# HELP {metric} {help_text}.")
+        lines.append(f"# TYPE {metric} counter")
+        for view, totals in sorted(views.items()):
+            lines.append(f'{metric}{{view="{_escape(view)}"}} {_format(totals[key])}')
+
+    metric = "django_view_latency_seconds"
+    lines.append(f"# HELP {metric} Request latency.")
+    lines.append(f"# TYPE {metric} histogram")
+    for view, totals in sorted(views.items()):
+        label = _escape(view)
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, totals["latency_buckets"]):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{view="{label}",le="{bound}"}} {cumulative}')
+        lines.append(
+            f'{metric}_bucket{{view="{label}",le="+Inf"}} {totals["requests"]}'
+        )
+        lines.append(
+            f'{metric}_sum{{view="{label}"}} {_format(totals["latency_seconds"])}'
+        )
+        lines.append(f'{metric}_count{{view="{label}"}} {totals["requests"]}')
+
+    if cache is not None:
+        metric = "events_cache_lookups_total"
+        lines.append(f"# HELP {metric} Versioned payload cache lookups.")
+        lines.append(f"# TYPE {metric} counter")
+        for name, counts in sorted(cache.items()):
+            for key, result in (("hits", "hit"), ("misses", "miss")):
+                lines.append(
+                    f'{metric}{{endpoint="{_escape(name)}",result="{result}"}} '
+                    f"{counts[key]}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+def instrument_templates() -> None:
+    """
+    Time Django template rendering into the stats of the running request.
+    Patches the Django template backend once; included templates render
+    inside their parent and are not counted twice.
+    """
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, "timed", False):
+        return
+    render = Template.render
+
+    def timed_render(self, context=None, request=None):
+        stats = _current.get()
+        if stats is None:
+            return render(self, context, request)
+        started = perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            stats.template_seconds += perf_counter() - started
+
+    timed_render.timed = True  # type: ignore[attr-defined]
+    Template.render = timed_render  # type: ignore[method-assign]
+
+
+class MetricsMiddleware:
+    """
+    Record latency, database queries, template time and response size per
+    resolved URL name into the process-wide registry.
+    Works as both a sync (WSGI) and an async (ASGI) middleware. Streamed
+    responses are recorded once their content has been sent, including the
+    queries run while producing it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        instrument_templates()
+        request_started.connect(
+            instrument_connections, dispatch_uid="metrics_instrument_connections"
+        )
+
+    def __call__(self, request):
+        """Handle a request under WSGI."""
+        if self.is_async:
+            return self.__acall__(request)
+        started = perf_counter()
+        stats = RequestStats()
+        token = _current.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        """Handle a request under ASGI."""
+        started = perf_counter()
+        stats = RequestStats()
+        token = _current.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, stats, started)
+
+    def _finish(self, request, response, stats: RequestStats, started: float):
+        """Record the request now, or once a streamed body is exhausted."""
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match is not None else UNRESOLVED_VIEW
+
+        if not response.streaming:
+            registry.record(view, perf_counter() - started, stats, len(response.content))
+            return response
+
+        def done(size: int) -> None:
+            registry.record(view, perf_counter() - started, stats, size)
+
+        content = response.streaming_content
+        if response.is_async:
+            response.streaming_content = _count_async(content, stats, done)
+        else:
+            response.streaming_content = _count_sync(content, stats, done)
+        return response
+
+
+def _count_sync(chunks, stats: RequestStats, done):
+    """Yield chunks of a streamed body, reporting its size at the end."""
+    size = 0
+    iterator = iter(chunks)
+    try:
+        while True:
+            # Queries run while producing a chunk belong to the request
+            token = _current.set(stats)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                _current.reset(token)
+            size += len(chunk)
+            yield chunk
+    finally:
+        done(size)
+
+
+async def _count_async(chunks, stats: RequestStats, done):
+    """Yield chunks of an async streamed body, reporting its size at the end."""
+    size = 0
+    iterator = aiter(chunks)
+    try:
+        while True:
+            token = _current.set(stats)
+            try:
+                chunk = await anext(iterator)
+            except StopAsyncIteration:
+                break
+            finally:
+                _current.reset(token)
+            size += len(chunk)
+            yield chunk
+    finally:
+        done(size)
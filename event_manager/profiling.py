@@ -0,0 +1,351 @@
+"""
+On-demand request profiling with cProfile, tracemalloc and an SQL timeline.
+
+Enable by adding 'event_manager.profiling.ProfilingMiddleware' to MIDDLEWARE
+and setting PROFILING_TOKEN, PROFILING_SAMPLE_RATE or both:
+
+    PROFILING_TOKEN = "..."          # profile requests sending 'X-Profile: <token>'
+    PROFILING_SAMPLE_RATE = 0.001    # and this fraction of all other requests
+    PROFILING_MEMORY = False         # trace allocations of sampled requests
+    PROFILING_DIR = "/var/tmp/event_manager_profiles"
+    PROFILING_KEEP = 100             # newest reports kept in PROFILING_DIR
+
+Header triggered requests also trace allocations when they send
+'X-Profile-Memory: 1'. Each profiled request writes a text report and a
+.prof file loadable by pstats or snakeviz, and gets a Server-Timing header.
+Without either setting the middleware removes itself from the stack.
+Only one request per process is profiled at a time: since Python 3.12
+cProfile refuses a second active profiler and records every thread, so
+requests triggered while another one is profiled are served unprofiled.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import random
+import re
+import tempfile
+import threading
+import tracemalloc
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.crypto import constant_time_compare
+
+PROFILE_HEADER = "X-Profile"
+MEMORY_HEADER = "X-Profile-Memory"
+# Rows of each report section
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+# Characters of SQL kept per timeline entry
+SQL_PREVIEW = 1000
+# Frames of tracemalloc tracebacks; more frames cost more memory
+MEMORY_FRAMES = 10
+
+# Held while a request is profiled, see ProfilingMiddleware
+_profiling = threading.Lock()
+# Profiles using the allocation tracing started by _start_tracing
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_started = False
+
+
+def _start_tracing() -> None:
+    """Trace allocations until every caller has called _stop_tracing."""
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_FRAMES)
+            _tracing_started = True
+        _tracing_users += 1
+
+
+def _stop_tracing() -> None:
+    """Stop tracing with the last user, unless someone else started it."""
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+
+class RequestProfile:
+    """cProfile, tracemalloc and SQL timeline of one request."""
+
+    def __init__(self, memory: bool) -> None:
+        self.profiler = cProfile.Profile()
+        self.memory = memory
+        self.tracing = False
+        self.memory_before: Optional[tracemalloc.Snapshot] = None
+        self.memory_after: Optional[tracemalloc.Snapshot] = None
+        # (start offset, duration, sql) per database call, in seconds
+        self.queries: List[Tuple[float, float, str]] = []
+        self.seconds = 0.0
+        self.query_seconds = 0.0
+        self._started = perf_counter()
+        self._resumed = 0.0
+        self._wrappers: Optional[ExitStack] = None
+
+    def __call__(self, execute, sql, params, many, context):
+        """Time one database call, as an execute wrapper."""
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - started
+            self.query_seconds += duration
+            self.queries.append((started - self._started, duration, sql))
+
+    def start(self) -> None:
+        """
+        Start tracing allocations, if requested, and resume profiling.
+        Raises:
+            ValueError: If another profiler is active.
+        """
+        if self.memory:
+            _start_tracing()
+            self.tracing = True
+            self.memory_before = tracemalloc.take_snapshot()
+        self.resume()
+
+    def resume(self) -> None:
+        """
+        Profile the code running from now on, timing this thread's queries.
+        Raises:
+            ValueError: If another profiler is active; nothing is left attached.
+        """
+        self.profiler.enable()
+        self._resumed = perf_counter()
+        self._wrappers = ExitStack()
+        # Connections are per thread; these are the ones the view uses
+        for connection in connections.all():
+            self._wrappers.enter_context(connection.execute_wrapper(self))
+
+    def pause(self) -> None:
+        """Stop profiling until resume() is called; no-op when paused."""
+        if self._wrappers is None:
+            return
+        self.profiler.disable()
+        self.seconds += perf_counter() - self._resumed
+        self._wrappers.close()
+        self._wrappers = None
+
+    def stop(self) -> None:
+        """Pause profiling for good and take the closing memory snapshot."""
+        self.pause()
+        if self.tracing:
+            self.memory_after = tracemalloc.take_snapshot()
+            self.tracing = False
+            _stop_tracing()
+
+    def server_timing(self) -> str:
+        """Return a Server-Timing header value for the time profiled so far."""
+        return (
+            f"app;dur={self.seconds * 1000:.1f}, "
+            f'db;dur={self.query_seconds * 1000:.1f};desc="{len(self.queries)} queries"'
+        )
+
+    def report(self, request_line: str) -> str:
+        """
+        Render the top functions, allocation sites and SQL timeline as text.
+        Args:
+            request_line: Method, path and view of the request.
+        Returns:
+            str: Report text.
+        """
+        out = io.StringIO()
+        out.write(f"{request_line}\n")
+        out.write(
+            f"Profiled {self.seconds * 1000:.1f} ms, {len(self.queries)} queries "
+            f"in {self.query_seconds * 1000:.1f} ms\n"
+        )
+
+        out.write(f"\n== Top {TOP_FUNCTIONS} functions by cumulative time ==\n")
+        stats = pstats.Stats(self.profiler, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+        if self.memory_before is not None and self.memory_after is not None:
+            out.write(f"\n== Top {TOP_ALLOCATIONS} allocation sites by growth ==\n")
+            ignored = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+            growth = self.memory_after.filter_traces(ignored).compare_to(
+                self.memory_before.filter_traces(ignored), "lineno"
+            )
+            for stat in growth[:TOP_ALLOCATIONS]:
+                out.write(f"{stat}\n")
+
+        out.write("\n== SQL timeline ==\n")
+        for offset, duration, sql in self.queries:
+            preview = " ".join(sql.split())[:SQL_PREVIEW]
+            out.write(
+                f"+{offset * 1000:9.1f} ms {duration * 1000:8.2f} ms  {preview}\n"
+            )
+        return out.getvalue()
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests that send the PROFILING_TOKEN header or are sampled.
+    Other requests only pay for one header lookup, plus one random() call
+    when sampling is enabled. Streamed responses are profiled until their
+    body is exhausted, so the report covers rendering the stream; their
+    Server-Timing header can only cover the time before the first byte.
+    Sync only: Django runs it in the thread of the sync views under ASGI,
+    whose queries make up the SQL timeline. cProfile on Python 3.12+ and
+    tracemalloc observe the whole process, so functions and allocation
+    sites of concurrent unprofiled requests can mix in.
+    """
+
+    sync_capable = True
+    async_capable = False
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.token: Optional[str] = getattr(settings, "PROFILING_TOKEN", None)
+        self.sample_rate: float = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+        if not self.token and not self.sample_rate:
+            raise MiddlewareNotUsed
+        self.sample_memory: bool = getattr(settings, "PROFILING_MEMORY", False)
+        self.directory = Path(
+            getattr(settings, "PROFILING_DIR", None)
+            or Path(tempfile.gettempdir()) / "event_manager_profiles"
+        )
+        self.keep: int = getattr(settings, "PROFILING_KEEP", 100)
+
+    def __call__(self, request):
+        """Handle a request, profiling it if triggered."""
+        memory = self.triggered(request)
+        if memory is None:
+            return self.get_response(request)
+
+        # One profiled request per process, the others are not held up
+        if not _profiling.acquire(blocking=False):
+            return self.get_response(request)
+        profile = RequestProfile(memory)
+        try:
+            profile.start()
+        except ValueError:
+            # Another profiling tool, such as a debugger, is active
+            profile.stop()
+            _profiling.release()
+            return self.get_response(request)
+
+        try:
+            response = self.get_response(request)
+            profile.pause()
+            response["Server-Timing"] = profile.server_timing()
+        except BaseException:
+            profile.stop()
+            _profiling.release()
+            raise
+
+        if not response.streaming:
+            self.finish(request, profile)
+            return response
+        response.streaming_content = _ProfiledStream(
+            response.streaming_content, lambda: self.finish(request, profile), profile
+        )
+        return response
+
+    def triggered(self, request) -> Optional[bool]:
+        """
+        Decide whether to profile a request.
+        Args:
+            request: The HTTP request object.
+        Returns:
+            Optional[bool]: None to skip profiling, else whether to trace memory.
+        """
+        header = request.headers.get(PROFILE_HEADER)
+        if header is not None and self.token:
+            if constant_time_compare(header, self.token):
+                return request.headers.get(MEMORY_HEADER) == "1"
+            return None
+        if self.sample_rate and random.random() < self.sample_rate:
+            return self.sample_memory
+        return None
+
+    def finish(self, request, profile: RequestProfile) -> None:
+        """Write the reports of a profiled request, rotate old ones and let
+        the next request be profiled."""
+        try:
+            self.write_reports(request, profile)
+        finally:
+            _profiling.release()
+
+    def write_reports(self, request, profile: RequestProfile) -> None:
+        """Stop profiling a request and write its reports."""
+        profile.stop()
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match is not None else "unresolved"
+        # Names sort chronologically, which rotate() relies on
+        stem = "{}-{}-{}".format(
+            datetime.now().strftime("%Y%m%dT%H%M%S%f"),
+            os.getpid(),
+            re.sub(r"[^\w.-]+", "_", view),
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        report = profile.report(f"{request.method} {request.get_full_path()} ({view})")
+        (self.directory / f"{stem}.txt").write_text(report)
+        profile.profiler.dump_stats(self.directory / f"{stem}.prof")
+        rotate(self.directory, self.keep)
+
+
+class _ProfiledStream:
+    """
+    Streamed body whose chunks are produced under the profiler.
+    on_close runs once, when the body is exhausted or the response closed,
+    even if the body was never iterated.
+    """
+
+    def __init__(self, chunks, on_close, profile: RequestProfile) -> None:
+        self.iterator = iter(chunks)
+        self.on_close = on_close
+        self.profile = profile
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            self.profile.resume()
+        except ValueError:
+            # Another profiling tool took over, keep streaming unprofiled
+            pass
+        try:
+            return next(self.iterator)
+        except BaseException:
+            # StopIteration included: the body is done
+            self.close()
+            raise
+        finally:
+            self.profile.pause()
+
+    def close(self) -> None:
+        """Finish the profile once."""
+        if not self.closed:
+            self.closed = True
+            self.on_close()
+
+
+def rotate(directory: Path, keep: int) -> None:
+    """
+    Delete all but the newest keep reports in directory.
+    Args:
+        directory: Report directory.
+        keep: Number of reports to keep.
+    """
+    reports = sorted(directory.glob("*.txt"), key=lambda path: path.name, reverse=True)
+    for report in reports[keep:]:
+        report.unlink(missing_ok=True)
+        report.with_suffix(".prof").unlink(missing_ok=True)
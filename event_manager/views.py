@@ -1,7 +1,11 @@
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.utils.crypto import constant_time_compare
+from apps.events.cache import metrics as cache_metrics
 from apps.events.models import Event
+from .metrics import registry, render_prometheus
 
 
 def index(request: HttpRequest) -> HttpResponse:
@@ -35,6 +39,26 @@ def home(request: HttpRequest) -> HttpResponse:
     return render(request, "home.html", {"events": events})
 
 
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Expose per-view request metrics and cache counters to Prometheus.
+    If the METRICS_TOKEN setting is set, scrapers must send it as a bearer token.
+    Args:
+        request: The HTTP request object from the scraper.
+    Returns:
+        HttpResponse: Metrics in the Prometheus text format, or 401.
+    """
+    token = getattr(settings, "METRICS_TOKEN", None)
+    if token and not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse("Unauthorized", status=401, content_type="text/plain")
+    return HttpResponse(
+        render_prometheus(registry.snapshot(), cache_metrics.snapshot()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 """
 Custom error handlers for HTTP status codes.
 
@@ -0,0 +1,46 @@
+from unittest import mock
+from django.test import SimpleTestCase, TestCase
+from benchmarks import datasets
+from benchmarks.runner import compare, run_scale
+
+
+def results(median_ms, queries):
+    """Return a one-scenario benchmark result."""
+    result = {"median_ms": median_ms, "queries": queries}
+    return {"scales": {"1k": {"results": {"browse_events": result}}}}
+
+
+class CompareTest(SimpleTestCase):
+    """Test cases for baseline comparison of benchmark results."""
+
+    def test_slowdown_beyond_threshold_regresses(self):
+        """Test that only slowdowns above the threshold and noise floor count."""
+        self.assertEqual(compare(results(11.5, 3), results(10.0, 3), 0.2), [])
+        self.assertEqual(compare(results(1.5, 3), results(1.0, 3), 0.2), [])
+        self.assertEqual(len(compare(results(13.0, 3), results(10.0, 3), 0.2)), 1)
+
+    def test_more_queries_regress(self):
+        """Test that any extra query is a regression."""
+        regressions = compare(results(10.0, 4), results(10.0, 3))
+        self.assertEqual(regressions, ["[1k] browse_events: 4 queries, baseline 3"])
+
+
+class RunScaleTest(TestCase):
+    """Smoke test of the benchmark scenarios on a tiny dataset."""
+
+    def test_scenarios_run(self):
+        """Test that every scenario runs and counts its queries."""
+        with mock.patch.dict(datasets.SCALES, {"tiny": 100}):
+            run = run_scale("tiny", warmup=0, repeat=1, log=lambda message: None)
+        self.assertEqual(
+            set(run["results"]),
+            {
+                "browse_events",
+                "event_list_api",
+                "export_registrations_csv",
+                "cancel_event",
+                "register_for_event",
+            },
+        )
+        for result in run["results"].values():
+            self.assertGreater(result["queries"], 0)
@@ -0,0 +1,128 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.events.deletion import delete_events, delete_users
+from apps.events.models import CreatorStats, Event, EventRegistration, EventStats
+from apps.events.search import FTS_TABLE
+from apps.events.stats import rebuild_creator_stats
+from apps.users.models import CustomUser
+from tests.factories import (
+    CreatorFactory,
+    EventFactory,
+    RegistrationFactory,
+    VisitorFactory,
+)
+
+COUNTERS = (
+    "active_events",
+    "completed_events",
+    "cancelled_events",
+    "active_registrations",
+    "waitlisted_registrations",
+    "cancelled_registrations",
+)
+
+
+class BulkDeleteTest(TestCase):
+    """Test cases for chunked deletion of events and users."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.doomed = EventFactory(created_by=self.creator)
+        self.kept = EventFactory(created_by=self.creator, capacity=2)
+        self.visitor = VisitorFactory()
+        RegistrationFactory.create_batch(5, event=self.doomed)
+        RegistrationFactory(event=self.doomed, user=self.visitor)
+        RegistrationFactory(event=self.kept, user=self.visitor)
+        RegistrationFactory(event=self.kept)
+        self.waiting = RegistrationFactory(event=self.kept, status="waitlisted")
+
+    def rollup(self):
+        """Return the creator's rollup counters as a dict."""
+        stats = CreatorStats.objects.get(pk=self.creator.pk)
+        return {name: getattr(stats, name) for name in COUNTERS}
+
+    def indexed(self, event_id):
+        """Return whether an event has a full-text index entry."""
+        if connection.vendor != "sqlite":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT 1 FROM {FTS_TABLE} WHERE rowid = %s", [event_id])
+            return cursor.fetchone() is not None
+
+    def test_delete_events_in_chunks_keeps_rollups_consistent(self):
+        """Test that chunked deletion leaves the rollups equal to a rebuild."""
+        logged = []
+        result = delete_events(
+            Event.objects.filter(pk=self.doomed.pk), batch_size=2, log=logged.append
+        )
+
+        self.assertEqual((result.events, result.registrations), (1, 6))
+        self.assertIn("Deleted 6 registrations", logged)
+        self.assertFalse(Event.objects.filter(pk=self.doomed.pk).exists())
+        self.assertFalse(EventStats.objects.filter(pk=self.doomed.pk).exists())
+        self.assertEqual(EventRegistration.objects.count(), 3)
+        self.assertFalse(self.indexed(self.doomed.pk))
+        incremental = self.rollup()
+        rebuild_creator_stats()
+        self.assertEqual(incremental, self.rollup())
+
+    def test_delete_events_with_signals(self):
+        """Test that the collector path gives the same result."""
+        result = delete_events(
+            Event.objects.filter(pk=self.doomed.pk), batch_size=4, send_signals=True
+        )
+        self.assertEqual((result.events, result.registrations), (1, 6))
+        self.assertFalse(self.indexed(self.doomed.pk))
+        incremental = self.rollup()
+        rebuild_creator_stats()
+        self.assertEqual(incremental, self.rollup())
+
+    def test_delete_users_frees_seats_for_the_waitlist(self):
+        """Test that deleting a visitor promotes the head of the waitlist."""
+        result = delete_users(CustomUser.objects.filter(pk=self.visitor.pk))
+
+        self.assertEqual((result.users, result.registrations), (1, 2))
+        self.waiting.refresh_from_db()
+        self.kept.refresh_from_db()
+        self.assertEqual(self.waiting.status, "registered")
+        self.assertEqual(self.kept.registration_count, 2)
+        incremental = self.rollup()
+        rebuild_creator_stats()
+        self.assertEqual(incremental, self.rollup())
+
+    def test_delete_creator_removes_events(self):
+        """Test that deleting a creator removes their events and rollup."""
+        result = delete_users(CustomUser.objects.filter(pk=self.creator.pk))
+        self.assertEqual((result.users, result.events, result.registrations), (1, 2, 9))
+        self.assertFalse(EventRegistration.objects.exists())
+        self.assertFalse(CreatorStats.objects.filter(pk=self.creator.pk).exists())
+
+    def test_command_confirms_and_reports(self):
+        """Test the management command, its prompt and its progress output."""
+        with self.assertRaises(CommandError):
+            call_command("bulk_delete", "events", "0", no_input=True, stdout=StringIO())
+
+        out = StringIO()
+        call_command(
+            "bulk_delete",
+            "events",
+            str(self.doomed.pk),
+            "--batch-size=4",
+            "--no-input",
+            stdout=out,
+        )
+        self.assertIn("Deleted 4 registrations", out.getvalue())
+        self.assertIn("Deleted 0 users, 1 events and 6 registrations.", out.getvalue())
+
+    def test_api_destroy_uses_bulk_path(self):
+        """Test that deleting an event through the API removes its rows."""
+        client = APIClient()
+        client.force_authenticate(self.creator)
+        response = client.delete(f"/api/events/{self.doomed.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(EventRegistration.objects.filter(event=self.doomed).exists())
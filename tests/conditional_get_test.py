@@ -0,0 +1,114 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.cache import metrics
+from apps.events.services import register_user
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+
+class ConditionalGetTest(APITestCase):
+    """Test cases for ETag / Last-Modified handling of event endpoints."""
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        self.event = EventFactory(created_by=self.creator)
+        self.detail_url = f"/api/events/{self.event.pk}/"
+        self.client.force_authenticate(user=self.visitor)
+
+    def test_unchanged_detail_answers_304_without_serializing(self):
+        """Test that a matching ETag short-circuits before the payload cache."""
+        response = self.client.get(self.detail_url)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+        metrics.reset()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(metrics.snapshot(), {})
+
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_changes_produce_a_new_etag(self):
+        """Test that edits, counter updates and the user's state move the ETag."""
+        etag = self.client.get("/api/events/upcoming/")["ETag"]
+
+        register_user(VisitorFactory(), self.event)
+        response = self.client.get("/api/events/upcoming/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        register_user(self.visitor, self.event)
+        response = self.client.get("/api/events/upcoming/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["results"][0]["is_registered"])
+
+    def test_list_validators_probe_only_the_page(self):
+        """Test that a 304 for a list reads the page keys, not the whole set."""
+        EventFactory.create_batch(3, created_by=self.creator)
+        url = "/api/events/?page_size=2"
+        etag = self.client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        event_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "events_event"' in query["sql"]
+        ]
+        self.assertEqual(len(event_queries), 1)
+        self.assertNotIn("COUNT(", event_queries[0])
+        self.assertIn("LIMIT 3", event_queries[0])
+
+        response = self.client.get(url + "&cursor=invalid", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_patch_requires_matching_if_match(self):
+        """Test that a stale If-Match is rejected with 412."""
+        self.client.force_authenticate(user=self.creator)
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        response = self.client.patch(
+            self.detail_url, {"title": "First edit"}, HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+        response = self.client.patch(
+            self.detail_url, {"title": "Lost update"}, HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.title, "First edit")
+
+    def test_registration_list_follows_event_changes(self):
+        """Test that registration lists revalidate when their events change."""
+        register_user(self.visitor, self.event)
+        etag = self.client.get("/api/registrations/")["ETag"]
+        response = self.client.get("/api/registrations/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.event.title = "Renamed event"
+        self.event.save()
+        response = self.client.get("/api/registrations/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_event_details_page_answers_304(self):
+        """Test that the event details page supports conditional GET."""
+        self.client.force_login(self.visitor)
+        url = reverse("events:event_details", args=[self.event.pk])
+        # The first visit sets the CSRF cookie, which the page depends on
+        self.client.get(url)
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,84 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.models import CreatorStats, Event, EventStats
+from apps.events.services import register_user
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+COUNTERS = (
+    "active_events",
+    "completed_events",
+    "cancelled_events",
+    "active_registrations",
+    "waitlisted_registrations",
+    "cancelled_registrations",
+)
+
+
+class CreatorStatsTest(APITestCase):
+    """Test cases for the incrementally maintained stats rollup."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator, capacity=1)
+        self.other = EventFactory(created_by=self.creator)
+
+    def rollup(self):
+        """Return the creator's rollup counters as a dict."""
+        stats = CreatorStats.objects.get(pk=self.creator.pk)
+        return {name: getattr(stats, name) for name in COUNTERS}
+
+    def test_rollup_follows_transitions_and_matches_rebuild(self):
+        """Test that incremental updates agree with a full rebuild."""
+        first, second, third = VisitorFactory.create_batch(3)
+        register_user(first, self.event)
+        register_user(second, self.event)
+        register_user(third, self.other).registration.cancel_registration()
+        register_user(first, self.other)
+
+        self.assertEqual(
+            self.rollup(),
+            {
+                "active_events": 2,
+                "completed_events": 0,
+                "cancelled_events": 0,
+                "active_registrations": 2,
+                "waitlisted_registrations": 1,
+                "cancelled_registrations": 1,
+            },
+        )
+
+        self.event.cancel_event(self.creator)
+        stats = EventStats.objects.get(pk=self.event.pk)
+        self.assertEqual(stats.cancelled_registrations, 2)
+        self.assertEqual(stats.total_registrations, 2)
+
+        Event.objects.filter(pk=self.other.pk).delete()
+        incremental = self.rollup()
+        self.assertEqual(incremental["cancelled_events"], 1)
+        self.assertEqual(incremental["active_events"], 0)
+
+        call_command("rebuild_creator_stats", chunk_size=1, stdout=StringIO())
+        self.assertEqual(self.rollup(), incremental)
+
+    def test_stats_endpoint_reads_the_rollup(self):
+        """Test that the dashboard is one rollup read plus a breakdown page."""
+        register_user(VisitorFactory(), self.event)
+        EventFactory.create_batch(5, created_by=self.creator)
+        self.client.force_authenticate(user=self.creator)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/events/stats/", {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_events"], 7)
+        self.assertEqual(response.data["total_registrations"], 1)
+        self.assertEqual(len(response.data["events"]["results"]), 2)
+        self.assertIsNotNone(response.data["events"]["next"])
+        self.assertEqual(len(context.captured_queries), 2)
+
+        row = response.data["events"]["results"][0]
+        self.assertEqual(row["id"], self.event.pk)
+        self.assertEqual(row["active_registrations"], 1)
@@ -0,0 +1,130 @@
+from io import StringIO
+from unittest import mock
+from django.core import mail
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from apps.users.models import OutboxBroadcast, OutboxEmail
+from apps.users.outbox import (
+    CLAIM_LEASE_SECONDS,
+    MAX_ATTEMPTS,
+    build_message,
+    deliver_batch,
+    expand_broadcasts,
+)
+from tests.factories import CreatorFactory, EventFactory, RegistrationFactory
+
+
+class EmailOutboxTest(TestCase):
+    """Test cases for the transactional email outbox."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator)
+        self.registrations = RegistrationFactory.create_batch(3, event=self.event)
+        self.client = Client()
+
+    def cancel_event(self):
+        """Cancel the event through the web view and fan out its emails."""
+        self.client.force_login(self.creator)
+        self.client.post(reverse("events:cancel_event", args=[self.event.pk]))
+        expand_broadcasts()
+
+    def test_cancel_event_queues_instead_of_sending(self):
+        """Test that cancelling an event queues one broadcast for all registrants."""
+        self.client.force_login(self.creator)
+        self.client.post(reverse("events:cancel_event", args=[self.event.pk]))
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboxBroadcast.objects.count(), 1)
+        self.assertEqual(OutboxEmail.objects.count(), 0)
+
+        self.assertEqual(expand_broadcasts(), 3)
+        self.assertEqual(OutboxBroadcast.objects.count(), 0)
+        self.assertEqual(
+            set(OutboxEmail.objects.values_list("context__registration_id", flat=True)),
+            {registration.pk for registration in self.registrations},
+        )
+
+    def test_worker_delivers_pending_emails(self):
+        """Test that the worker sends queued emails and marks them as sent."""
+        self.cancel_event()
+        call_command("send_outbox_emails", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboxEmail.objects.filter(status="sent").count(), 3)
+        self.assertIn(self.event.title, mail.outbox[0].body)
+
+    def test_failure_is_retried_with_backoff(self):
+        """Test that a failing message is rescheduled without blocking others."""
+        self.cancel_event()
+        failing = OutboxEmail.objects.first()
+
+        def build(email, resolved, connection=None):
+            if email.pk == failing.pk:
+                raise ConnectionError("SMTP down")
+            return build_message(email, resolved, connection)
+
+        with mock.patch("apps.users.outbox.build_message", side_effect=build):
+            sent, failed = deliver_batch()
+
+        self.assertEqual((sent, failed), (2, 1))
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, "pending")
+        self.assertEqual(failing.attempts, 1)
+        self.assertIn("SMTP down", failing.last_error)
+        self.assertEqual(deliver_batch(), (0, 0))
+
+    def test_sent_messages_are_marked_one_by_one(self):
+        """Test that messages sent before a crash are not delivered again."""
+        self.cancel_event()
+        first, second = OutboxEmail.objects.order_by("id")[:2]
+
+        def send(connection, messages):
+            if len(mail.outbox) == 1:
+                raise KeyboardInterrupt
+            mail.outbox.extend(messages)
+            return len(messages)
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            autospec=True,
+            side_effect=send,
+        ), self.assertRaises(KeyboardInterrupt):
+            deliver_batch()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.status, second.status), ("sent", "pending"))
+
+    def test_connection_failure_reschedules_the_batch(self):
+        """Test that a connection that cannot be opened counts as failed."""
+        self.cancel_event()
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=ConnectionError("refused"),
+        ):
+            self.assertEqual(deliver_batch(), (0, 3))
+        email = OutboxEmail.objects.first()
+        self.assertEqual((email.status, email.attempts), ("pending", 1))
+        self.assertIn("refused", email.last_error)
+
+    def test_lease_covers_rate_limited_batches(self):
+        """Test that the claim lease grows with the time a paced batch takes."""
+        self.cancel_event()
+        with mock.patch("apps.users.outbox.claim_batch", return_value=[]) as claim:
+            deliver_batch(100, rate=0.25)
+        self.assertEqual(claim.call_args.args, (100, CLAIM_LEASE_SECONDS + 400))
+
+    def test_message_fails_after_max_attempts(self):
+        """Test that a message is marked as failed after the last attempt."""
+        self.cancel_event()
+        email = OutboxEmail.objects.first()
+        OutboxEmail.objects.exclude(pk=email.pk).delete()
+        OutboxEmail.objects.filter(pk=email.pk).update(attempts=MAX_ATTEMPTS - 1)
+
+        with mock.patch(
+            "apps.users.outbox.build_message", side_effect=ConnectionError("down")
+        ):
+            deliver_batch()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, "failed")
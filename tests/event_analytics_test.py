@@ -0,0 +1,66 @@
+from datetime import datetime, timezone as dt_timezone
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.cache import metrics
+from apps.events.models import EventRegistration
+from tests.factories import CreatorFactory, EventFactory, RegistrationFactory, VisitorFactory
+
+
+def at(day, hour=12):
+    """Return a UTC datetime in May 2026."""
+    return datetime(2026, 5, day, hour, tzinfo=dt_timezone.utc)
+
+
+class EventAnalyticsTest(APITestCase):
+    """Test cases for the registration time-series endpoint."""
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator)
+        self.url = f"/api/events/{self.event.pk}/analytics/"
+        # Registered on May 4 (twice) and 6, one of them cancelled on May 7
+        history = ((4, 4, "registered"), (4, 7, "cancelled"), (6, 6, "registered"))
+        for day, changed, state in history:
+            registration = RegistrationFactory(event=self.event)
+            EventRegistration.objects.filter(pk=registration.pk).update(
+                registered_at=at(day), updated_at=at(changed), status=state
+            )
+        self.client.force_authenticate(user=self.creator)
+
+    def test_daily_series(self):
+        """Test that registrations and cancellations land in their day buckets."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["interval"], "day")
+        self.assertEqual(response.data["buckets"][0], at(4, 0))
+        self.assertEqual(response.data["registrations"], [2, 0, 1, 0])
+        self.assertEqual(response.data["cancellations"], [0, 0, 0, 1])
+        self.assertEqual(response.data["cumulative"], [2, 2, 3, 2])
+
+    def test_weekly_buckets_start_on_monday(self):
+        """Test that weekly buckets are aligned to Mondays."""
+        response = self.client.get(self.url, {"interval": "week"})
+        self.assertEqual(response.data["buckets"], [at(4, 0)])
+        self.assertEqual(response.data["registrations"], [3])
+
+    def test_cached_until_registrations_change(self):
+        """Test that the series is cached per event version."""
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.assertEqual(metrics.snapshot()["event_analytics"], {"hits": 1, "misses": 1})
+
+        RegistrationFactory(event=self.event)
+        response = self.client.get(self.url)
+        self.assertEqual(sum(response.data["registrations"]), 4)
+
+    def test_rejects_other_users_and_bad_intervals(self):
+        """Test permission and interval validation."""
+        response = self.client.get(self.url, {"interval": "minute"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=VisitorFactory())
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.events.cache import metrics
+from apps.events.models import Event
+from apps.events.services import register_user
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+
+class EventCacheTest(APITestCase):
+    """Test cases for the versioned event response cache."""
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        self.event = EventFactory(created_by=self.creator)
+        self.detail_url = f"/api/events/{self.event.pk}/"
+        self.client.force_authenticate(user=self.visitor)
+
+    def test_detail_is_served_from_cache_until_event_changes(self):
+        """Test that saving an event invalidates exactly its cached detail."""
+        first = self.client.get(self.detail_url)
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get(self.detail_url)
+        self.assertEqual(first.content, second.content)
+        # Only the MAX(updated_at) validator probe reads the events table
+        event_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if "events_event\"" in query["sql"]
+        ]
+        self.assertEqual(len(event_queries), 1)
+        self.assertIn("MAX(", event_queries[0])
+        self.assertEqual(metrics.snapshot()["event_detail"], {"hits": 1, "misses": 1})
+
+        self.event.title = "Renamed event"
+        self.event.save()
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["title"], "Renamed event")
+        self.assertEqual(metrics.snapshot()["event_detail"]["misses"], 2)
+
+    def test_registration_updates_count_and_user_flags(self):
+        """Test that registrations invalidate the count and flags stay per user."""
+        self.client.get(self.detail_url)
+        register_user(self.visitor, self.event)
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["registered_count"], 1)
+        self.assertTrue(response.data["is_registered"])
+        self.assertFalse(response.data["can_register"])
+
+        self.client.force_authenticate(user=VisitorFactory())
+        response = self.client.get(self.detail_url)
+        self.assertFalse(response.data["is_registered"])
+        self.assertTrue(response.data["can_register"])
+        self.assertEqual(metrics.snapshot()["event_detail"]["hits"], 1)
+
+    def test_list_is_invalidated_by_new_and_deleted_events(self):
+        """Test that collection changes invalidate cached lists."""
+        self.client.get("/api/events/")
+        self.assertEqual(len(self.client.get("/api/events/").data["results"]), 1)
+        self.assertEqual(metrics.snapshot()["event_list"]["hits"], 1)
+
+        EventFactory(created_by=self.creator)
+        self.assertEqual(len(self.client.get("/api/events/").data["results"]), 2)
+
+        Event.objects.filter(pk=self.event.pk).delete()
+        self.assertEqual(len(self.client.get("/api/events/upcoming/").data["results"]), 1)
+
+    def test_event_details_page_uses_cache(self):
+        """Test that the event details page reuses the cached event."""
+        self.client.force_login(self.visitor)
+        url = reverse("events:event_details", args=[self.event.pk])
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertTrue(response.context["can_register"])
+        self.assertEqual(metrics.snapshot()["event_details"], {"hits": 1, "misses": 1})
@@ -0,0 +1,125 @@
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+from apps.events.models import CreatorStats, Event, EventRegistration, EventStats
+from apps.events.services import cancel_event
+from apps.users.models import OutboxBroadcast
+from tests.factories import (
+    CreatorFactory,
+    EventFactory,
+    RegistrationFactory,
+    VisitorFactory,
+)
+
+
+class CancelEventServiceTest(TestCase):
+    """Test cases for the chunked event cancellation service."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator, capacity=5)
+        self.registered = RegistrationFactory.create_batch(5, event=self.event)
+        self.waitlisted = RegistrationFactory.create_batch(
+            2, event=self.event, status="waitlisted"
+        )
+
+    def test_cancels_in_chunks_and_reports_users(self):
+        """Test that chunks return every active registration with its user."""
+        chunks, progress = [], []
+        result = cancel_event(
+            self.event,
+            self.creator,
+            notify=lambda event, rows: chunks.append(rows),
+            progress=progress.append,
+            batch_size=2,
+        )
+
+        self.assertEqual((result.cancelled, result.dropped), (5, 2))
+        self.assertEqual([len(rows) for rows in chunks], [2, 2, 1])
+        self.assertEqual(
+            sorted(row for rows in chunks for row in rows),
+            sorted((r.pk, r.user_id) for r in self.registered),
+        )
+        self.assertEqual(progress, [2, 4, 5, 7])
+        self.assertFalse(
+            EventRegistration.objects.exclude(status="cancelled").exists()
+        )
+
+    def test_fallback_without_returning(self):
+        """Test the locking SELECT path used by databases without RETURNING."""
+        chunks = []
+        with mock.patch.object(connection, "vendor", "mysql"):
+            result = cancel_event(
+                self.event,
+                self.creator,
+                notify=lambda event, rows: chunks.append(rows),
+                batch_size=4,
+            )
+        self.assertEqual((result.cancelled, result.dropped), (5, 2))
+        self.assertEqual(
+            sorted(row for rows in chunks for row in rows),
+            sorted((r.pk, r.user_id) for r in self.registered),
+        )
+
+    def test_fallback_on_sqlite_without_returning(self):
+        """Test that SQLite before 3.35 takes the locking SELECT path too."""
+        chunks = []
+        with mock.patch.object(
+            connection.features, "can_return_columns_from_insert", False
+        ), mock.patch.object(connection, "vendor", "sqlite"):
+            result = cancel_event(
+                self.event,
+                self.creator,
+                notify=lambda event, rows: chunks.append(rows),
+                batch_size=4,
+            )
+        self.assertEqual((result.cancelled, result.dropped), (5, 2))
+        self.assertEqual(
+            sorted(row for rows in chunks for row in rows),
+            sorted((r.pk, r.user_id) for r in self.registered),
+        )
+
+    def test_counters_and_rollups_stay_consistent(self):
+        """Test that the event, its counter and the stats rollups are updated."""
+        cancel_event(self.event, self.creator, batch_size=3)
+
+        self.assertEqual(self.event.status, "cancelled")
+        self.assertFalse(self.event.is_dirty())
+        stored = Event.objects.get(pk=self.event.pk)
+        self.assertEqual((stored.status, stored.registration_count), ("cancelled", 0))
+        stats = EventStats.objects.get(pk=self.event.pk)
+        self.assertEqual(stats.cancelled_registrations, 7)
+        self.assertEqual(stats.active_registrations + stats.waitlisted_registrations, 0)
+
+        incremental = CreatorStats.objects.values().get(creator=self.creator)
+        call_command("rebuild_creator_stats", stdout=StringIO())
+        self.assertEqual(
+            CreatorStats.objects.values().get(creator=self.creator), incremental
+        )
+
+    def test_rejects_other_users_and_cancelled_events(self):
+        """Test that only the creator can cancel, and only once."""
+        with self.assertRaises(PermissionError):
+            cancel_event(self.event, VisitorFactory())
+        cancel_event(self.event, self.creator)
+        # A stale instance is checked against the locked row
+        with self.assertRaisesMessage(ValueError, "Event is already cancelled."):
+            cancel_event(Event.objects.filter(pk=self.event.pk).first(), self.creator)
+
+    def test_api_cancel_queues_one_broadcast(self):
+        """Test that the API action reports counts and hands off notification."""
+        client = APIClient()
+        client.force_authenticate(user=self.creator)
+        response = client.post(f"/api/events/{self.event.pk}/cancel/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["cancelled_registrations"], 5)
+        self.assertEqual(response.data["dropped_waitlist"], 2)
+        [broadcast] = OutboxBroadcast.objects.all()
+        self.assertEqual(len(broadcast.recipients), 5)
+        self.assertEqual(
+            client.post(f"/api/events/{self.event.pk}/cancel/").status_code, 400
+        )
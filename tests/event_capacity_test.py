@@ -0,0 +1,107 @@
+import threading
+from unittest import skipUnless
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from apps.events.models import EventRegistration
+from apps.events.services import (
+    ALREADY_REGISTERED,
+    REGISTERED,
+    WAITLISTED,
+    register_user,
+)
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+
+class EventCapacityTest(TestCase):
+    """Test cases for seat allocation and the waitlist."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator, capacity=2)
+        self.visitors = VisitorFactory.create_batch(4)
+
+    def test_registrations_over_capacity_are_waitlisted(self):
+        """Test that registrants beyond the capacity join the waitlist."""
+        outcomes = [register_user(v, self.event).outcome for v in self.visitors]
+        self.assertEqual(outcomes, [REGISTERED, REGISTERED, WAITLISTED, WAITLISTED])
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 2)
+        self.assertTrue(self.event.is_full)
+        self.assertEqual(
+            EventRegistration.objects.filter(status="registered").count(), 2
+        )
+
+    def test_waitlisted_twice(self):
+        """Test that joining the waitlist again is reported, not duplicated."""
+        for visitor in self.visitors[:3]:
+            register_user(visitor, self.event)
+        result = register_user(self.visitors[2], self.event)
+        self.assertEqual(result.outcome, ALREADY_REGISTERED)
+        self.assertEqual(result.message, "You are already on the waitlist for this event.")
+
+    def test_cancellation_promotes_waitlist_in_order(self):
+        """Test that a freed seat goes to the earliest waitlisted registrant."""
+        registrations = [
+            register_user(v, self.event).registration for v in self.visitors
+        ]
+        registrations[0].cancel_registration()
+
+        statuses = dict(
+            EventRegistration.objects.values_list("user_id", "status")
+        )
+        self.assertEqual(statuses[self.visitors[2].pk], "registered")
+        self.assertEqual(statuses[self.visitors[3].pk], "waitlisted")
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 2)
+
+    def test_raising_capacity_promotes_waitlist(self):
+        """Test that raising the capacity fills the new seats from the waitlist."""
+        for visitor in self.visitors:
+            register_user(visitor, self.event)
+        self.event.capacity = 10
+        self.event.save()
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 4)
+        self.assertFalse(EventRegistration.objects.filter(status="waitlisted").exists())
+
+
+@skipUnless(connection.vendor == "postgresql", "Needs row level locking")
+class EventCapacityConcurrencyTest(TransactionTestCase):
+    """Load test: concurrent registrants never oversell an event."""
+
+    REGISTRANTS = 200
+    CAPACITY = 50
+
+    def test_concurrent_registrations_do_not_oversell(self):
+        """Test that parallel registrations fill exactly the capacity."""
+        event = EventFactory(created_by=CreatorFactory(), capacity=self.CAPACITY)
+        visitors = VisitorFactory.create_batch(self.REGISTRANTS)
+        barrier = threading.Barrier(20)
+
+        def register(chunk):
+            barrier.wait()
+            try:
+                for visitor in chunk:
+                    register_user(visitor, event)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=register, args=(visitors[i::20],))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        event.refresh_from_db()
+        registered = EventRegistration.objects.filter(event=event, status="registered")
+        self.assertEqual(event.registration_count, self.CAPACITY)
+        self.assertEqual(registered.count(), self.CAPACITY)
+        self.assertEqual(
+            EventRegistration.objects.filter(event=event, status="waitlisted").count(),
+            self.REGISTRANTS - self.CAPACITY,
+        )
@@ -1,7 +1,13 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.core.exceptions import ValidationError, PermissionDenied
 from datetime import timedelta
 from django.utils import timezone
+from apps.events.models import Event, local_datetime
 from tests.factories import (
     CreatorFactory,
     VisitorFactory,
@@ -160,3 +166,217 @@ class RegistrationModelTest(TestCase):
         registration = RegistrationFactory(user=self.visitor, event=self.event)
         expected = f"{self.visitor.email} - {self.event.title}"
         self.assertEqual(str(registration), expected)
+
+
+class RegistrationCountTest(TestCase):
+    """Test cases for the maintained Event.registration_count column."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator)
+
+    def test_count_follows_register_cancel_and_reregister(self):
+        """Test counter changes on every registration status transition."""
+        registration = RegistrationFactory(event=self.event)
+        RegistrationFactory(event=self.event)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 2)
+
+        registration.cancel_registration()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 1)
+
+        registration.status = "registered"
+        registration.save()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 2)
+
+    def test_event_save_does_not_overwrite_counter(self):
+        """Test that saving a stale event instance keeps the stored counter."""
+        stale_event = Event.objects.get(pk=self.event.pk)
+        RegistrationFactory(event=self.event)
+        stale_event.title = "Renamed Event"
+        stale_event.save()
+        stale_event.refresh_from_db()
+        self.assertEqual(stale_event.registration_count, 1)
+
+    def test_cancel_event_resets_counter(self):
+        """Test that cancelling an event releases all active registrations."""
+        RegistrationFactory.create_batch(3, event=self.event)
+        self.event.cancel_event(user=self.creator)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 0)
+
+    def test_reconcile_command_fixes_drift(self):
+        """Test that the reconcile command restores the real count."""
+        RegistrationFactory.create_batch(2, event=self.event)
+        Event.objects.filter(pk=self.event.pk).update(registration_count=7)
+        call_command("reconcile_registration_counts", chunk_size=1, stdout=StringIO())
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 2)
+
+
+class DirtyFieldTrackingTest(TestCase):
+    """Test cases for snapshot-based dirty field tracking on saves."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator)
+
+    def test_loaded_event_tracks_changes(self):
+        """Test that changed fields are reported with their stored values."""
+        event = Event.objects.get(pk=self.event.pk)
+        self.assertEqual(event.get_dirty_fields(), {})
+        event.title = "Changed Title"
+        self.assertEqual(event.get_dirty_fields(), {"title": self.event.title})
+
+    def test_unchanged_save_is_noop(self):
+        """Test that saving an unchanged instance does not touch the database."""
+        event = Event.objects.get(pk=self.event.pk)
+        registration = RegistrationFactory(event=event)
+        with self.assertNumQueries(0):
+            event.save()
+            registration.save()
+
+    def test_save_writes_only_changed_columns(self):
+        """Test that an edit skips the status re-read and updates dirty columns only."""
+        event = Event.objects.get(pk=self.event.pk)
+        event.location = "New Location"
+        with CaptureQueriesContext(connection) as context:
+            event.save()
+        event_queries = [
+            query["sql"] for query in context.captured_queries
+            if '"events_event"' in query["sql"]
+        ]
+        self.assertEqual(len(event_queries), 1)
+        sql = event_queries[0]
+        self.assertTrue(sql.startswith("UPDATE"))
+        self.assertIn('"location"', sql)
+        self.assertIn('"updated_at"', sql)
+        self.assertNotIn('"description"', sql)
+        self.assertEqual(event.get_dirty_fields(), {})
+
+
+class RegistrationStateAnnotationTest(TestCase):
+    """Test cases for EventQuerySet.with_registration_state."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        self.open_event = EventFactory(created_by=self.creator)
+        self.registered_event = EventFactory(created_by=self.creator)
+        self.cancelled_event = EventFactory(created_by=self.creator, status="cancelled")
+        RegistrationFactory(user=self.visitor, event=self.registered_event)
+
+    def test_visitor_flags(self):
+        """Test flags for open, registered and cancelled events."""
+        events = Event.objects.with_registration_state(self.visitor).in_bulk()
+        self.assertTrue(events[self.open_event.pk].user_can_register)
+        self.assertFalse(events[self.open_event.pk].is_registered)
+        self.assertTrue(events[self.registered_event.pk].is_registered)
+        self.assertFalse(events[self.registered_event.pk].user_can_register)
+        self.assertFalse(events[self.cancelled_event.pk].user_can_register)
+
+    def test_waitlisted_counts_as_registered(self):
+        """Test that a waitlisted visitor is offered cancelling, not registering."""
+        waitlisted_event = EventFactory(created_by=self.creator)
+        RegistrationFactory(user=self.visitor, event=waitlisted_event, status="waitlisted")
+        event = Event.objects.with_registration_state(self.visitor).get(
+            pk=waitlisted_event.pk
+        )
+        self.assertTrue(event.is_registered and event.is_waitlisted)
+        self.assertFalse(event.user_can_register)
+        self.assertFalse(Event.objects.get(pk=event.pk).can_register(self.visitor)[0])
+
+        self.client.force_login(self.visitor)
+        response = self.client.get(f"/api/events/{event.pk}/")
+        self.assertEqual(
+            (response.data["is_registered"], response.data["is_waitlisted"]),
+            (True, True),
+        )
+        self.assertFalse(response.data["can_register"])
+        response = self.client.get(reverse("events:event_details", args=[event.pk]))
+        self.assertContains(response, "On Waitlist")
+        self.assertContains(
+            response, reverse("events:cancel_registration", args=[event.pk])
+        )
+
+    def test_creator_cannot_register(self):
+        """Test that creators are never eligible to register."""
+        events = Event.objects.with_registration_state(self.creator)
+        self.assertFalse(any(event.user_can_register for event in events))
+
+    def test_can_register_reuses_annotation(self):
+        """Test that can_register runs no query on an annotated event."""
+        event = Event.objects.with_registration_state(self.visitor).get(
+            pk=self.registered_event.pk
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                event.can_register(self.visitor),
+                (False, "Already registered for this event."),
+            )
+
+
+class StatusFieldTest(TestCase):
+    """Test cases for statuses stored as small integer codes."""
+
+    def test_codes_are_stored_and_names_read(self):
+        """Test that the column holds codes while the ORM speaks names."""
+        registration = RegistrationFactory(status="waitlisted")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT status FROM events_eventregistration WHERE id = %s",
+                [registration.pk],
+            )
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+        registration.refresh_from_db()
+        self.assertEqual(registration.status, "waitlisted")
+        self.assertEqual(registration.get_status_display(), "Waitlisted")
+        self.assertEqual(
+            list(
+                Event.objects.filter(registrations__status__in=["waitlisted"])
+                .values_list("status", flat=True)
+            ),
+            ["published"],
+        )
+        with self.assertRaises(ValueError):
+            Event.objects.filter(status="unknown").exists()
+
+
+class EventScheduleTest(TestCase):
+    """Test cases for the starts_at and ends_at columns."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+
+    def test_save_keeps_schedule_in_sync(self):
+        """Test that date, start_time and duration changes reach the columns."""
+        event = EventFactory(created_by=self.creator)
+        self.assertEqual(
+            event.starts_at, local_datetime(event.date, event.start_time)
+        )
+        self.assertIsNone(event.ends_at)
+
+        event.date += timedelta(days=1)
+        event.duration = timedelta(hours=2)
+        event.save()
+        event.refresh_from_db()
+        self.assertEqual(event.starts_at.date(), event.date)
+        self.assertEqual(event.ends_at - event.starts_at, timedelta(hours=2))
+
+    def test_next_events_and_ongoing(self):
+        """Test the starts_at range helpers."""
+        now = timezone.now()
+        later = EventFactory(created_by=self.creator, date=now + timedelta(days=3))
+        sooner = EventFactory(created_by=self.creator, date=now + timedelta(days=1))
+        self.assertEqual(
+            list(Event.objects.published().starting_from()[:2]), [sooner, later]
+        )
+
+        Event.objects.filter(pk=sooner.pk).update(
+            starts_at=now - timedelta(hours=1), ends_at=now + timedelta(hours=1)
+        )
+        self.assertEqual(list(Event.objects.ongoing()), [sooner])
+        self.assertEqual(list(Event.objects.on_date(later.date)), [later])
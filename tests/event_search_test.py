@@ -0,0 +1,113 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.events.models import Event
+from apps.events.search import search_events
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+
+class EventSearchTest(TestCase):
+    """Test cases for the full-text event search."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.title_match = EventFactory(
+            created_by=self.creator, title="Python conference"
+        )
+        self.description_match = EventFactory(
+            created_by=self.creator,
+            title="Developer meetup",
+            description="Talks about Python packaging",
+        )
+        self.other = EventFactory(created_by=self.creator, title="Jazz evening")
+
+    def search(self, query):
+        return list(
+            search_events(Event.objects.all(), query).order_by("-search_rank", "id")
+        )
+
+    def test_search_ranks_title_matches_first(self):
+        """Test that a title match outranks a description match."""
+        self.assertEqual(self.search("python"), [self.title_match, self.description_match])
+
+    def test_search_uses_stemming_and_all_terms(self):
+        """Test that words are stemmed and every term must match."""
+        self.assertEqual(self.search("conferences"), [self.title_match])
+        self.assertEqual(self.search("python jazz"), [])
+
+    def test_index_follows_event_changes(self):
+        """Test that saving and deleting an event updates the index."""
+        self.other.title = "Python jazz night"
+        self.other.save()
+        self.assertIn(self.other, self.search("jazz night"))
+
+        self.other.delete()
+        self.assertEqual(self.search("jazz"), [])
+
+    def test_rebuild_picks_up_bulk_updates(self):
+        """Test that the rebuild command indexes rows changed by update()."""
+        Event.objects.filter(pk=self.other.pk).update(title="Salsa night")
+        self.assertEqual(self.search("salsa"), [])
+        call_command("rebuild_search_index", chunk_size=2, stdout=StringIO())
+        self.assertEqual(self.search("salsa"), [self.other])
+        self.assertEqual(len(self.search("python")), 2)
+
+    def test_bulk_created_events_are_indexed(self):
+        """Test that bulk_create indexes events without a rebuild."""
+        Event.objects.bulk_create(
+            [EventFactory.build(created_by=self.creator, title="Salsa night")]
+        )
+        self.assertEqual([e.title for e in self.search("salsa")], ["Salsa night"])
+
+    def test_blank_query_matches_nothing(self):
+        """Test that a query without words returns no events."""
+        self.assertEqual(self.search("  !! "), [])
+
+
+class EventSearchViewsTest(APITestCase):
+    """Test cases for searching events through the web page and the API."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        EventFactory.create_batch(3, created_by=self.creator, title="Python workshop")
+        self.best = EventFactory(
+            created_by=self.creator,
+            title="Python Python",
+            description="Python",
+            location="Python hall",
+        )
+        EventFactory(created_by=self.creator, title="Jazz evening")
+
+    def test_browse_events_search_pages_by_rank(self):
+        """Test that ranked search results page through every match once."""
+        self.client.force_login(self.visitor)
+        url = reverse("events:browse_events")
+        response = self.client.get(url, {"q": "python"})
+        self.assertEqual(response.context["events"][0], self.best)
+
+        EventFactory.create_batch(20, created_by=self.creator, title="Python class")
+        seen = []
+        params = {"q": "python"}
+        while True:
+            page = self.client.get(url, params).context["page"]
+            seen.extend(event.pk for event in page)
+            if not page.has_next:
+                break
+            params["cursor"] = page.next_cursor
+        self.assertEqual(len(seen), 24)
+        self.assertEqual(len(set(seen)), 24)
+
+    def test_api_search_orders_by_relevance(self):
+        """Test that the API search parameter returns ranked matches."""
+        self.client.force_authenticate(user=self.visitor)
+        response = self.client.get("/api/events/", {"search": "python", "page_size": 2})
+        results = response.data["results"]
+        self.assertEqual(results[0]["id"], self.best.pk)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNone(response.data["next"])
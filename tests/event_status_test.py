@@ -0,0 +1,73 @@
+from datetime import time, timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.events.cache import event_version_key
+from apps.events.models import CreatorStats, Event, local_datetime
+from apps.events.stats import rebuild_creator_stats
+from tests.factories import CreatorFactory, EventFactory, PastEventFactory
+
+
+class EffectiveStatusTest(TestCase):
+    """Test cases for the date derived status and the sweeper command."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.upcoming = EventFactory(created_by=self.creator)
+        self.completed = PastEventFactory(created_by=self.creator)
+        self.stale = EventFactory.create_batch(3, created_by=self.creator)
+        # Dates passing without a save leave the stored status behind
+        yesterday = timezone.now().date() - timedelta(days=1)
+        Event.objects.filter(pk__in=[event.pk for event in self.stale]).update(
+            date=yesterday, starts_at=local_datetime(yesterday, time(10))
+        )
+
+    def test_reads_use_the_effective_status(self):
+        """Test the annotation, the status filter and the API filter."""
+        statuses = dict(
+            Event.objects.with_effective_status().values_list("pk", "effective_status")
+        )
+        self.assertEqual(statuses[self.upcoming.pk], "published")
+        self.assertEqual(statuses[self.stale[0].pk], "completed")
+        self.assertEqual(list(Event.objects.published()), [self.upcoming])
+        self.assertEqual(Event.objects.with_status("completed").count(), 4)
+
+        client = APIClient()
+        client.force_authenticate(self.creator)
+        response = client.get("/api/events/", {"status": "published"})
+        self.assertEqual([e["id"] for e in response.data["results"]], [self.upcoming.pk])
+
+    def test_responses_carry_the_effective_status(self):
+        """Test that list and detail bodies report unswept events as completed."""
+        client = APIClient()
+        client.force_authenticate(self.creator)
+        response = client.get("/api/events/", {"status": "completed"})
+        statuses = {e["id"]: e["status"] for e in response.data["results"]}
+        self.assertEqual(statuses[self.stale[0].pk], "completed")
+        self.assertEqual(set(statuses.values()), {"completed"})
+
+        response = client.get(f"/api/events/{self.stale[0].pk}/")
+        self.assertEqual(response.data["status"], "completed")
+        response = client.get("/api/events/my_events/")
+        statuses = {e["id"]: e["status"] for e in response.data["results"]}
+        self.assertEqual(statuses[self.upcoming.pk], "published")
+        self.assertEqual(statuses[self.stale[1].pk], "completed")
+
+    def test_sweeper_completes_in_chunks(self):
+        """Test that the command updates rows, rollups and cache versions."""
+        version = cache.get(event_version_key(self.stale[0].pk))
+        out = StringIO()
+        call_command("complete_past_events", batch_size=2, stdout=out)
+
+        self.assertIn("Completed 2 events", out.getvalue())
+        self.assertIn("Completed 3 past events.", out.getvalue())
+        self.assertEqual(Event.objects.filter(status="completed").count(), 4)
+        self.assertNotEqual(cache.get(event_version_key(self.stale[0].pk)), version)
+        stats = CreatorStats.objects.get(pk=self.creator.pk)
+        self.assertEqual((stats.active_events, stats.completed_events), (1, 4))
+        rebuild_creator_stats()
+        stats.refresh_from_db()
+        self.assertEqual((stats.active_events, stats.completed_events), (1, 4))
@@ -1,4 +1,7 @@
+import gzip
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from tests.base import BaseTestCase
@@ -78,3 +81,70 @@ class EventViewTest(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         registration.refresh_from_db()
         self.assertEqual(registration.status, "cancelled")
+
+
+class ExportRegistrationsCsvTest(BaseTestCase):
+    """Test cases for the streaming CSV export of registrations."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.force_login(self.creator)
+        self.event = EventFactory(created_by=self.creator)
+        self.active = RegistrationFactory(event=self.event)
+        self.cancelled = RegistrationFactory(event=self.event)
+        self.cancelled.cancel_registration()
+        self.url = reverse("events:export_csv", args=[self.event.pk])
+
+    def test_export_streams_all_registrations(self):
+        """Test that export streams a header and every registration by default."""
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(rows[0], "Username,Email,Registered at")
+        self.assertEqual(len(rows), 3)
+
+    def test_export_registered_only(self):
+        """Test that the status filter limits export to active registrations."""
+        response = self.client.get(self.url, {"status": "registered"})
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(rows[1].startswith(self.active.user.username))
+
+    def test_export_gzip(self):
+        """Test that gzip export produces a valid compressed CSV file."""
+        response = self.client.get(self.url, {"gzip": "1"})
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn(".csv.gz", response["Content-Disposition"])
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(len(content.splitlines()), 3)
+
+
+class BrowseEventsPaginationTest(BaseTestCase):
+    """Test cases for keyset pagination of the browse events page."""
+
+    def test_browse_events_pages(self):
+        """Test that browse events shows one page and links to the next."""
+        self.client.force_login(self.visitor)
+        EventFactory.create_batch(25)
+        response = self.client.get(reverse("events:browse_events"))
+        self.assertEqual(len(response.context["events_with_flags"]), 20)
+        page = response.context["page"]
+        self.assertTrue(page.has_next)
+
+        response = self.client.get(
+            reverse("events:browse_events"), {"cursor": page.next_cursor}
+        )
+        self.assertEqual(len(response.context["events_with_flags"]), 5)
+        self.assertContains(response, "Previous")
+
+    def test_browse_events_query_count_is_constant(self):
+        """Test that browse events does not issue a query per event."""
+        self.client.force_login(self.visitor)
+        EventFactory.create_batch(2)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse("events:browse_events"))
+        EventFactory.create_batch(10)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(reverse("events:browse_events"))
+        self.assertEqual(len(small), len(large))
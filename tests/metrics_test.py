@@ -0,0 +1,72 @@
+from django.test import modify_settings, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from event_manager.metrics import registry
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+STREAM_ACCEPT = "application/json; stream=true"
+
+
+@modify_settings(MIDDLEWARE={"prepend": "event_manager.metrics.MetricsMiddleware"})
+class MetricsMiddlewareTest(APITestCase):
+    """Test cases for per-view request metrics."""
+
+    def setUp(self):
+        registry.reset()
+        self.visitor = VisitorFactory()
+        EventFactory.create_batch(3, created_by=CreatorFactory())
+
+    def test_records_api_view(self):
+        """Test that requests, queries and bytes are recorded per URL name."""
+        self.client.force_authenticate(user=self.visitor)
+        first = self.client.get("/api/events/")
+        second = self.client.get("/api/events/")
+
+        totals = registry.snapshot()["event_details-list"]
+        self.assertEqual(totals["requests"], 2)
+        self.assertGreater(totals["queries"], 0)
+        self.assertEqual(
+            totals["response_bytes"], len(first.content) + len(second.content)
+        )
+        self.assertEqual(sum(totals["latency_buckets"]), 2)
+
+    def test_records_template_time(self):
+        """Test that template rendering time is recorded for HTML views."""
+        self.client.force_login(self.visitor)
+        self.client.get(reverse("events:browse_events"))
+        self.assertGreater(
+            registry.snapshot()["events:browse_events"]["template_seconds"], 0
+        )
+
+    def test_streamed_response_is_recorded_when_sent(self):
+        """Test that streamed bodies are measured once fully consumed."""
+        self.client.force_authenticate(user=self.visitor)
+        response = self.client.get("/api/events/upcoming/", HTTP_ACCEPT=STREAM_ACCEPT)
+        self.assertNotIn("event_details-upcoming", registry.snapshot())
+
+        content = b"".join(response.streaming_content)
+        totals = registry.snapshot()["event_details-upcoming"]
+        self.assertEqual(totals["response_bytes"], len(content))
+        self.assertGreater(totals["queries"], 0)
+
+    async def test_records_under_asgi(self):
+        """Test that the async middleware path counts queries of sync views."""
+        await self.async_client.aforce_login(self.visitor)
+        await self.async_client.get("/api/events/")
+        self.assertGreater(registry.snapshot()["event_details-list"]["queries"], 0)
+
+    def test_metrics_endpoint(self):
+        """Test the Prometheus exposition and its optional bearer token."""
+        self.client.force_authenticate(user=self.visitor)
+        self.client.get("/api/events/")
+        text = self.client.get("/metrics").content.decode()
+        self.assertIn('django_view_requests_total{view="event_details-list"} 1', text)
+        self.assertIn(
+            'django_view_latency_seconds_bucket{view="event_details-list",le="+Inf"} 1',
+            text,
+        )
+
+        with override_settings(METRICS_TOKEN="secret"):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+            response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+            self.assertEqual(response.status_code, 200)
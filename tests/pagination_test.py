@@ -0,0 +1,111 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.models import Event, EventRegistration
+from apps.events.pagination import InvalidCursor, paginate_keyset
+from tests.factories import (
+    CreatorFactory,
+    EventFactory,
+    RegistrationFactory,
+    VisitorFactory,
+)
+
+
+class KeysetPaginationTest(TestCase):
+    """Test cases for keyset pagination of querysets."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        today = timezone.now().date()
+        # Several events share a date and start time to exercise tiebreaks
+        for day in range(5):
+            EventFactory.create_batch(
+                5,
+                created_by=self.creator,
+                date=today + timedelta(days=day + 1),
+                start_time="10:00",
+            )
+
+    def collect_forward(self, queryset, page_size):
+        """Walk every page forwards and return the pages."""
+        pages = [paginate_keyset(queryset, page_size=page_size)]
+        while pages[-1].has_next:
+            pages.append(
+                paginate_keyset(queryset, pages[-1].next_cursor, page_size=page_size)
+            )
+        return pages
+
+    def test_forward_pages_cover_ordering_exactly_once(self):
+        """Test that walking forwards returns every row once in model order."""
+        pages = self.collect_forward(Event.objects.all(), page_size=7)
+        ids = [event.id for page in pages for event in page]
+        expected = list(
+            Event.objects.order_by("date", "start_time", "id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(pages), 4)
+
+    def test_previous_cursor_returns_previous_page(self):
+        """Test that the previous cursor of a page points at the page before."""
+        pages = self.collect_forward(Event.objects.all(), page_size=7)
+        previous = paginate_keyset(
+            Event.objects.all(), pages[2].previous_cursor, page_size=7
+        )
+        self.assertEqual(previous.items, pages[1].items)
+        self.assertTrue(previous.has_next)
+
+    def test_concurrent_insert_does_not_shift_pages(self):
+        """Test that rows inserted before the cursor do not duplicate results."""
+        first = paginate_keyset(Event.objects.all(), page_size=10)
+        EventFactory(created_by=self.creator, date=timezone.now().date())
+        second = paginate_keyset(Event.objects.all(), first.next_cursor, page_size=10)
+        self.assertFalse(set(first.items) & set(second.items))
+
+    def test_descending_registration_ordering(self):
+        """Test pagination over the (-registered_at, id) registration ordering."""
+        event = Event.objects.first()
+        RegistrationFactory.create_batch(5, event=event)
+        pages = self.collect_forward(EventRegistration.objects.all(), page_size=2)
+        ids = [registration.id for page in pages for registration in page]
+        expected = list(
+            EventRegistration.objects.order_by("-registered_at", "id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+
+    def test_tampered_cursor_is_rejected(self):
+        """Test that a modified cursor raises InvalidCursor."""
+        page = paginate_keyset(Event.objects.all(), page_size=5)
+        with self.assertRaises(InvalidCursor):
+            paginate_keyset(Event.objects.all(), page.next_cursor[:-2] + "xx")
+
+
+class KeysetPaginationAPITest(APITestCase):
+    """Test cases for keyset pagination in API list endpoints."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        EventFactory.create_batch(25, created_by=self.creator)
+        self.client.force_authenticate(user=self.visitor)
+
+    def test_list_is_paginated(self):
+        """Test that the event list returns results with a next link."""
+        response = self.client.get("/api/events/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_cursor_returns_404(self):
+        """Test that an invalid cursor is answered with 404."""
+        response = self.client.get("/api/events/", {"cursor": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
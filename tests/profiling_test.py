@@ -0,0 +1,137 @@
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import sleep
+from unittest import mock
+from django.db import connection
+from django.test import TestCase, modify_settings, override_settings
+from django.urls import reverse
+from event_manager import profiling
+from event_manager.profiling import RequestProfile
+from tests.factories import (
+    CreatorFactory,
+    EventFactory,
+    RegistrationFactory,
+    VisitorFactory,
+)
+
+
+@modify_settings(MIDDLEWARE={"prepend": "event_manager.profiling.ProfilingMiddleware"})
+class ProfilingMiddlewareTest(TestCase):
+    """Test cases for header triggered and sampled request profiling."""
+
+    def setUp(self):
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(
+            override_settings(PROFILING_TOKEN="secret", PROFILING_DIR=self.directory)
+        )
+        self.visitor = VisitorFactory()
+        EventFactory.create_batch(3, created_by=CreatorFactory())
+        self.client.force_login(self.visitor)
+
+    def reports(self):
+        """Return the text reports written so far."""
+        return sorted(self.directory.glob("*.txt"))
+
+    def test_header_profiles_request(self):
+        """Test that the token header writes a report and a Server-Timing header."""
+        response = self.client.get(
+            reverse("events:browse_events"),
+            headers={"X-Profile": "secret", "X-Profile-Memory": "1"},
+        )
+        self.assertRegex(response["Server-Timing"], r"^app;dur=[\d.]+, db;dur=")
+        [report] = self.reports()
+        self.assertTrue(report.with_suffix(".prof").exists())
+        text = report.read_text()
+        self.assertIn("GET /browse_events/ (events:browse_events)", text)
+        self.assertIn("functions by cumulative time", text)
+        self.assertIn("allocation sites by growth", text)
+        self.assertIn('SELECT "events_event"."id"', text)
+
+    def test_untriggered_requests_are_not_profiled(self):
+        """Test that requests without the right header are left alone."""
+        for headers in ({}, {"X-Profile": "wrong"}):
+            response = self.client.get(reverse("events:browse_events"), headers=headers)
+            self.assertNotIn("Server-Timing", response)
+        self.assertEqual(self.reports(), [])
+
+    def test_streamed_response_profiled_until_sent(self):
+        """Test that queries run while streaming are in the report."""
+        creator = CreatorFactory()
+        event = EventFactory(created_by=creator)
+        RegistrationFactory(event=event)
+        self.client.force_login(creator)
+        response = self.client.get(
+            reverse("events:export_csv", args=[event.pk]),
+            headers={"X-Profile": "secret"},
+        )
+        self.assertEqual(self.reports(), [])
+        b"".join(response.streaming_content)
+        [report] = self.reports()
+        self.assertIn('FROM "events_eventregistration"', report.read_text())
+
+    def test_busy_profiler_serves_requests_unprofiled(self):
+        """Test that a request arriving while another is profiled is not."""
+        with profiling._profiling:
+            response = self.client.get(
+                reverse("events:browse_events"), headers={"X-Profile": "secret"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(self.reports(), [])
+
+    def test_failing_enable_leaves_nothing_attached(self):
+        """Test that another active profiler neither fails the request nor
+        leaves the query timing wrappers behind."""
+        with mock.patch.object(profiling.cProfile, "Profile") as profile:
+            profile.return_value.enable.side_effect = ValueError("busy")
+            response = self.client.get(
+                reverse("events:browse_events"), headers={"X-Profile": "secret"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+        self.assertFalse(
+            any(isinstance(w, RequestProfile) for w in connection.execute_wrappers)
+        )
+        self.assertFalse(profiling._profiling.locked())
+
+    def test_sampling_and_rotation(self):
+        """Test that sampled requests are profiled and old reports rotated."""
+        with override_settings(
+            PROFILING_TOKEN=None, PROFILING_SAMPLE_RATE=1.0, PROFILING_KEEP=2
+        ):
+            for _ in range(3):
+                self.client.get(reverse("events:browse_events"))
+        self.assertEqual(len(self.reports()), 2)
+        self.assertEqual(len(list(self.directory.glob("*.prof"))), 2)
+
+
+class RequestProfileTest(TestCase):
+    """Test cases for the time accounting of RequestProfile."""
+
+    def test_repeated_pause_counts_time_once(self):
+        """Test that stop() after pause() does not add the time again."""
+        profile = RequestProfile(memory=False)
+        profile.start()
+        sleep(0.05)
+        profile.pause()
+        sleep(0.1)
+        profile.stop()
+
+        self.assertGreaterEqual(profile.seconds, 0.05)
+        self.assertLess(profile.seconds, 0.1)
+        report = profile.report("GET /")
+        self.assertIn(f"Profiled {profile.seconds * 1000:.1f} ms", report)
+
+    def test_tracing_outlives_the_first_profile_stopped(self):
+        """Test that tracemalloc stays on while another profile still uses it."""
+        first, second = RequestProfile(memory=True), RequestProfile(memory=True)
+        first.start()
+        first.pause()
+        second.start()
+        second.pause()
+        first.stop()
+        self.assertTrue(tracemalloc.is_tracing())
+        second.stop()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNotNone(second.memory_after)
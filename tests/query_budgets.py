@@ -0,0 +1,58 @@
+"""
+Query budgets of every view and API action, checked by tests/query_count_test.py.
+
+Each budget is the most queries one request may run with cold caches, keyed
+by method and URL name. The count must also stay the same at 1x and 50x
+data. When a change legitimately adds a query, raise the budget here in the
+same commit; a count that grows with the data is an N+1 and needs fixing.
+"""
+
+QUERY_BUDGETS = {
+    # apps.events.urls
+    "GET events:new_event": 2,
+    "GET events:my_events": 3,
+    "GET events:event_details": 6,
+    "GET events:edit_event": 4,
+    "GET events:export_csv": 5,
+    "GET events:cancel_event": 4,
+    "POST events:cancel_event": 14,
+    "GET events:browse_events": 3,
+    "GET events:register_for_event": 4,
+    "POST events:register_for_event": 11,
+    "GET events:my_registrations": 3,
+    "GET events:cancel_registration": 4,
+    "POST events:cancel_registration": 13,
+    # apps.events.urls_api and apps.users.urls_api
+    "GET api-root": 2,
+    "GET event_details-list": 6,
+    "GET event_details-detail": 7,
+    "DELETE event_details-detail": 20,
+    "GET event_details-my-events": 3,
+    "GET event_details-upcoming": 6,
+    "POST event_details-cancel": 14,
+    "GET event_details-registrations": 5,
+    "GET event_details-analytics": 5,
+    "GET event_details-stats": 4,
+    "GET registrations-list": 4,
+    "POST registrations-list": 9,
+    "GET registrations-detail": 3,
+    "DELETE registrations-detail": 12,
+    "GET registrations-upcoming": 4,
+    "GET users-list": 3,
+    "GET users-detail": 3,
+    "GET users-profile": 2,
+    "GET users-my-registrations": 3,
+    "POST users-register": 2,
+    "POST users-login": 1,
+    # apps.users.urls
+    "GET users:login": 0,
+    "GET users:signup": 0,
+    "POST users:logout": 5,
+    "GET users:password_change": 2,
+    "GET users:password_change_done": 2,
+    "GET users:password_reset": 0,
+    "GET users:password_reset_done": 0,
+    "GET users:password_reset_confirm": 1,
+    "GET users:password_reset_complete": 0,
+    "GET users:activate": 1,
+}
@@ -0,0 +1,287 @@
+from dataclasses import dataclass
+from io import StringIO
+from typing import Callable, Dict, List, Optional, Tuple
+from django.contrib.auth.hashers import make_password
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from apps.events.models import Event, EventRegistration
+from apps.events.stats import rebuild_creator_stats
+from apps.users.models import CustomUser
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+from tests.query_budgets import QUERY_BUDGETS
+
+# Every URL defined in these modules needs at least one budgeted request
+WALKED_URLCONFS = (
+    "apps.events.urls",
+    "apps.events.urls_api",
+    "apps.users.urls",
+    "apps.users.urls_api",
+)
+# Rows per collection at 1x; data is measured at 1x and SCALE x
+BASE_ROWS = 2
+SCALE = 50
+PASSWORD = "Budget-password-1"
+
+
+@dataclass
+class Dataset:
+    """Rows the requests work with, plus row collections sized to a scale."""
+
+    creator: CustomUser
+    visitor: CustomUser
+    event: Event
+    open_event: Event
+    registration: EventRegistration
+
+
+@dataclass
+class Request:
+    """One request made against every dataset."""
+
+    role: str
+    kwargs: Callable[[Dataset], Dict] = lambda data: {}
+    data: Callable[[Dataset], Dict] = lambda data: {}
+
+
+# Requests keyed like QUERY_BUDGETS, by method and URL name
+REQUESTS: Dict[str, Request] = {
+    # apps.events.urls
+    "GET events:new_event": Request("creator"),
+    "GET events:my_events": Request("creator"),
+    "GET events:event_details": Request(
+        "visitor", lambda data: {"event_id": data.event.pk}
+    ),
+    "GET events:edit_event": Request(
+        "creator", lambda data: {"event_id": data.event.pk}
+    ),
+    "GET events:export_csv": Request(
+        "creator", lambda data: {"event_id": data.event.pk}
+    ),
+    "GET events:cancel_event": Request(
+        "creator", lambda data: {"event_id": data.event.pk}
+    ),
+    "POST events:cancel_event": Request(
+        "creator", lambda data: {"event_id": data.event.pk}
+    ),
+    "GET events:browse_events": Request("visitor"),
+    "GET events:register_for_event": Request(
+        "visitor", lambda data: {"event_id": data.open_event.pk}
+    ),
+    "POST events:register_for_event": Request(
+        "visitor", lambda data: {"event_id": data.open_event.pk}
+    ),
+    "GET events:my_registrations": Request("visitor"),
+    "GET events:cancel_registration": Request(
+        "visitor", lambda data: {"event_id": data.event.pk}
+    ),
+    "POST events:cancel_registration": Request(
+        "visitor", lambda data: {"event_id": data.event.pk}
+    ),
+    # apps.events.urls_api and apps.users.urls_api
+    "GET api-root": Request("visitor"),
+    "GET event_details-list": Request("visitor"),
+    "GET event_details-detail": Request("visitor", lambda data: {"pk": data.event.pk}),
+    "DELETE event_details-detail": Request(
+        "creator", lambda data: {"pk": data.event.pk}
+    ),
+    "GET event_details-my-events": Request("creator"),
+    "GET event_details-upcoming": Request("visitor"),
+    "POST event_details-cancel": Request("creator", lambda data: {"pk": data.event.pk}),
+    "GET event_details-registrations": Request(
+        "creator", lambda data: {"pk": data.event.pk}
+    ),
+    "GET event_details-analytics": Request(
+        "creator", lambda data: {"pk": data.event.pk}
+    ),
+    "GET event_details-stats": Request("creator"),
+    "GET registrations-list": Request("visitor"),
+    "POST registrations-list": Request(
+        "visitor", data=lambda data: {"event": data.open_event.pk}
+    ),
+    "GET registrations-detail": Request(
+        "visitor", lambda data: {"pk": data.registration.pk}
+    ),
+    "DELETE registrations-detail": Request(
+        "visitor", lambda data: {"pk": data.registration.pk}
+    ),
+    "GET registrations-upcoming": Request("visitor"),
+    "GET users-list": Request("visitor"),
+    "GET users-detail": Request("visitor", lambda data: {"pk": data.visitor.pk}),
+    "GET users-profile": Request("visitor"),
+    "GET users-my-registrations": Request("visitor"),
+    "POST users-register": Request(
+        "anonymous",
+        data=lambda data: {
+            "username": "budget",
+            "email": "budget@example.com",
+            "password": PASSWORD,
+            "password_confirm": PASSWORD,
+            "role": "visitor",
+        },
+    ),
+    "POST users-login": Request(
+        "anonymous",
+        # USERNAME_FIELD is the email address
+        data=lambda data: {"username": data.visitor.email, "password": PASSWORD},
+    ),
+    # apps.users.urls
+    "GET users:login": Request("anonymous"),
+    "GET users:signup": Request("anonymous"),
+    "POST users:logout": Request("visitor"),
+    "GET users:password_change": Request("visitor"),
+    "GET users:password_change_done": Request("visitor"),
+    "GET users:password_reset": Request("anonymous"),
+    "GET users:password_reset_done": Request("anonymous"),
+    "GET users:password_reset_confirm": Request(
+        "anonymous",
+        lambda data: {
+            "uidb64": urlsafe_base64_encode(force_bytes(data.visitor.pk)),
+            "token": "set-password",
+        },
+    ),
+    "GET users:password_reset_complete": Request("anonymous"),
+    "GET users:activate": Request(
+        "anonymous",
+        lambda data: {
+            "uidb64": urlsafe_base64_encode(force_bytes(data.visitor.pk)),
+            "token": "invalid-token",
+        },
+    ),
+}
+
+
+def walk_url_names(
+    patterns, namespace: str = "", walked: bool = False
+) -> List[str]:
+    """
+    Collect the names of the URLs defined in WALKED_URLCONFS.
+    Args:
+        patterns: URL patterns to walk.
+        namespace: Namespace prefix of the patterns, with trailing ':'.
+        walked: Whether the patterns come from a walked URLconf.
+    Returns:
+        List[str]: Namespaced URL names, without duplicates.
+    """
+    names: List[str] = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            module = getattr(pattern.urlconf_module, "__name__", "")
+            names += walk_url_names(
+                pattern.url_patterns,
+                f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace,
+                walked or module in WALKED_URLCONFS,
+            )
+        elif isinstance(pattern, URLPattern) and walked and pattern.name:
+            names.append(namespace + pattern.name)
+    return list(dict.fromkeys(names))
+
+
+def build_dataset(rows: int) -> Dataset:
+    """
+    Create users, events and registrations with collections of rows rows.
+    The creator owns rows events and the visitor is registered for all of
+    them; the first event also has rows registrations of other visitors.
+    Args:
+        rows: Rows per collection.
+    Returns:
+        Dataset: The acting users and the events requests target.
+    """
+    creator = CreatorFactory.create()
+    visitor = VisitorFactory.create(password=make_password(PASSWORD))
+    others = VisitorFactory.create_batch(rows)
+    events = EventFactory.create_batch(rows, created_by=creator)
+    open_event = EventFactory.create(created_by=creator)
+
+    EventRegistration.objects.bulk_create(
+        [EventRegistration(user=visitor, event=event) for event in events]
+        + [EventRegistration(user=other, event=events[0]) for other in others]
+    )
+    call_command("reconcile_registration_counts", stdout=StringIO())
+    rebuild_creator_stats()
+
+    return Dataset(
+        creator=creator,
+        visitor=visitor,
+        event=events[0],
+        open_event=open_event,
+        registration=EventRegistration.objects.get(user=visitor, event=events[0]),
+    )
+
+
+class QueryBudgetTest(TestCase):
+    """
+    Guard every view and API action against N+1 queries.
+    Each request runs against 1x and 50x data. Its query count must not grow
+    with the data and must stay within its budget in tests/query_budgets.py.
+    """
+
+    def count_queries(self, key: str, data: Dataset) -> Tuple[int, Optional[int]]:
+        """
+        Make one request in a rolled back transaction and count its queries.
+        Args:
+            key: Method and URL name of the request.
+            data: Dataset to request against.
+        Returns:
+            Tuple[int, Optional[int]]: Query count and response status code.
+        """
+        method, name = key.split(" ")
+        request = REQUESTS[key]
+        user = {"creator": data.creator, "visitor": data.visitor}.get(request.role)
+        # Measure cold caches, the worst case of every request
+        cache.clear()
+        Site.objects.clear_cache()
+        self.client.logout()
+        if user is not None:
+            self.client.force_login(user)
+
+        url = reverse(name, kwargs=request.kwargs(data))
+        extra = {}
+        if method != "GET" and ":" not in name:
+            # API writes send JSON, web forms are form encoded
+            extra["content_type"] = "application/json"
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                call = getattr(self.client, method.lower())
+                response = call(url, request.data(data), **extra)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+            transaction.set_rollback(True)
+        return len(queries), response.status_code
+
+    def test_every_url_is_budgeted(self):
+        """Test that every URL has a request and every request a budget."""
+        names = walk_url_names(get_resolver().url_patterns)
+        requested = {key.split(" ")[1] for key in REQUESTS}
+        self.assertEqual(sorted(set(names) - requested), [], "URLs without requests")
+        self.assertEqual(sorted(requested - set(names)), [], "requests without URLs")
+        self.assertEqual(sorted(REQUESTS), sorted(QUERY_BUDGETS))
+
+    def test_query_counts_are_flat_and_within_budget(self):
+        """Test that no request runs more queries on more data or over budget."""
+        counts: Dict[int, Dict[str, Tuple[int, Optional[int]]]] = {}
+        for rows in (BASE_ROWS, BASE_ROWS * SCALE):
+            with transaction.atomic():
+                data = build_dataset(rows)
+                counts[rows] = {
+                    key: self.count_queries(key, data) for key in QUERY_BUDGETS
+                }
+                transaction.set_rollback(True)
+
+        failures = []
+        for key, budget in QUERY_BUDGETS.items():
+            small, status = counts[BASE_ROWS][key]
+            large, _ = counts[BASE_ROWS * SCALE][key]
+            if status >= 400:
+                failures.append(f"{key}: status {status}")
+            if large != small:
+                failures.append(f"{key}: {small} queries at 1x, {large} at {SCALE}x")
+            if large > budget:
+                failures.append(f"{key}: {large} queries, budget {budget}")
+        self.assertEqual(failures, [])
@@ -0,0 +1,112 @@
+from unittest import mock
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.models import EventRegistration
+from apps.events.services import (
+    ALREADY_REGISTERED,
+    NOT_ELIGIBLE,
+    REACTIVATED,
+    REGISTERED,
+    register_user,
+)
+from tests.factories import (
+    CreatorFactory,
+    EventFactory,
+    PastEventFactory,
+    VisitorFactory,
+)
+
+
+class RegisterUserServiceTest(TestCase):
+    """Test cases for the registration upsert service."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.visitor = VisitorFactory()
+        self.event = EventFactory(created_by=self.creator)
+
+    def test_new_registration(self):
+        """Test that a new registration is created and counted."""
+        result = register_user(self.visitor, self.event)
+        self.assertEqual(result.outcome, REGISTERED)
+        self.assertTrue(result.success)
+        self.assertEqual(result.registration.status, "registered")
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 1)
+
+    def test_success_path_query_count(self):
+        """Test that a successful registration is the counter update, the upsert
+        and the event and creator stats rollup updates."""
+        with CaptureQueriesContext(connection) as context:
+            register_user(self.visitor, self.event)
+        statements = [
+            query["sql"]
+            for query in context.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+        self.assertEqual(len(statements), 4)
+
+    def test_already_registered(self):
+        """Test that registering twice is reported without a second row."""
+        register_user(self.visitor, self.event)
+        result = register_user(self.visitor, self.event)
+        self.assertEqual(result.outcome, ALREADY_REGISTERED)
+        self.assertEqual(EventRegistration.objects.count(), 1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 1)
+
+    def test_reactivate_cancelled_registration(self):
+        """Test that a cancelled registration is re-activated in place."""
+        registration = register_user(self.visitor, self.event).registration
+        registration.cancel_registration()
+        result = register_user(self.visitor, self.event)
+        self.assertEqual(result.outcome, REACTIVATED)
+        self.assertEqual(result.registration.pk, registration.pk)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 1)
+
+    def test_fallback_without_returning(self):
+        """Test the ORM path taken by SQLite versions without RETURNING."""
+        with mock.patch.object(
+            connection.features, "can_return_columns_from_insert", False
+        ):
+            result = register_user(self.visitor, self.event)
+            self.assertEqual(result.outcome, REGISTERED)
+            result = register_user(self.visitor, self.event)
+            self.assertEqual(result.outcome, ALREADY_REGISTERED)
+        self.assertEqual(EventRegistration.objects.count(), 1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registration_count, 1)
+
+    def test_not_eligible(self):
+        """Test that creators and closed events are rejected with a reason."""
+        result = register_user(self.creator, self.event)
+        self.assertEqual(result.outcome, NOT_ELIGIBLE)
+
+        past_event = PastEventFactory(created_by=self.creator)
+        result = register_user(self.visitor, past_event)
+        self.assertEqual(result.outcome, NOT_ELIGIBLE)
+        self.assertEqual(result.message, "Cannot register for past events.")
+        self.assertFalse(EventRegistration.objects.exists())
+
+
+class RegistrationCreateAPITest(APITestCase):
+    """Test cases for registration through the API."""
+
+    def setUp(self):
+        self.visitor = VisitorFactory()
+        self.event = EventFactory()
+        self.client.force_authenticate(user=self.visitor)
+
+    def test_register_and_duplicate(self):
+        """Test that the API registers once and rejects duplicates."""
+        response = self.client.post("/api/registrations/", {"event": self.event.pk})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "registered")
+        self.assertEqual(response.data["event_title"], self.event.title)
+
+        response = self.client.post("/api/registrations/", {"event": self.event.pk})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,67 @@
+import json
+from datetime import date, datetime, time, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from apps.events import renderers
+from apps.events.renderers import FastJSONRenderer
+from tests.factories import CreatorFactory, EventFactory, RegistrationFactory
+
+STREAM_ACCEPT = "application/json; stream=true"
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    """Test cases for the orjson backed renderer."""
+
+    def test_output_matches_json_renderer(self):
+        """Test that native types encode exactly like DRF's JSONRenderer."""
+        data = {
+            "created_at": datetime(2026, 5, 1, 9, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            "date": date(2026, 5, 1),
+            "start_time": time(18, 45, 0, 500000),
+            "price": Decimal("12.50"),
+            "title": "Café   night",
+            "items": [1, 2.5, None, True],
+        }
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+
+class StreamingJSONRendererTest(APITestCase):
+    """Test cases for streamed JSON list responses."""
+
+    def setUp(self):
+        self.creator = CreatorFactory()
+        self.event = EventFactory(created_by=self.creator)
+        EventFactory.create_batch(4, created_by=self.creator)
+        RegistrationFactory.create_batch(3, event=self.event)
+        self.client.force_authenticate(user=self.creator)
+
+    def test_stream_matches_paginated_results(self):
+        """Test that a streamed list holds exactly the paginated results."""
+        paginated = self.client.get("/api/events/upcoming/")
+        self.assertNotIn("stream", paginated["Content-Type"])
+
+        with mock.patch.object(renderers, "STREAM_BATCH_SIZE", 2):
+            response = self.client.get("/api/events/upcoming/", HTTP_ACCEPT=STREAM_ACCEPT)
+            self.assertTrue(response.streaming)
+            content = b"".join(response.streaming_content)
+        self.assertEqual(response["Content-Type"], STREAM_ACCEPT)
+        self.assertEqual(json.loads(content), paginated.json()["results"])
+
+    def test_stream_registrations_with_format_suffix(self):
+        """Test that event registrations stream with ?format=json-stream."""
+        response = self.client.get(
+            f"/api/events/{self.event.pk}/registrations/", {"format": "json-stream"}
+        )
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row["event"] for row in rows}, {self.event.pk})
+
+    def test_empty_stream_is_an_empty_array(self):
+        """Test that streaming an empty list yields a valid JSON array."""
+        response = self.client.get("/api/registrations/", HTTP_ACCEPT=STREAM_ACCEPT)
+        self.assertEqual(b"".join(response.streaming_content), b"[]")
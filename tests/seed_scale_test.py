@@ -0,0 +1,55 @@
+import random
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+from apps.events.models import Event, EventRegistration
+from apps.events.seeding import popularity
+
+
+class PopularityTest(SimpleTestCase):
+    """Test cases for the power-law split of registrations."""
+
+    def test_split_is_deterministic_and_skewed(self):
+        """Test that a seed fixes the split and few events get most registrations."""
+        counts = popularity(100, 10000, 10000, 1.1, random.Random(1))
+        self.assertEqual(counts, popularity(100, 10000, 10000, 1.1, random.Random(1)))
+        self.assertEqual(sum(counts), 10000)
+        self.assertGreater(sum(sorted(counts, reverse=True)[:10]), 5000)
+
+    def test_split_respects_limit(self):
+        """Test that no event gets more registrations than the limit."""
+        counts = popularity(10, 1000, 50, 2.0, random.Random(0))
+        self.assertEqual(max(counts), 50)
+        self.assertEqual(sum(counts), 500)
+
+
+class SeedScaleCommandTest(TestCase):
+    """Test cases for the seed_scale management command."""
+
+    def seed(self, **options):
+        """Run the command with a small dataset."""
+        defaults = {"creators": 3, "visitors": 40, "events": 20, "registrations": 300}
+        call_command("seed_scale", stdout=StringIO(), **{**defaults, **options})
+
+    def test_seeds_consistent_counters(self):
+        """Test that rows are written and denormalized counters match them."""
+        self.seed(batch_size=50)
+        self.assertEqual(Event.objects.count(), 20)
+        self.assertEqual(EventRegistration.objects.count(), 300)
+        for event in Event.objects.all():
+            self.assertEqual(
+                event.registration_count,
+                event.registrations.filter(status="registered").count(),
+            )
+            self.assertEqual(
+                event.stats.cancelled_registrations,
+                event.registrations.filter(status="cancelled").count(),
+            )
+
+    def test_existing_prefix_is_rejected(self):
+        """Test that seeding twice with one prefix fails without writing."""
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
+        self.assertEqual(Event.objects.count(), 20)
@@ -0,0 +1,62 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from apps.events.models import Event
+from apps.events.serializers import (
+    EventListSerializer,
+    EventSerializer,
+    values_serializer,
+)
+from tests.factories import CreatorFactory, EventFactory, VisitorFactory
+
+
+class ValuesSerializerTest(APITestCase):
+    """Test cases for serializing event lists from .values() rows."""
+
+    def setUp(self):
+        self.visitor = VisitorFactory()
+        EventFactory(created_by=CreatorFactory(), capacity=25)
+        EventFactory.create_batch(3)
+
+    def assert_same_output(self, serializer_class):
+        queryset = (
+            Event.objects.with_effective_status()
+            .with_registration_state(self.visitor)
+            .order_by("id")
+        )
+        fast = values_serializer(serializer_class)
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(fast.to_representation(queryset.values(*fast.lookups))),
+            renderer.render(serializer_class(queryset, many=True).data),
+        )
+
+    def test_list_serializer_output_is_identical(self):
+        """Test that values rows render exactly like EventListSerializer."""
+        self.assert_same_output(EventListSerializer)
+
+    def test_detail_serializer_output_is_identical(self):
+        """Test that values rows render exactly like EventSerializer."""
+        self.assert_same_output(EventSerializer)
+
+    def test_list_query_count_is_constant(self):
+        """Test that listing events does not load creators per row."""
+        self.client.force_authenticate(user=self.visitor)
+        urls = ("/api/events/", "/api/events/upcoming/")
+        small = {}
+        for url in urls:
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            small[url] = (len(response.data["results"]), len(queries))
+        EventFactory.create_batch(10)
+        for url in urls:
+            with self.subTest(url=url):
+                cache.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+                rows, query_count = small[url]
+                self.assertEqual(len(response.data["results"]), rows + 10)
+                self.assertEqual(len(queries), query_count)